@@ -0,0 +1,324 @@
+'''
+Benchmark suite for the readability metrics.
+
+Measures the cold `import whetstone` time and times every `calculate_*` function in `readability_metrics`, plus
+`count_syllables` and `tokenize_sentence`, over synthetic corpora of increasing size and document length, and
+records the results as JSON so that runs can be compared across versions. Before timing, every engine's scores are checked against the reference implementations
+in `reference_readability.py` so that performance work cannot silently change results.
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 100 1000 --doc-lengths 20 200 --output results.json
+    python benchmarks/run_benchmarks.py --compare results.json
+    python benchmarks/run_benchmarks.py --check-only
+'''
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime, timezone
+
+# Making the working tree importable when the suite is run from a checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import reference_readability
+from whetstone.metrics.text import readability_metrics
+from whetstone.utils.text.text_parsers import count_syllables, tokenize_sentence
+from whetstone.utils.text.syllable_counter import default_syllable_counter
+
+
+
+# Vocabulary mixing short and long words, abbreviations, contractions, numbers, and non-ASCII words
+VOCABULARY = (
+    'the a of to and in is it that was for on are with as be at by this have from or one had not but what all were '
+    'when we there can an your which their said if do will each about how up out them then she many some so these '
+    'would other into has more her two like him see time could no make than first been its who now people my made '
+    'over did down only way find use may water long little very after words called just where most know '
+    'international readability comprehension institutionalization extraordinary responsibility vocabulary '
+    'approximately characteristic organization understanding communication environmental '
+    'beautiful rhythm queue aria radio triumph rearrange idea create poetry recreation '
+    "don't it's we'll they're U.S. Mr. Dr. e.g. i.e. 42 3.14 2024 naïve café résumé İstanbul"
+).split()
+PUNCTUATION = ['', '', '', '', '', '', ',', ';', ':']
+TERMINATORS = ['.', '.', '.', '?', '!']
+
+# Benchmarked calculate_* functions that score a list of texts
+LIST_FUNCTIONS = [
+    'calculate_flesch_kincaid_reading_ease',
+    'calculate_flesch_kincaid_grade_level',
+    'calculate_coleman_liau_index',
+    'calculate_automated_readability_index',
+    'calculate_smog_index',
+    'calculate_dale_chall_readability_score',
+    'calculate_spache_readability_formula',
+    'calculate_linsear_write_formula',
+    'calculate_forcast_readability_formula',
+    'calculate_raygor_readability_estimate',
+    'calculate_lix_readability_score',
+    'calculate_rix_readability_score',
+    'calculate_strain_index',
+    'calculate_new_dale_chall_readability_score',
+    'calculate_readability_consensus_grade',
+    'calculate_all_readability_metrics'
+]
+
+
+
+def generate_corpus(num_texts: int, doc_length: int, seed: int = 0) -> list:
+    '''
+    Generates a deterministic synthetic corpus.
+
+    Inputs:
+        - num_texts (int): The number of texts.
+        - doc_length (int): The average number of words per text.
+        - seed (int): The random seed.
+
+    Returns:
+        - texts (list[str]): The generated texts.
+    '''
+    rng = random.Random(seed * 1_000_003 + num_texts * 31 + doc_length)
+    texts = []
+    for _ in range(num_texts):
+        num_words = max(int(rng.gauss(doc_length, doc_length / 4)), 1)
+        words = []
+        sentence_length = 0
+        for i in range(num_words):
+            word = rng.choice(VOCABULARY)
+            sentence_length += 1
+            if i == num_words - 1 or (sentence_length > 3 and rng.random() < 0.08):
+                word += rng.choice(TERMINATORS)
+                sentence_length = 0
+            else:
+                word += rng.choice(PUNCTUATION)
+            words.append(word)
+        texts.append(' '.join(words))
+
+    # Including the edge cases every engine has to agree on
+    return texts + ['', ' ', '...', 'No terminal punctuation', 'Mr. Smith went to Washington. He said hi!']
+
+
+
+def reference_outputs(texts: list) -> dict:
+    # Scoring the corpus with the reference implementations
+    outputs = {name: getattr(reference_readability, name)(texts) for name in LIST_FUNCTIONS}
+    outputs['calculate_gunning_fog_index'] = [reference_readability.calculate_gunning_fog_index(text) for text in texts]
+    return outputs
+
+
+
+def candidate_engines(texts: list) -> dict:
+    '''
+    Scores a corpus with every engine under test, keyed by engine name.
+
+    Returns:
+        - engines (dict[str, callable]): A mapping of engine name to a zero-argument callable returning its output.
+    '''
+    engines = {name: (lambda name = name: getattr(readability_metrics, name)(texts)) for name in LIST_FUNCTIONS}
+    engines['calculate_gunning_fog_index'] = lambda: [readability_metrics.calculate_gunning_fog_index(text) for text in texts]
+    engines['iter_readability_metrics'] = lambda: list(readability_metrics.iter_readability_metrics(texts, batch_size = 256))
+    try:
+        import numpy
+        engines['calculate_all_readability_metrics[columnar]'] = lambda: readability_metrics.calculate_all_readability_metrics(texts, output = 'dict')
+    except ImportError:
+        pass
+    return engines
+
+
+
+def _max_difference(expected: list, actual: list) -> float:
+    return max((abs(a - b) for a, b in zip(expected, actual)), default = 0.0)
+
+
+
+def check_equivalence(texts: list, tolerance: float = 0.0) -> list:
+    '''
+    Compares every engine's scores against the reference implementations.
+
+    Inputs:
+        - texts (list[str]): The corpus to score.
+        - tolerance (float): The largest absolute difference accepted per score. Defaults to 0 (identical scores).
+
+    Returns:
+        - failures (list[str]): A description of each engine whose scores differ from the reference.
+    '''
+    expected = reference_outputs(texts)
+    failures = []
+    for engine, run in candidate_engines(texts).items():
+        actual = run()
+        if engine in expected and engine != 'calculate_all_readability_metrics':
+            difference = _max_difference(expected[engine], actual)
+            if len(actual) != len(expected[engine]) or difference > tolerance:
+                failures.append(f'{engine}: max difference {difference}')
+            continue
+
+        # Engines returning every metric are compared metric by metric
+        for metric in readability_metrics.READABILITY_FORMULAS:
+            reference_scores = [result[metric] for result in expected['calculate_all_readability_metrics']]
+            if isinstance(actual, dict):
+                scores = [float(score) for score in actual[metric]]
+            else:
+                scores = [result[metric] for result in actual]
+            difference = _max_difference(reference_scores, scores)
+            if len(scores) != len(reference_scores) or difference > tolerance:
+                failures.append(f'{engine}[{metric}]: max difference {difference}')
+    return failures
+
+
+
+def time_call(run, repeats: int) -> list:
+    # Timing each repeat from a cold syllable memo so that memoization across repeats does not flatter the results
+    timings = []
+    for _ in range(repeats):
+        default_syllable_counter.cache_clear()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+
+def measure_import_time(repeats: int) -> list:
+    '''
+    Measures the cold-start time of `import whetstone` in fresh interpreters.
+
+    Returns:
+        - timings (list[float]): The import time of each repeat, in seconds.
+    '''
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = 'import time; start = time.perf_counter(); import whetstone; print(time.perf_counter() - start)'
+    timings = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, '-c', code], cwd = root, capture_output = True, text = True, check = True).stdout
+        timings.append(float(output))
+    return timings
+
+
+
+def run_benchmarks(sizes: list, doc_lengths: list, repeats: int, seed: int, include_reference: bool) -> list:
+    '''
+    Times every benchmark over every corpus configuration.
+
+    Returns:
+        - results (list[dict]): One record per benchmark and corpus configuration.
+    '''
+    import_timings = measure_import_time(max(repeats, 5))
+    results = [{
+        'benchmark': 'import whetstone',
+        'num_texts': 0,
+        'doc_length': 0,
+        'num_words': 0,
+        'best_seconds': min(import_timings),
+        'median_seconds': statistics.median(import_timings),
+        'texts_per_second': 0.0,
+        'words_per_second': 0.0
+    }]
+    print(f"{'import whetstone':<55} best={min(import_timings) * 1000:.2f}ms", file = sys.stderr)
+
+    for doc_length in doc_lengths:
+        for size in sizes:
+            texts = generate_corpus(size, doc_length, seed)
+            words = [word for text in texts for word in text.split()]
+            benchmarks = candidate_engines(texts)
+            benchmarks['count_syllables'] = lambda: [count_syllables(word) for word in words]
+            benchmarks['tokenize_sentence'] = lambda: [tokenize_sentence(text) for text in texts]
+            if include_reference:
+                benchmarks['reference.calculate_all_readability_metrics'] = lambda: reference_readability.calculate_all_readability_metrics(texts)
+
+            for name, run in benchmarks.items():
+                timings = time_call(run, repeats)
+                best = min(timings)
+                results.append({
+                    'benchmark': name,
+                    'num_texts': len(texts),
+                    'doc_length': doc_length,
+                    'num_words': len(words),
+                    'best_seconds': best,
+                    'median_seconds': statistics.median(timings),
+                    'texts_per_second': len(texts) / best if best else math.inf,
+                    'words_per_second': len(words) / best if best else math.inf
+                })
+                print(f'{name:<55} texts={len(texts):<8} doc_length={doc_length:<6} best={best:.4f}s', file = sys.stderr)
+    return results
+
+
+
+def compare_results(previous: dict, current: dict) -> None:
+    '''
+    Prints the speedup of the current run relative to a previous run for every benchmark they share.
+    '''
+    key = lambda result: (result['benchmark'], result['num_texts'], result['doc_length'])
+    previous_results = {key(result): result for result in previous['results']}
+    print(f"{'benchmark':<55} {'texts':>8} {'length':>7} {'previous':>10} {'current':>10} {'speedup':>8}")
+    for result in current['results']:
+        before = previous_results.get(key(result))
+        if before is None:
+            continue
+        speedup = before['best_seconds'] / result['best_seconds'] if result['best_seconds'] else math.inf
+        print(f"{result['benchmark']:<55} {result['num_texts']:>8} {result['doc_length']:>7} "
+              f"{before['best_seconds']:>10.4f} {result['best_seconds']:>10.4f} {speedup:>7.2f}x")
+
+
+
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(description = 'Benchmark the whetstone readability metrics.')
+    parser.add_argument('--sizes', type = int, nargs = '+', default = [100, 1_000, 10_000], help = 'Corpus sizes, in texts.')
+    parser.add_argument('--doc-lengths', type = int, nargs = '+', default = [20, 200], help = 'Average document lengths, in words.')
+    parser.add_argument('--repeats', type = int, default = 3, help = 'Timed repeats per benchmark.')
+    parser.add_argument('--seed', type = int, default = 0, help = 'Random seed for the synthetic corpora.')
+    parser.add_argument('--tolerance', type = float, default = 0.0, help = 'Largest accepted absolute score difference from the reference.')
+    parser.add_argument('--check-size', type = int, default = 500, help = 'Number of texts per document length used for the equivalence check.')
+    parser.add_argument('--include-reference', action = 'store_true', help = 'Also time the reference implementation.')
+    parser.add_argument('--check-only', action = 'store_true', help = 'Only run the equivalence check.')
+    parser.add_argument('--output', help = 'Write the results as JSON to this path.')
+    parser.add_argument('--compare', help = 'Compare against the results JSON of a previous run.')
+    args = parser.parse_args(argv)
+
+    # Checking equivalence first, since timings of engines producing different scores are meaningless
+    failures = []
+    for doc_length in args.doc_lengths:
+        failures += check_equivalence(generate_corpus(args.check_size, doc_length, args.seed), args.tolerance)
+    if failures:
+        print('Equivalence check FAILED:', file = sys.stderr)
+        for failure in failures:
+            print(f'  {failure}', file = sys.stderr)
+        return 1
+    print('Equivalence check passed: every engine matches the reference implementation.', file = sys.stderr)
+    if args.check_only:
+        return 0
+
+    try:
+        from importlib.metadata import version
+        whetstone_version = version('whetstone-ml')
+    except Exception:
+        whetstone_version = 'unknown'
+
+    current = {
+        'metadata': {
+            'whetstone_version': whetstone_version,
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count()
+        },
+        'results': run_benchmarks(args.sizes, args.doc_lengths, args.repeats, args.seed, args.include_reference)
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent = 2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare_results(json.load(f), current)
+    return 0
+
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# Making the reference implementations and the synthetic corpus generator in `benchmarks/` importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+
+
+@pytest.fixture(scope = 'session')
+def corpus():
+    from run_benchmarks import generate_corpus
+    return generate_corpus(60, 40, seed = 7) + generate_corpus(20, 300, seed = 11) + [
+        '', '   ', 'One.', 'Dr. Smith met Mr. Jones, i.e. the boss.  He left?  Yes!', 'Ünïcödé wörds naïvely café-crawl.\n\nEnd.'
+    ]
@@ -0,0 +1,104 @@
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from whetstone import cli
+from whetstone.metrics.text.readability_metrics import compute_metrics
+from whetstone.utils import parallel
+
+
+
+TEXTS = ['The cat sat on the mat.', 'Dr. Smith arrived at 5 p.m. yesterday.', 'Extraordinary vocabulary obfuscates.', 'Short.']
+
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    '''
+    Thread pool standing in for the worker processes, optionally failing one submitted batch.
+    '''
+
+    def __init__(self, max_workers, fail_at = None):
+        super().__init__(max_workers = max_workers)
+        self.num_submitted = 0
+        self.fail_at = fail_at
+
+
+    def submit(self, func, *args, **kwargs):
+        self.num_submitted += 1
+        if self.num_submitted == self.fail_at:
+            future = Future()
+            future.set_exception(RuntimeError('worker died'))
+            return future
+        return super().submit(func, *args, **kwargs)
+
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / 'input.jsonl'
+    path.write_text(''.join(json.dumps({'id': i, 'text': text}) + '\n' for i, text in enumerate(TEXTS * 5)) + '{"id": 20}\n')
+    return path
+
+
+
+def _use_executor(monkeypatch, executor):
+    monkeypatch.setattr(parallel, 'get_process_pool', lambda num_workers: executor)
+
+
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+
+def test_score_writes_one_line_per_record(input_path, tmp_path):
+    output_path = tmp_path / 'output.jsonl'
+    assert cli.main(['score', str(input_path), '--keep', 'id', '--batch-size', '3', '-o', str(output_path), '-q']) == 0
+    lines = _read_lines(output_path)
+    expected = compute_metrics(TEXTS * 5)
+    assert [line['record'] for line in lines] == list(range(21))
+    assert [line['id'] for line in lines] == list(range(21))
+    assert [{key: value for key, value in line.items() if key not in ('record', 'id')} for line in lines[:20]] == expected
+    assert all(value is None for key, value in lines[20].items() if key not in ('record', 'id'))
+
+
+
+def test_jobs_scores_batches_in_workers(input_path, tmp_path, monkeypatch):
+    serial_path = tmp_path / 'serial.jsonl'
+    parallel_path = tmp_path / 'parallel.jsonl'
+    cli.main(['score', str(input_path), '--batch-size', '4', '-o', str(serial_path), '-q'])
+    with RecordingExecutor(2) as executor:
+        _use_executor(monkeypatch, executor)
+        assert cli.main(['score', str(input_path), '--jobs', '2', '--batch-size', '4', '-o', str(parallel_path), '-q']) == 0
+        assert executor.num_submitted == 6
+    assert parallel_path.read_text() == serial_path.read_text()
+
+
+
+def test_resume_after_a_failed_batch(input_path, tmp_path, monkeypatch):
+    expected_path = tmp_path / 'expected.jsonl'
+    output_path = tmp_path / 'output.jsonl'
+    checkpoint_path = tmp_path / 'checkpoint.json'
+    cli.main(['score', str(input_path), '--batch-size', '3', '-o', str(expected_path), '-q'])
+
+    arguments = ['score', str(input_path), '--jobs', '2', '--batch-size', '3', '-o', str(output_path), '--checkpoint', str(checkpoint_path), '-q']
+    with RecordingExecutor(2, fail_at = 3) as executor:
+        _use_executor(monkeypatch, executor)
+        with pytest.raises(RuntimeError):
+            cli.main(arguments)
+
+    # The batches before the failed one were written and checkpointed in order
+    assert json.loads(checkpoint_path.read_text())['records'] == 6
+    assert len(_read_lines(output_path)) == 6
+
+    with RecordingExecutor(2) as executor:
+        _use_executor(monkeypatch, executor)
+        assert cli.main(arguments + ['--resume']) == 0
+    assert output_path.read_text() == expected_path.read_text()
+
+
+
+def test_invalid_jobs_is_reported(input_path, capsys):
+    assert cli.main(['score', str(input_path), '--jobs', '0', '-q']) == 1
+    assert 'n_jobs' in capsys.readouterr().err
@@ -0,0 +1,62 @@
+import json
+
+from whetstone.utils.text.corpus_reader import CorpusReader, iter_byte_range
+
+
+
+RECORDS = [{'text': 'First record.'}, {'text': 'Second record.'}, {'text': 'Third record.'}]
+
+
+
+def _write_jsonl(path):
+    # Separating the records with blank lines, which only the 'jsonl' format skips
+    path.write_text('\n\n'.join(json.dumps(record) for record in RECORDS) + '\n')
+    return str(path)
+
+
+
+def test_records_and_byte_ranges(tmp_path):
+    path = _write_jsonl(tmp_path / 'corpus.jsonl')
+    with CorpusReader(path, text_field = 'text') as reader:
+        assert list(reader) == [record['text'] for record in RECORDS]
+        assert reader[-1] == RECORDS[-1]['text']
+        start, end = reader.byte_range(1, 3)
+        assert list(iter_byte_range(path, start, end, text_field = 'text')) == ['Second record.', 'Third record.']
+
+
+
+def test_persisted_index_is_reused(tmp_path):
+    path = _write_jsonl(tmp_path / 'corpus.jsonl')
+    CorpusReader(path).close()
+    with CorpusReader(path, text_field = 'text') as reader:
+        assert len(reader) == len(RECORDS)
+        assert reader[1] == RECORDS[1]['text']
+
+
+
+def test_index_is_rebuilt_for_a_different_format(tmp_path):
+    path = _write_jsonl(tmp_path / 'corpus.jsonl')
+    index_path = str(tmp_path / 'corpus.idx')
+
+    # Every line, blank or not, is a record in 'text' format
+    with CorpusReader(path, format = 'text', index_path = index_path) as reader:
+        assert len(reader) == 2 * len(RECORDS) - 1
+
+    # The same index file must not be reused for 'jsonl', which skips the blank lines
+    with CorpusReader(path, format = 'jsonl', index_path = index_path, text_field = 'text') as reader:
+        assert len(reader) == len(RECORDS)
+        assert list(reader) == [record['text'] for record in RECORDS]
+
+    with CorpusReader(path, format = 'text', index_path = index_path) as reader:
+        assert len(reader) == 2 * len(RECORDS) - 1
+
+
+
+def test_path_objects_are_accepted(tmp_path):
+    path = tmp_path / 'corpus.jsonl'
+    _write_jsonl(path)
+    with CorpusReader(path, text_field = 'text', index_path = tmp_path / 'corpus.idx') as reader:
+        assert reader.format == 'jsonl'
+        assert list(reader) == [record['text'] for record in RECORDS]
+        start, end = reader.byte_range(0, 2)
+    assert list(iter_byte_range(path, start, end, text_field = 'text')) == ['First record.', 'Second record.']
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from whetstone.drift.distribution_drift import EPSILON, MetricDriftDetector, calculate_distribution_drift
+
+
+
+def _reference_binned(baseline, production, bins):
+    # Histograms over the baseline range with one extra bin on either side, straight from np.histogram
+    edges = np.linspace(baseline.min(), baseline.max(), bins + 1)
+
+    def proportions(values):
+        inner = np.histogram(values, edges)[0]
+        counts = np.concatenate([[np.sum(values < edges[0])], inner, [np.sum(values > edges[-1])]])
+        return counts / counts.sum()
+
+    p, q = proportions(baseline), proportions(production)
+    smoothed_p, smoothed_q = np.clip(p, EPSILON, None), np.clip(q, EPSILON, None)
+    psi = np.sum((smoothed_q - smoothed_p) * np.log(smoothed_q / smoothed_p))
+
+    m = 0.5 * (p + q)
+    js = 0.5 * np.sum(p[p > 0] * np.log2(p[p > 0] / m[p > 0])) + 0.5 * np.sum(q[q > 0] * np.log2(q[q > 0] / m[q > 0]))
+    return psi, js
+
+
+
+def _reference_exact(baseline, production):
+    # KS statistic and Wasserstein distance from the empirical distributions of the raw values
+    points = np.sort(np.concatenate([baseline, production]))
+    cdf_baseline = np.searchsorted(np.sort(baseline), points, side = 'right') / len(baseline)
+    cdf_production = np.searchsorted(np.sort(production), points, side = 'right') / len(production)
+    ks = np.max(np.abs(cdf_baseline - cdf_production))
+    wasserstein = np.sum(np.abs(cdf_baseline - cdf_production)[:-1] * np.diff(points))
+    return ks, wasserstein
+
+
+
+@pytest.mark.parametrize('shift, scale', [(0.0, 1.0), (0.4, 1.0), (0.0, 1.5), (-1.0, 0.7)])
+def test_statistics_match_numpy_definitions(shift, scale):
+    rng = np.random.default_rng(13)
+    baseline = rng.normal(0.0, 1.0, 20_000)
+    production = rng.normal(shift, scale, 20_000)
+
+    drift = calculate_distribution_drift(baseline, production, bins = 50)['metric_0']
+    psi, js = _reference_binned(baseline, production, 50)
+    ks, wasserstein = _reference_exact(baseline, production)
+
+    assert drift['psi'] == pytest.approx(psi, rel = 1e-9, abs = 1e-12)
+    assert drift['js'] == pytest.approx(js, rel = 1e-9, abs = 1e-12)
+    assert drift['ks'] == pytest.approx(ks, abs = 0.02)
+    assert drift['wasserstein'] == pytest.approx(wasserstein, rel = 0.02, abs = 0.005)
+
+
+
+@pytest.mark.parametrize('value', [2.0, 200.0, -3.0])
+def test_out_of_range_production(value):
+    baseline = np.random.default_rng(17).uniform(0.0, 1.0, 10_000)
+    production = np.full(500, value)
+
+    drift = calculate_distribution_drift(baseline, production)['metric_0']
+    psi, js = _reference_binned(baseline, production, 20)
+    ks, wasserstein = _reference_exact(baseline, production)
+
+    # Every production value lies beyond the baseline, so the distance grows with how far it lies
+    assert ks == 1.0
+    assert drift['ks'] == 1.0
+    assert drift['psi'] == pytest.approx(psi)
+    assert drift['js'] == pytest.approx(js)
+    assert drift['wasserstein'] == pytest.approx(wasserstein, rel = 1e-3)
+
+
+
+def test_input_formats_agree():
+    rng = np.random.default_rng(19)
+    baseline = {'a': rng.normal(0.0, 1.0, 500), 'b': rng.uniform(0.0, 5.0, 500)}
+    production = {'a': rng.normal(0.5, 1.0, 300), 'b': rng.uniform(1.0, 6.0, 300)}
+    production_rows = [{'a': a, 'b': b} for a, b in zip(production['a'], production['b'])]
+
+    expected = calculate_distribution_drift(baseline, production)
+    assert calculate_distribution_drift(baseline, production_rows) == expected
+    assert calculate_distribution_drift(baseline, np.column_stack([production['a'], production['b']])) == expected
+    assert calculate_distribution_drift(baseline, production_rows, metrics = ['b'])['b'] == expected['b']
+
+
+
+def test_streaming_updates_match_one_batch():
+    rng = np.random.default_rng(23)
+    baseline = rng.normal(0.0, 1.0, (1000, 3))
+    production = rng.normal(0.2, 1.2, (900, 3))
+
+    detector = MetricDriftDetector(baseline)
+    for start in range(0, len(production), 100):
+        detector.update(production[start:start + 100])
+    detector.update([])
+    streamed = detector.compare()
+
+    expected = calculate_distribution_drift(baseline, production)
+    for metric, statistics in expected.items():
+        assert streamed[metric] == pytest.approx(statistics)
+
+    detector.reset()
+    assert not detector.production_counts.any() and not detector.production_excess.any()
+
+
+
+def test_empty_baseline_is_rejected():
+    with pytest.raises(ValueError):
+        MetricDriftDetector([])
+    with pytest.raises(ValueError):
+        MetricDriftDetector(np.zeros((10, 2)), bins = 1)
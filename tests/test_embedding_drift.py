@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from whetstone.drift.embedding_drift import EmbeddingDriftDetector, calculate_embedding_drift
+
+
+
+def _brute_force(baseline, production, gamma, k):
+    # Every statistic from the full pairwise distance matrices
+    def squared_distances(a, b):
+        return ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis = 2)
+
+    n, m = len(baseline), len(production)
+    shift = production.mean(axis = 0) - baseline.mean(axis = 0)
+    kernel_bb = np.exp(-gamma * squared_distances(baseline, baseline))
+    kernel_pp = np.exp(-gamma * squared_distances(production, production))
+    kernel_bp = np.exp(-gamma * squared_distances(baseline, production))
+    mmd2 = ((kernel_bb.sum() - n) / (n * (n - 1)) + (kernel_pp.sum() - m) / (m * (m - 1)) - 2.0 * kernel_bp.mean())
+
+    radii = np.sqrt(np.sort(squared_distances(baseline, baseline), axis = 1)[:, k])
+    cross = np.sqrt(squared_distances(baseline, production))
+    within = cross <= radii[:, None]
+    return {
+        'centroid_shift': np.linalg.norm(shift),
+        'mmd2_linear': shift @ shift,
+        'mmd2_rbf': mmd2,
+        'nn_coverage': within.any(axis = 1).mean(),
+        'nn_outside_fraction': 1.0 - within.any(axis = 0).mean(),
+        'nn_mean_distance': cross.min(axis = 0).mean()
+    }
+
+
+
+@pytest.fixture(scope = 'module')
+def embeddings():
+    rng = np.random.default_rng(0)
+    return rng.normal(size = (150, 8)), rng.normal(0.3, 1.2, size = (110, 8))
+
+
+
+def test_exact_statistics_match_brute_force(embeddings):
+    baseline, production = embeddings
+    drift = calculate_embedding_drift(baseline, production, gamma = 0.1, mmd_method = 'exact', nearest_neighbors = 3,
+                                      max_neighbor_samples = None, chunk_size = 32)
+    expected = _brute_force(baseline, production, 0.1, 3)
+    for name, value in expected.items():
+        assert drift[name] == pytest.approx(value, rel = 1e-9, abs = 1e-12)
+
+
+
+def test_chunk_size_does_not_change_results(embeddings):
+    baseline, production = embeddings
+    options = dict(gamma = 0.1, mmd_method = 'exact', max_neighbor_samples = None)
+    assert calculate_embedding_drift(baseline, production, chunk_size = 7, **options) == pytest.approx(
+        calculate_embedding_drift(baseline, production, chunk_size = 4_096, **options))
+
+
+
+def test_random_features_approximate_the_exact_mmd(embeddings):
+    baseline, production = embeddings
+    exact = calculate_embedding_drift(baseline, production, ['mmd2_rbf'], gamma = 0.1, mmd_method = 'exact')['mmd2_rbf']
+    approximate = calculate_embedding_drift(baseline, production, ['mmd2_rbf'], gamma = 0.1, num_features = 8_192)['mmd2_rbf']
+    assert approximate == pytest.approx(exact, abs = 0.02)
+
+
+
+def test_memmap_inputs_and_repeated_comparisons(embeddings, tmp_path):
+    baseline, production = embeddings
+    path = tmp_path / 'baseline.npy'
+    np.save(path, baseline)
+    detector = EmbeddingDriftDetector(np.load(path, mmap_mode = 'r'), gamma = 0.1, chunk_size = 16)
+    first = detector.compare(production)
+    assert detector.compare(production) == first
+    assert first == EmbeddingDriftDetector(baseline, gamma = 0.1, chunk_size = 16).compare(production)
+
+
+
+def test_unknown_statistics_are_rejected(embeddings):
+    baseline, production = embeddings
+    with pytest.raises(ValueError):
+        calculate_embedding_drift(baseline, production, ['not_a_statistic'])
@@ -0,0 +1,65 @@
+from time import perf_counter
+
+from whetstone.metrics.text.readability_metrics import calculate_all_readability_metrics
+from whetstone.utils import instrumentation
+from whetstone.utils.instrumentation import Instrumentation
+from whetstone.utils.text.syllable_counter import SyllableCounter
+from whetstone.utils.text.text_parsers import split_words
+
+
+
+def _parse_exposition(exposition):
+    # Mapping each sample name, with its labels, to its value and each metric name to its declared type
+    samples, types = {}, {}
+    for line in exposition.splitlines():
+        if line.startswith('# TYPE '):
+            _, _, name, metric_type = line.split(' ')
+            types[name] = metric_type
+        else:
+            name, value = line.rsplit(' ', 1)
+            samples[name] = float(value)
+    return samples, types
+
+
+
+def test_to_prometheus_exports_counters_and_stage_timings():
+    syllable_counter = SyllableCounter()
+    with Instrumentation(syllable_counter = syllable_counter) as collector:
+        instrumentation.record_stage('word_split', perf_counter() - 0.25)
+        instrumentation.record_stage('word_split', perf_counter() - 0.5)
+        instrumentation.record_stage('formulas', perf_counter() - 1.0)
+        instrumentation.record_counts(3, 40)
+        instrumentation.record_counts(2, 10)
+        for word in ['alpha', 'beta', 'alpha', 'alpha']:
+            syllable_counter.count(word)
+    assert not instrumentation.enabled
+
+    samples, types = _parse_exposition(collector.to_prometheus(prefix = 'test'))
+    assert types == {name: 'counter' for name in ['test_stage_seconds_total', 'test_stage_calls_total', 'test_texts_total',
+                                                  'test_words_total', 'test_syllable_cache_hits_total', 'test_syllable_cache_misses_total']}
+    assert samples['test_stage_calls_total{stage="word_split"}'] == 2
+    assert samples['test_stage_calls_total{stage="formulas"}'] == 1
+    assert 0.75 <= samples['test_stage_seconds_total{stage="word_split"}'] < 1.0
+    assert 1.0 <= samples['test_stage_seconds_total{stage="formulas"}'] < 1.25
+    assert samples['test_texts_total'] == 5
+    assert samples['test_words_total'] == 50
+    assert samples['test_syllable_cache_hits_total'] == 2
+    assert samples['test_syllable_cache_misses_total'] == 2
+    assert len(samples) == 8
+
+
+
+def test_scoring_reports_every_stage():
+    texts = ['The cat sat on the mat.', 'A much longer sentence, with several clauses, follows here. Then one more.']
+    with Instrumentation() as collector:
+        calculate_all_readability_metrics(texts, cache = None)
+    statistics = collector.to_dict()
+
+    assert statistics['texts'] == len(texts)
+    assert statistics['words'] == sum(len(split_words(text)) for text in texts)
+    assert {'tokenize_sentence', 'word_split', 'count_syllables', 'formulas'} <= set(statistics['stages'])
+    samples, _ = _parse_exposition(collector.to_prometheus())
+    assert samples['whetstone_texts_total'] == len(texts)
+    for stage, values in statistics['stages'].items():
+        assert samples[f'whetstone_stage_calls_total{{stage="{stage}"}}'] == values['calls']
+        assert samples[f'whetstone_stage_seconds_total{{stage="{stage}"}}'] == values['seconds']
@@ -0,0 +1,78 @@
+import pickle
+
+import pytest
+
+from whetstone.utils.text.lexicon import Lexicon, build_lexicon, load_cmudict_syllables
+from whetstone.utils.text.syllable_counter import SyllableCounter
+from whetstone.utils.text.text_parsers import count_syllables
+from whetstone.utils.text.text_stats import compute_text_stats
+
+
+
+SYLLABLES = {'hello': 2, 'fire': 1, 'naïve': 2, 'every': 3, 'elephant': 3}
+DALE_CHALL_WORDS = ['the', 'cat', 'Sat', 'on', 'mat']
+SPACHE_WORDS = ['the', 'cat']
+
+
+
+@pytest.fixture
+def lexicon(tmp_path):
+    with build_lexicon(str(tmp_path / 'lexicon.bin'), SYLLABLES, DALE_CHALL_WORDS, SPACHE_WORDS) as lexicon:
+        yield lexicon
+
+
+
+def test_round_trip(lexicon):
+    assert len(lexicon) == len(set(SYLLABLES) | {word.lower() for word in DALE_CHALL_WORDS})
+    for word, count in SYLLABLES.items():
+        assert lexicon.syllables(word) == count
+        assert lexicon.syllables(word.upper()) == count
+        assert word in lexicon
+    assert lexicon.syllables('zebra') is None
+    assert 'zebra' not in lexicon
+
+
+
+def test_missing_words_fall_back_to_the_heuristic(lexicon):
+    assert lexicon.count_syllables('fire') == 1
+    assert lexicon.count_syllables('extraordinary') == count_syllables('extraordinary')
+
+
+
+def test_easy_word_flags(lexicon):
+    assert lexicon.has_dale_chall_words
+    assert lexicon.is_dale_chall_easy('sat') and lexicon.is_dale_chall_easy('SAT')
+    assert not lexicon.is_dale_chall_easy('elephant')
+    assert lexicon.is_spache_easy('cat') and not lexicon.is_spache_easy('mat')
+
+
+
+def test_reopening_and_pickling_keep_the_contents(lexicon):
+    for copy in (Lexicon(lexicon.path), pickle.loads(pickle.dumps(lexicon))):
+        assert copy.checksum == lexicon.checksum
+        assert {word: copy.syllables(word) for word in SYLLABLES} == SYLLABLES
+        copy.close()
+
+
+
+def test_files_that_are_not_lexicons_are_rejected(tmp_path):
+    path = tmp_path / 'not_a_lexicon.bin'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        Lexicon(str(path))
+
+
+
+def test_load_cmudict_syllables(tmp_path):
+    path = tmp_path / 'cmudict.txt'
+    path.write_text(';;; comment\nHELLO  HH AH0 L OW1\nHELLO(1)  HH EH0 L OW1 OW0\nFIRE  F AY1 ER0\n\n')
+    assert load_cmudict_syllables(str(path)) == {'hello': 2, 'fire': 2}
+
+
+
+def test_text_stats_use_the_lexicon(lexicon):
+    text = 'The cat sat on the mat near every elephant.'
+    stats = compute_text_stats(text, syllable_counter = SyllableCounter(lexicon = lexicon))
+    heuristic = compute_text_stats(text, syllable_counter = SyllableCounter())
+    assert stats.num_syllables == heuristic.num_syllables - sum(count_syllables(word) for word in ('every', 'elephant')) + 6
+    assert stats.num_difficult_words == 3
@@ -0,0 +1,100 @@
+import re
+
+import numpy as np
+import pytest
+
+from whetstone.metrics.text.rag_metrics import (MinHasher, MinHashLSHIndex, calculate_ngram_overlap, estimate_jaccard,
+                                                flag_ungrounded_answers)
+
+
+
+def _shingles(text, n = 3):
+    # The word n-gram set of a text, the naive reference for the hashed shingles
+    words = re.findall(r'\w+', text.lower())
+    if len(words) < n:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i:i + n]) for i in range(len(words) - n + 1)}
+
+
+
+@pytest.fixture(scope = 'module')
+def pool():
+    from run_benchmarks import generate_corpus
+    rng = np.random.default_rng(0)
+    contexts = generate_corpus(300, 200, seed = 3)
+
+    # Short answers copied out of long contexts, then answers unrelated to any context
+    long_contexts = [context for context in contexts if len(context.split()) >= 100]
+    grounded = []
+    for i in rng.integers(len(long_contexts), size = 100):
+        words = long_contexts[i].split()
+        start = int(rng.integers(0, len(words) - 20))
+        grounded.append(' '.join(words[start:start + 20]))
+    fabricated = [text for text in generate_corpus(100, 20, seed = 99) if len(_shingles(text)) >= 10][:100]
+    return contexts, grounded, fabricated
+
+
+
+def test_exact_overlap_matches_naive_sets(corpus):
+    answers = corpus[:40]
+    contexts = corpus[-40:]
+    overlap = calculate_ngram_overlap(answers, contexts, method = 'exact')
+    for i, (answer, context) in enumerate(zip(answers, contexts)):
+        a, b = _shingles(answer), _shingles(context)
+        assert overlap['jaccard'][i] == pytest.approx(len(a & b) / len(a | b) if a and b else 0.0)
+        assert overlap['containment'][i] == pytest.approx(len(a & b) / len(a) if a else 0.0)
+
+
+
+def test_minhash_overlap_is_close_to_exact(corpus):
+    answers = corpus[:40]
+    contexts = [[answer, other] for answer, other in zip(answers, corpus[40:80])]
+    estimated = calculate_ngram_overlap(answers, contexts, hasher = MinHasher(num_perm = 400))
+    exact = calculate_ngram_overlap(answers, contexts, method = 'exact')
+    assert np.abs(estimated['jaccard'] - exact['jaccard']).max() < 0.2
+    assert np.allclose(exact['containment'][[bool(_shingles(answer)) for answer in answers]], 1.0)
+
+
+
+def test_identical_texts_have_identical_signatures(corpus):
+    hasher = MinHasher()
+    signatures = hasher.signatures(corpus)
+    assert np.all(estimate_jaccard(signatures, hasher.signatures(corpus))[signatures.sizes > 0] == 1.0)
+
+
+
+def test_lsh_search_and_save_round_trip(pool, tmp_path):
+    contexts, _, _ = pool
+    index = MinHashLSHIndex()
+    index.add_texts(contexts, ids = np.arange(len(contexts)) + 1_000)
+    results = index.search(index.hasher.signatures(contexts[:20]))
+    assert set(zip(results['query'], results['id'])) >= {(i, i + 1_000) for i in range(20)}
+
+    index.save(str(tmp_path / 'index.npz'))
+    loaded = MinHashLSHIndex.load(str(tmp_path / 'index.npz'))
+    reloaded = loaded.search(loaded.hasher.signatures(contexts[:20]))
+    assert all(np.array_equal(results[key], reloaded[key]) for key in results)
+
+
+
+def test_short_answers_contained_in_long_contexts_are_grounded(pool):
+    contexts, grounded, fabricated = pool
+    index = MinHashLSHIndex()
+    index.add_texts(contexts)
+    results = flag_ungrounded_answers(grounded + fabricated, index, contexts = contexts, chunk_size = 64)
+    assert not results['ungrounded'][:len(grounded)].any()
+    assert results['ungrounded'][len(grounded):].all()
+
+    # The chosen contexts' containment is the exact share of each answer's n-grams
+    exact = calculate_ngram_overlap(grounded, [contexts[i] for i in results['context_index'][:len(grounded)]], method = 'exact')
+    assert np.allclose(results['containment'][:len(grounded)], exact['containment'])
+    assert np.allclose(results['jaccard'][:len(grounded)], exact['jaccard'])
+
+
+
+def test_estimated_containment_finds_most_contained_answers(pool):
+    contexts, grounded, _ = pool
+    index = MinHashLSHIndex()
+    index.add_texts(contexts)
+    results = flag_ungrounded_answers(grounded, index)
+    assert results['ungrounded'].mean() < 0.2
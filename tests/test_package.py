@@ -0,0 +1,15 @@
+import importlib
+
+import whetstone
+from whetstone import drift
+
+
+
+def test_every_lazy_export_resolves():
+    for name in whetstone.__all__:
+        assert getattr(whetstone, name) is getattr(importlib.import_module(whetstone._EXPORT_MODULES[name]), name)
+
+
+
+def test_drift_names_are_exported_at_the_top_level():
+    assert set(drift.__all__) <= set(whetstone.__all__)
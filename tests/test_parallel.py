@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from whetstone.utils import parallel
+from whetstone.utils.parallel import MIN_BATCH_SIZE, MIN_ITEMS_PER_WORKER, default_batch_size, map_in_chunks, resolve_n_jobs
+
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    '''
+    Thread pool that records the chunks it is handed, standing in for the shared process pool.
+    '''
+
+    def __init__(self, max_workers):
+        super().__init__(max_workers = max_workers)
+        self.chunks = []
+
+
+    def map(self, func, *iterables, **kwargs):
+        chunks = list(iterables[0])
+        self.chunks.extend(chunks)
+        return super().map(func, chunks, **kwargs)
+
+
+
+def _double(items):
+    return [item * 2 for item in items]
+
+
+
+@pytest.fixture
+def recording_pools(monkeypatch):
+    pools = {}
+
+    def get_pool(num_workers):
+        return pools.setdefault(num_workers, RecordingExecutor(num_workers))
+
+    monkeypatch.setattr(parallel, 'get_process_pool', get_pool)
+    yield pools
+    for pool in pools.values():
+        pool.shutdown()
+
+
+
+def test_resolve_n_jobs():
+    assert resolve_n_jobs(None) == 1
+    assert resolve_n_jobs(1) == 1
+    assert resolve_n_jobs(3) == 3
+    assert resolve_n_jobs(-1) >= 1
+
+
+
+@pytest.mark.parametrize('n_jobs', [0, -2, -8])
+def test_resolve_n_jobs_rejects_invalid_values(n_jobs):
+    with pytest.raises(ValueError):
+        resolve_n_jobs(n_jobs)
+
+
+
+def test_map_in_chunks_serial(recording_pools):
+    items = list(range(10 * MIN_ITEMS_PER_WORKER))
+    assert map_in_chunks(_double, items, n_jobs = 1) == _double(items)
+    assert not recording_pools
+
+
+
+def test_map_in_chunks_uses_pool_below_full_worker_threshold(recording_pools):
+    # Two workers' worth of items with four workers requested still fans out instead of running serially
+    items = list(range(2 * MIN_ITEMS_PER_WORKER))
+    assert map_in_chunks(_double, items, n_jobs = 4) == _double(items)
+    pool = recording_pools[4]
+    assert len(pool.chunks) > 1
+    assert sum(len(chunk) for chunk in pool.chunks) == len(items)
+
+
+
+def test_map_in_chunks_runs_tiny_batches_serially(recording_pools):
+    items = list(range(MIN_ITEMS_PER_WORKER))
+    assert map_in_chunks(_double, items, n_jobs = 4) == _double(items)
+    assert not recording_pools
+
+
+
+def test_map_in_chunks_with_executor_preserves_order():
+    items = list(range(1000))
+    with ThreadPoolExecutor(max_workers = 3) as executor:
+        assert map_in_chunks(_double, items, executor = executor) == _double(items)
+        assert map_in_chunks(_double, [], executor = executor) == []
+
+
+
+def test_default_batch_size_fills_every_worker():
+    assert default_batch_size(1) == MIN_BATCH_SIZE
+    batch_size = default_batch_size(16)
+    assert batch_size >= 16 * MIN_ITEMS_PER_WORKER
+    with ThreadPoolExecutor(max_workers = 16) as executor:
+        assert default_batch_size(16, executor = executor) == batch_size
+        assert default_batch_size(executor = executor) == MIN_BATCH_SIZE
+
+
+
+def test_shared_pool_worker_count_is_recorded():
+    pool = parallel.get_process_pool(3)
+    try:
+        assert parallel.default_batch_size(executor = pool) == parallel.default_batch_size(3)
+    finally:
+        parallel.shutdown_process_pools()
+    assert not parallel._process_pool_workers
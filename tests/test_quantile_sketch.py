@@ -0,0 +1,116 @@
+import json
+import math
+
+import numpy as np
+import pytest
+
+from whetstone.drift.quantile_sketch import MetricQuantileSketch, TDigest
+
+
+
+QUANTILES = [0.001, 0.01, 0.1, 0.5, 0.9, 0.99, 0.999]
+
+
+
+def _rank_errors(digest, values):
+    estimates = digest.quantile(QUANTILES)
+    return np.abs(np.searchsorted(np.sort(values), estimates) / len(values) - QUANTILES)
+
+
+
+@pytest.mark.parametrize('distribution', ['normal', 'lognormal', 'uniform'])
+def test_quantile_accuracy(distribution):
+    values = getattr(np.random.default_rng(29), distribution)(size = 200_000)
+    digest = TDigest()
+    for chunk in np.array_split(values, 50):
+        digest.update(chunk)
+
+    assert digest.count == len(values)
+    assert len(digest) <= 2 * digest.compression
+    rank_errors = _rank_errors(digest, values)
+    assert np.all(rank_errors < 5e-4)
+    assert rank_errors[0] < 1.5e-4 and rank_errors[-1] < 1.5e-4
+    assert digest.quantile(0.999) == pytest.approx(np.quantile(values, 0.999), rel = 0.03)
+    assert digest.quantile(0.0) == values.min()
+    assert digest.quantile(1.0) == values.max()
+
+
+
+def test_nan_values_are_ignored_and_empty_digest_is_nan():
+    digest = TDigest()
+    assert math.isnan(digest.quantile(0.5))
+    assert np.isnan(digest.quantile([0.1, 0.9])).all()
+
+    digest.update([1.0, float('nan'), 3.0])
+    assert digest.count == 2
+    assert digest.quantile(0.5) == pytest.approx(2.0)
+
+
+
+def test_merged_digests_match_one_digest():
+    values = np.random.default_rng(31).lognormal(size = 100_000)
+    shards = []
+    for chunk in np.array_split(values, 8):
+        shard = TDigest()
+        shard.update(chunk)
+        shards.append(shard)
+
+    merged = TDigest()
+    for shard in shards:
+        merged.merge(shard)
+    merged.merge(TDigest())
+
+    assert merged.count == len(values)
+    assert (merged.min, merged.max) == (values.min(), values.max())
+    assert np.all(_rank_errors(merged, values) < 3e-4)
+
+
+
+def test_serialization_round_trips():
+    digest = TDigest(100)
+    digest.update(np.random.default_rng(37).normal(size = 5000))
+    expected = digest.quantile(QUANTILES)
+
+    restored = TDigest.from_dict(json.loads(json.dumps(digest.to_dict(), allow_nan = False)))
+    assert np.array_equal(restored.quantile(QUANTILES), expected)
+    assert (restored.compression, restored.count, restored.min, restored.max) == (digest.compression, digest.count, digest.min, digest.max)
+
+    restored = TDigest.from_bytes(digest.to_bytes())
+    assert np.array_equal(restored.quantile(QUANTILES), expected)
+    with pytest.raises(ValueError):
+        TDigest.from_bytes(b'XXXX' + digest.to_bytes()[4:])
+
+
+
+def test_empty_digest_serializes_to_valid_json():
+    data = TDigest().to_dict()
+    assert data['min'] is None and data['max'] is None
+
+    restored = TDigest.from_dict(json.loads(json.dumps(data, allow_nan = False)))
+    assert restored.count == 0
+    restored.update([5.0, 7.0])
+    assert (restored.min, restored.max) == (5.0, 7.0)
+
+
+
+def test_metric_sketch_merge_and_round_trip():
+    rng = np.random.default_rng(41)
+    results = [{'a': a, 'b': b} for a, b in zip(rng.normal(size = 4000), rng.exponential(size = 4000))]
+
+    left, right = MetricQuantileSketch(['a', 'b']), MetricQuantileSketch(['a', 'b'])
+    left.update(results[:2500])
+    right.update(results[2500:])
+    merged = MetricQuantileSketch.from_dict(json.loads(json.dumps(left.merge(right).to_dict(), allow_nan = False)))
+
+    quantiles = merged.quantiles()
+    for metric in ('a', 'b'):
+        values = np.array([result[metric] for result in results])
+        for q, estimate in quantiles[metric].items():
+            assert abs(np.searchsorted(np.sort(values), estimate) / len(values) - q) < 5e-3
+
+    # Merging a sketch with an extra metric adds it
+    extra = MetricQuantileSketch(['c'])
+    extra.update({'c': np.arange(10.0)})
+    merged.merge(extra)
+    assert merged.metrics == ['a', 'b', 'c']
+    assert merged.quantiles([1.0])['c'][1.0] == 9.0
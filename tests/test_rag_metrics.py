@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+import pytest
+
+from whetstone.metrics.text.rag_metrics import (RETRIEVAL_METRICS, calculate_mean_reciprocal_rank, calculate_recall_at_k,
+                                                calculate_retrieval_metrics, pad_ragged)
+
+
+
+KS = [1, 3, 5, 10, 20]
+
+
+
+def _naive_metrics(retrieved, relevant, grades, k, gain):
+    # The textbook per-query definitions, evaluated with Python loops
+    gains = {document: (2 ** grade - 1 if gain == 'exponential' else grade) for document, grade in zip(relevant, grades)}
+    top = retrieved[:k]
+    hits = sum(1 for document in top if gains.get(document, 0) > 0)
+    dcg = sum(gains.get(document, 0) / math.log2(rank + 2) for rank, document in enumerate(top))
+    ideal = sorted(gains.values(), reverse = True)[:k]
+    idcg = sum(value / math.log2(rank + 2) for rank, value in enumerate(ideal))
+    return {
+        'recall': hits / len(relevant) if relevant else math.nan,
+        'precision': hits / k,
+        'hit_rate': float(hits > 0),
+        'mrr': next((1 / (rank + 1) for rank, document in enumerate(top) if gains.get(document, 0) > 0), 0.0),
+        'ndcg': dcg / idcg if idcg > 0 else math.nan
+    }
+
+
+
+@pytest.fixture(scope = 'module')
+def evaluation_set():
+    rng = np.random.default_rng(0)
+    retrieved = [list(rng.choice(50, size = rng.integers(0, 12), replace = False)) for _ in range(300)]
+    relevant = [list(rng.choice(50, size = rng.integers(0, 6), replace = False)) for _ in range(300)]
+    grades = [list(rng.integers(1, 4, size = len(documents))) for documents in relevant]
+    return retrieved, relevant, grades
+
+
+
+@pytest.mark.parametrize('gain', ['linear', 'exponential'])
+def test_per_query_metrics_match_naive_definitions(evaluation_set, gain):
+    retrieved, relevant, grades = evaluation_set
+    results = calculate_retrieval_metrics(pad_ragged(retrieved), pad_ragged(relevant), ks = KS, relevance_scores = pad_ragged(grades, pad_id = 0),
+                                          gain = gain, reduce = None, chunk_size = 37)
+    for query in range(len(retrieved)):
+        for k in KS:
+            expected = _naive_metrics(retrieved[query], relevant[query], grades[query], k, gain)
+            for name in RETRIEVAL_METRICS:
+                value = results[f'{name}@{k}'][query]
+                assert (math.isnan(value) and math.isnan(expected[name])) or value == pytest.approx(expected[name], abs = 1e-12)
+
+
+
+def test_mean_skips_queries_without_relevant_documents(evaluation_set):
+    retrieved, relevant, _ = evaluation_set
+    per_query = calculate_recall_at_k(pad_ragged(retrieved), pad_ragged(relevant), k = 5)
+    means = calculate_retrieval_metrics(pad_ragged(retrieved), pad_ragged(relevant), ks = 5)
+    assert means['recall@5'] == pytest.approx(np.nanmean(per_query))
+    assert calculate_mean_reciprocal_rank(pad_ragged(retrieved), pad_ragged(relevant), k = 5) == pytest.approx(means['mrr@5'])
+
+
+
+def test_string_ids_and_empty_sets():
+    results = calculate_retrieval_metrics(pad_ragged([['a', 'b'], ['c']], pad_id = ''), pad_ragged([['b'], ['z', 'c']], pad_id = ''), ks = 2, pad_id = '',
+                                          reduce = None)
+    assert results['recall@2'].tolist() == [1.0, 0.5]
+    assert results['mrr@2'].tolist() == [0.5, 1.0]
+    empty = calculate_retrieval_metrics(np.zeros((0, 5), dtype = np.int64), np.zeros((0, 3), dtype = np.int64), ks = 1, reduce = None)
+    assert all(len(values) == 0 for values in empty.values())
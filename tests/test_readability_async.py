@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from whetstone.metrics.text.readability_async import AsyncReadabilityScorer, calculate_all_readability_metrics_async
+from whetstone.metrics.text.readability_metrics import calculate_all_readability_metrics, compute_metrics
+
+
+
+class BatchRecordingExecutor(ThreadPoolExecutor):
+    '''
+    Thread pool that records the size of every batch it scores and fails any batch containing `fail_text`.
+    '''
+
+    def __init__(self, fail_text = None):
+        super().__init__(max_workers = 2)
+        self.fail_text = fail_text
+        self.batch_sizes = []
+
+
+    def submit(self, fn, texts, *args, **kwargs):
+        self.batch_sizes.append(len(texts))
+        if self.fail_text in texts:
+            def fn(*_, **__):
+                raise ValueError('unscorable text')
+        return super().submit(fn, texts, *args, **kwargs)
+
+
+
+def test_results_match_batch_scoring_in_order(corpus):
+    with BatchRecordingExecutor() as executor:
+        results = asyncio.run(calculate_all_readability_metrics_async(corpus, executor = executor, batch_size = 16))
+    assert results == calculate_all_readability_metrics(corpus)
+
+    # Every text is scored once, in batches no larger than batch_size
+    assert sum(executor.batch_sizes) == len(corpus)
+    assert max(executor.batch_sizes) <= 16
+    assert len(executor.batch_sizes) < len(corpus)
+
+
+
+def test_selected_metrics(corpus):
+    metrics = ['flesch_kincaid_reading_ease', 'gunning_fog_index']
+
+    async def score():
+        async with AsyncReadabilityScorer(metrics = metrics, batch_size = 8, concurrency = 2) as scorer:
+            return await scorer.score_many(corpus[:40])
+
+    assert asyncio.run(score()) == compute_metrics(corpus[:40], metrics = metrics)
+
+
+
+def test_failing_text_only_fails_its_caller(corpus):
+    texts = corpus[:20] + ['BOOM'] + corpus[20:40]
+
+    async def score(executor):
+        async with AsyncReadabilityScorer(executor = executor, batch_size = 64, max_batch_delay = 0.05) as scorer:
+            return await asyncio.gather(*(scorer.score(text) for text in texts), return_exceptions = True)
+
+    with BatchRecordingExecutor(fail_text = 'BOOM') as executor:
+        results = asyncio.run(score(executor))
+
+    expected = calculate_all_readability_metrics(corpus[:40])
+    assert isinstance(results[20], ValueError)
+    assert results[:20] + results[21:] == expected
+
+    # The whole batch was tried first, then each of its texts on its own
+    assert executor.batch_sizes[0] == len(texts)
+    assert executor.batch_sizes[1:] == [1] * len(texts)
+
+
+
+def test_invalid_text_is_rejected_before_queueing(corpus):
+    async def score():
+        async with AsyncReadabilityScorer() as scorer:
+            with pytest.raises(TypeError):
+                await scorer.score(None)
+            results = await scorer.score_many(corpus[:5])
+        with pytest.raises(RuntimeError):
+            await scorer.score(corpus[0])
+        return results
+
+    assert asyncio.run(score()) == calculate_all_readability_metrics(corpus[:5])
@@ -0,0 +1,42 @@
+import math
+
+import numpy as np
+
+from whetstone.metrics.text import readability_columnar
+from whetstone.metrics.text.readability_columnar import calculate_all_readability_metrics_columnar, score_text_column
+from whetstone.metrics.text.readability_metrics import calculate_all_readability_metrics, compute_metrics, resolve_metric_dependencies
+
+
+
+def test_columnar_metrics_match_per_text_metrics(corpus):
+    columns = calculate_all_readability_metrics_columnar(corpus)
+    for i, row in enumerate(calculate_all_readability_metrics(corpus)):
+        assert {name: float(values[i]) for name, values in columns.items()} == row
+
+
+
+def test_score_text_column_scores_missing_values_as_nan(corpus):
+    texts = np.array([corpus[0], None, corpus[1], float('nan')], dtype = object)
+    columns = score_text_column(texts, metrics = ['lix_readability_score'], chunk_size = 3)
+    expected = compute_metrics([corpus[0], corpus[1]], metrics = ['lix_readability_score'])
+    assert columns['lix_readability_score'][[0, 2]].tolist() == [row['lix_readability_score'] for row in expected]
+    assert math.isnan(columns['lix_readability_score'][1]) and math.isnan(columns['lix_readability_score'][3])
+
+
+
+def test_score_text_column_computes_only_the_needed_fields(corpus, monkeypatch):
+    requested = []
+    compute_text_stats = readability_columnar.compute_text_stats
+
+    def recording_compute_text_stats(text, fields = None):
+        requested.append(fields)
+        return compute_text_stats(text, fields = fields)
+
+    monkeypatch.setattr(readability_columnar, 'compute_text_stats', recording_compute_text_stats)
+    metrics = ['lix_readability_score', 'rix_readability_score', 'strain_index']
+    columns = score_text_column(corpus, metrics = metrics)
+
+    assert requested and all(fields == resolve_metric_dependencies(metrics) for fields in requested)
+    assert 'num_syllables' not in requested[0]
+    for i, row in enumerate(compute_metrics(corpus, metrics = metrics)):
+        assert {name: float(columns[name][i]) for name in metrics} == row
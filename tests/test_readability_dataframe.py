@@ -0,0 +1,80 @@
+import math
+
+import pytest
+
+from whetstone.metrics.text import readability_dataframe
+from whetstone.metrics.text.readability_metrics import calculate_all_readability_metrics, compute_metrics
+
+
+
+METRICS = ['flesch_kincaid_grade_level', 'lix_readability_score', 'readability_consensus_grade']
+
+
+
+def _assert_rows_match(rows, expected):
+    assert len(rows) == len(expected)
+    for row, expected_row in zip(rows, expected):
+        if expected_row is None:
+            assert all(math.isnan(value) for value in row.values())
+        else:
+            assert row == expected_row
+
+
+
+def test_pandas_series_scores_match_per_text_scores(corpus):
+    pd = pytest.importorskip('pandas')
+    assert 'pandas' in readability_dataframe.registered_libraries
+    series = pd.Series(corpus, index = range(100, 100 + len(corpus)))
+
+    scores = series.readability.scores(chunk_size = 17)
+    assert scores.index.equals(series.index)
+    assert (scores.dtypes == 'float64').all()
+    _assert_rows_match(scores.to_dict('records'), calculate_all_readability_metrics(corpus))
+
+    # Missing texts score as NaN, and the prefix applies to every column
+    texts = [corpus[0], None, corpus[1]]
+    scores = pd.Series(texts).readability.scores(metrics = METRICS, prefix = 'response_')
+    assert list(scores.columns) == ['response_' + name for name in METRICS]
+    rows = [{name[len('response_'):]: value for name, value in row.items()} for row in scores.to_dict('records')]
+    expected = compute_metrics([corpus[0], corpus[1]], metrics = METRICS)
+    _assert_rows_match(rows, [expected[0], None, expected[1]])
+
+
+
+def test_pandas_frame_add_scores(corpus):
+    pd = pytest.importorskip('pandas')
+    frame = pd.DataFrame({'id': range(len(corpus)), 'response': corpus})
+
+    assert frame.readability.add_scores('response', metrics = METRICS, chunk_size = 50) is frame
+    assert list(frame.columns) == ['id', 'response'] + METRICS
+    _assert_rows_match(frame[METRICS].to_dict('records'), compute_metrics(corpus, metrics = METRICS))
+
+
+
+def test_polars_series_and_frame_scores_match_per_text_scores(corpus):
+    pl = pytest.importorskip('polars')
+    assert 'polars' in readability_dataframe.registered_libraries
+    expected = compute_metrics(corpus, metrics = METRICS)
+
+    scores = pl.Series('response', corpus).readability.scores(metrics = METRICS, chunk_size = 17)
+    assert scores.columns == METRICS
+    _assert_rows_match(scores.to_dicts(), expected)
+
+    frame = pl.DataFrame({'id': range(len(corpus)), 'response': corpus})
+    scored = frame.readability.with_scores('response', metrics = METRICS, prefix = 'r_')
+    assert scored.columns == ['id', 'response'] + ['r_' + name for name in METRICS]
+    _assert_rows_match([{name[2:]: value for name, value in row.items()} for row in scored.drop('id', 'response').to_dicts()], expected)
+
+
+
+def test_polars_lazy_frame_scores_in_batches(corpus):
+    pl = pytest.importorskip('polars')
+    expected = compute_metrics(corpus, metrics = METRICS)
+
+    texts = corpus[:3] + [None] + corpus[3:]
+    lazy = pl.LazyFrame({'response': texts}).readability.with_scores('response', metrics = METRICS, chunk_size = 11)
+    rows = lazy.collect().drop('response').to_dicts()
+    _assert_rows_match(rows, expected[:3] + [None] + expected[3:])
+
+    struct = pl.DataFrame({'response': corpus}).select(pl.col('response').readability.score(metrics = METRICS))
+    _assert_rows_match([row['response'] for row in struct.to_dicts()], expected)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from whetstone.metrics.text.readability_index import DocumentIndex
+from whetstone.metrics.text.readability_metrics import calculate_all_readability_metrics
+from whetstone.utils.text.text_stats import compute_text_stats
+
+
+
+@pytest.fixture(scope = 'module')
+def documents(corpus):
+    return [text for text in corpus if len(DocumentIndex(text).spans) >= 4][:8]
+
+
+
+def test_window_stats_match_scoring_the_window_text(documents):
+    for text in documents:
+        index = DocumentIndex(text)
+        num_sentences = len(index.spans)
+        for start in range(num_sentences):
+            for stop in range(start + 1, min(start + 4, num_sentences) + 1):
+                window_text = index.window_text(start, stop)
+                assert index.window_stats(start, stop) == compute_text_stats(window_text)
+                assert index.score(start, stop) == calculate_all_readability_metrics(window_text)[0]
+
+
+
+def test_whole_document_matches_scoring_the_text(documents):
+    for text in documents:
+        index = DocumentIndex(text)
+        assert index.window_stats(0, len(index.spans)) == compute_text_stats(text)
+
+
+
+def test_profiles_and_sections_match_single_windows(documents):
+    index = DocumentIndex(documents[0])
+    profile = index.sliding_window_profile(3, step = 2)
+    starts = range(0, len(index.spans) - 2, 2)
+    for name, values in profile.items():
+        assert values.tolist() == [index.score(start, start + 3)[name] for start in starts]
+
+    sections = [(0, 2), (2, len(index.spans))]
+    scores = index.score_sections(sections, metrics = ['smog_index'])
+    assert scores['smog_index'].tolist() == [index.score(start, stop)['smog_index'] for start, stop in sections]
+
+
+
+def test_invalid_ranges_are_rejected(documents):
+    index = DocumentIndex(documents[0])
+    with pytest.raises(ValueError):
+        index.window_stats(2, 1)
+    with pytest.raises(ValueError):
+        index.window_stats(0, len(index.spans) + 1)
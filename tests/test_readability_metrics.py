@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from whetstone.metrics.text.readability_metrics import calculate_all_readability_metrics, iter_readability_metrics
+from whetstone.utils.parallel import CHUNKS_PER_WORKER, MIN_ITEMS_PER_WORKER
+
+
+
+TEXTS = [
+    'The cat sat on the mat. It was happy!',
+    'Dr. Smith arrived at 5 p.m. yesterday. Nobody expected him.',
+    'Extraordinarily complicated vocabulary obfuscates comprehension considerably.',
+    ''
+]
+
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, max_workers):
+        super().__init__(max_workers = max_workers)
+        self.num_batches = 0
+
+
+    def map(self, func, *iterables, **kwargs):
+        chunks = list(iterables[0])
+        self.num_batches += 1
+        return super().map(func, chunks, **kwargs)
+
+
+
+def test_iter_readability_metrics_matches_batch_scoring():
+    texts = TEXTS * 50
+    assert list(iter_readability_metrics(iter(texts), batch_size = 7)) == calculate_all_readability_metrics(texts)
+
+
+
+def test_iter_readability_metrics_default_batches_fill_every_worker():
+    # 8 workers get a full batch of chunks each rather than sharing fixed 1,000-text batches
+    texts = (TEXTS * 8 * MIN_ITEMS_PER_WORKER * CHUNKS_PER_WORKER)[:8 * MIN_ITEMS_PER_WORKER * CHUNKS_PER_WORKER]
+    with CountingExecutor(max_workers = 8) as executor:
+        results = list(iter_readability_metrics(iter(texts), n_jobs = 8, executor = executor))
+        assert executor.num_batches == 1
+    assert results == calculate_all_readability_metrics(texts)
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from whetstone.metrics.text.readability_metrics import compute_metrics
+from whetstone.metrics.text.readability_parquet import iter_scored_record_batches, score_parquet
+
+
+
+METRICS = ['flesch_kincaid_grade_level', 'gunning_fog_index', 'lix_readability_score']
+
+
+
+@pytest.fixture
+def parquet_corpus(corpus, tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet
+
+    path = tmp_path / 'responses.parquet'
+    table = pa.table({'id': list(range(len(corpus))), 'response': corpus})
+    pyarrow.parquet.write_table(table, path, row_group_size = 37)
+    return str(path)
+
+
+
+def test_score_parquet_matches_per_text_scores(corpus, parquet_corpus, tmp_path):
+    import pyarrow.parquet
+
+    destination = str(tmp_path / 'scores.parquet')
+    assert score_parquet(parquet_corpus, destination, 'response', metrics = METRICS, keep_columns = ['id'], batch_size = 25) == len(corpus)
+
+    scored = pyarrow.parquet.read_table(destination)
+    assert scored.column_names == ['id'] + METRICS
+    assert scored.column('id').to_pylist() == list(range(len(corpus)))
+    assert scored.select(METRICS).to_pylist() == compute_metrics(corpus, metrics = METRICS)
+
+
+
+def test_kept_text_column_is_not_duplicated(corpus, parquet_corpus, tmp_path):
+    import pyarrow.parquet
+
+    destination = str(tmp_path / 'scores.parquet')
+    score_parquet(parquet_corpus, destination, 'response', metrics = METRICS, keep_columns = ['id', 'response', 'id'], prefix = 'r_')
+
+    scored = pyarrow.parquet.read_table(destination)
+    assert scored.column_names == ['id', 'response'] + ['r_' + name for name in METRICS]
+    assert scored.column('response').to_pylist() == corpus
+
+
+
+def test_concurrent_batches_are_yielded_in_order(corpus, parquet_corpus):
+    with ThreadPoolExecutor(max_workers = 3) as executor:
+        batches = list(iter_scored_record_batches(parquet_corpus, 'response', metrics = METRICS, keep_columns = ['id'],
+                                                  batch_size = 10, executor = executor, max_in_flight = 3))
+    assert len(batches) > 3
+    rows = [row for batch in batches for row in batch.to_pylist()]
+    assert [row.pop('id') for row in rows] == list(range(len(corpus)))
+    assert rows == compute_metrics(corpus, metrics = METRICS)
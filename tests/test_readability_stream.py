@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from whetstone.metrics.text.readability_metrics import calculate_all_readability_metrics
+from whetstone.metrics.text.readability_stream import IncrementalReadabilityScorer, iter_incremental_readability_metrics
+from whetstone.utils.text.text_stats import compute_text_stats
+
+
+
+def _random_chunks(text, rng):
+    # Cutting the text at random points, including inside words, whitespace runs, and abbreviations
+    cuts = sorted(rng.sample(range(1, len(text)), min(len(text) - 1, rng.randint(1, 12)))) if len(text) > 1 else []
+    return [text[start:stop] for start, stop in zip([0] + cuts, cuts + [len(text)])]
+
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_stats_match_the_text_so_far(corpus, seed):
+    rng = random.Random(seed)
+    for text in corpus[::3]:
+        scorer = IncrementalReadabilityScorer()
+        received = ''
+        for chunk in _random_chunks(text, rng):
+            scorer.append(chunk)
+            received += chunk
+            assert scorer.stats == compute_text_stats(received)
+        assert scorer.length == len(text)
+
+
+
+def test_boundary_cases_split_one_character_at_a_time():
+    for text in ['Dr. Smith met Mr. Jones, i.e. the boss.  He left?  Yes!  ', 'Ünïcödé wörds. Naïve café!', ' \n', 'A. B. C.']:
+        scorer = IncrementalReadabilityScorer()
+        for i, character in enumerate(text):
+            scorer.append(character)
+            assert scorer.stats == compute_text_stats(text[:i + 1])
+
+
+
+def test_scores_match_scoring_from_scratch(corpus):
+    text = corpus[-1] + ' ' + corpus[0]
+    chunks = _random_chunks(text, random.Random(7))
+    results = list(iter_incremental_readability_metrics(chunks, metrics = ['flesch_kincaid_grade_level', 'gunning_fog_index']))
+    received = ''
+    for chunk, result in zip(chunks, results):
+        received += chunk
+        expected = calculate_all_readability_metrics(received)[0]
+        assert result == {name: expected[name] for name in result}
+
+
+
+def test_reset_starts_a_new_stream():
+    scorer = IncrementalReadabilityScorer()
+    scorer.extend(['First text. ', 'More'])
+    scorer.reset()
+    scorer.append('Second.')
+    assert scorer.stats == compute_text_stats('Second.')
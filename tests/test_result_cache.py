@@ -0,0 +1,106 @@
+import pytest
+
+from whetstone.metrics.text.readability_metrics import compute_metrics
+from whetstone.utils import result_cache
+from whetstone.utils.result_cache import VERSIONED_MODULES, ResultCache, default_cache_version
+from whetstone.utils.text.lexicon import build_lexicon
+from whetstone.utils.text.syllable_counter import default_syllable_counter
+
+
+
+class FakeClock:
+    def __init__(self, now = 1_000.0):
+        self.now = now
+
+
+    def time(self):
+        return self.now
+
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(result_cache.time, 'time', clock.time)
+    return clock
+
+
+
+@pytest.fixture
+def restore_default_lexicon():
+    lexicon = default_syllable_counter.lexicon
+    yield
+    default_syllable_counter.set_lexicon(lexicon)
+
+
+
+def test_versioned_modules_cover_the_syllable_counter():
+    assert 'whetstone.utils.text.syllable_counter' in VERSIONED_MODULES
+    assert 'whetstone.utils.text.lexicon' in VERSIONED_MODULES
+
+
+
+def test_results_for_different_metrics_are_merged():
+    with ResultCache() as cache:
+        cache.put_many(['a text'], [{'lix_readability_score': 1.0}])
+        cache.put_many(['a text'], [{'rix_readability_score': 2.0}])
+        assert cache.get_many(['a text', 'another'], ['lix_readability_score', 'rix_readability_score']) == [
+            {'lix_readability_score': 1.0, 'rix_readability_score': 2.0}, None]
+        assert len(cache) == 1
+
+
+
+def test_merging_does_not_renew_the_age_of_an_entry(clock):
+    with ResultCache(max_age_seconds = 100) as cache:
+        cache.put_many(['a text'], [{'lix_readability_score': 1.0}])
+        clock.now += 60
+        cache.put_many(['a text'], [{'rix_readability_score': 2.0}])
+        clock.now += 60
+        assert cache.get_many(['a text'], ['lix_readability_score']) == [None]
+
+        # A fresh value stored after expiry is not hidden behind the expired row's age
+        cache.put_many(['a text'], [{'lix_readability_score': 1.0}])
+        assert cache.get_many(['a text'], ['lix_readability_score']) == [{'lix_readability_score': 1.0}]
+
+
+
+def test_max_entries_counts_only_the_current_version(tmp_path, clock):
+    path = str(tmp_path / 'cache.db')
+    with ResultCache(path, version = 'old') as cache:
+        cache.put_many(['one', 'two', 'three'], [{'lix_readability_score': float(i)} for i in range(3)])
+
+    # Stale entries kept alongside the current version neither fill it up nor get evicted in its place
+    with ResultCache(path, version = 'new', max_entries = 2, purge_stale = False) as cache:
+        for i, text in enumerate(['four', 'five', 'six']):
+            clock.now += 1
+            cache.put_many([text], [{'lix_readability_score': float(i)}])
+        assert len(cache) == 2
+        assert cache.get_many(['four', 'five', 'six'], ['lix_readability_score']) == [
+            None, {'lix_readability_score': 1.0}, {'lix_readability_score': 2.0}]
+
+    with ResultCache(path, version = 'old', purge_stale = False) as cache:
+        assert len(cache) == 3
+
+
+
+def test_cached_results_match_scoring(tmp_path):
+    texts = ['The cat sat on the mat.', 'Photosynthesis transforms luminous energy.', 'The cat sat on the mat.']
+    with ResultCache(str(tmp_path / 'cache.db')) as cache:
+        assert compute_metrics(texts, cache = cache) == compute_metrics(texts)
+        assert compute_metrics(texts, cache = cache) == compute_metrics(texts)
+        assert cache.hits == 3 and cache.misses == 3
+
+
+
+def test_version_follows_the_default_lexicon(tmp_path, restore_default_lexicon):
+    default_syllable_counter.set_lexicon(None)
+    with ResultCache() as cache:
+        assert cache.version == default_cache_version()
+        cache.put_many(['hello'], [{'flesch_kincaid_grade_level': 1.0}])
+
+        default_syllable_counter.set_lexicon(build_lexicon(str(tmp_path / 'lexicon.bin'), {'hello': 5}))
+        assert cache.version.startswith(default_cache_version() + '-')
+        assert cache.get_many(['hello'], ['flesch_kincaid_grade_level']) == [None]
+
+    with ResultCache(version = 'pinned') as cache:
+        assert cache.version == 'pinned'
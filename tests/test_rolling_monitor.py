@@ -0,0 +1,101 @@
+import math
+
+import numpy as np
+import pytest
+
+from whetstone.drift.rolling_monitor import DriftAlert, RollingDriftMonitor, RollingWindowStats
+
+
+
+def test_count_window_matches_numpy():
+    values = np.random.default_rng(3).normal(50.0, 12.0, 500)
+    window = RollingWindowStats(window_size = 40)
+    for i, value in enumerate(values):
+        window.update(value, timestamp = float(i))
+        expected = values[max(i - 39, 0):i + 1]
+        assert window.count == len(expected)
+        assert window.mean == pytest.approx(expected.mean(), rel = 1e-9)
+        assert window.variance == pytest.approx(expected.var(ddof = 1) if len(expected) > 1 else 0.0, rel = 1e-7, abs = 1e-9)
+        assert window.min == expected.min()
+        assert window.max == expected.max()
+
+
+
+def test_time_window_expiry():
+    window = RollingWindowStats(window_seconds = 10.0)
+    for timestamp, value in [(0.0, 1.0), (4.0, 9.0), (8.0, 2.0), (12.0, 4.0)]:
+        window.update(value, timestamp = timestamp)
+
+    # The value at t=0 is at least 10 seconds old at t=12
+    summary = window.summary()
+    assert summary['count'] == 3
+    assert summary['mean'] == pytest.approx(5.0)
+    assert summary['variance'] == pytest.approx(np.var([9.0, 2.0, 4.0], ddof = 1))
+    assert (summary['min'], summary['max']) == (2.0, 9.0)
+
+    window.expire(30.0)
+    summary = window.summary()
+    assert summary['count'] == 0
+    assert math.isnan(summary['mean']) and math.isnan(summary['min']) and math.isnan(summary['max'])
+
+
+
+def test_invalid_windows_are_rejected():
+    with pytest.raises(ValueError):
+        RollingWindowStats(window_size = 0)
+    with pytest.raises(ValueError):
+        RollingWindowStats(window_seconds = -1.0)
+    with pytest.raises(ValueError):
+        RollingDriftMonitor({'score': (0.0, 1.0)})
+
+
+
+def test_alerts_fire_on_leaving_the_band():
+    received = []
+    monitor = RollingDriftMonitor({'score': (4.0, 6.0)}, window_size = 4, min_count = 4, on_alert = received.append)
+
+    # Nothing is checked until the window holds min_count values
+    assert monitor.update_many([{'score': 100.0}] * 3, timestamps = [0.0, 1.0, 2.0]) == []
+    assert monitor.update({'score': 100.0}, timestamp = 3.0) == [DriftAlert('score', 100.0, 4.0, 6.0, 4, 3.0)]
+    assert monitor.update_many([{'score': 5.0}] * 8, timestamps = range(4, 12)) == []
+
+    # The window mean crosses 6 once, and only the crossing alerts
+    alerts = monitor.update_many([{'score': 9.0}] * 4, timestamps = range(12, 16))
+    assert alerts == [DriftAlert('score', 7.0, 4.0, 6.0, 4, 13)]
+    assert received == [DriftAlert('score', 100.0, 4.0, 6.0, 4, 3.0)] + alerts
+
+    # Returning to the band re-arms the alert
+    assert monitor.update_many([{'score': 5.0}] * 4, timestamps = range(16, 20)) == []
+    assert len(monitor.update_many([{'score': 0.0}] * 4, timestamps = range(20, 24))) == 1
+
+
+
+def test_missing_metrics_are_skipped():
+    monitor = RollingDriftMonitor({'a': (0.0, 1.0), 'b': (0.0, 1.0)}, window_size = 10, min_count = 1)
+    monitor.update({'a': 0.5}, timestamp = 0.0)
+    summary = monitor.summary()
+    assert summary['a']['count'] == 1
+    assert summary['b']['count'] == 0
+
+
+
+def test_from_baseline_bands():
+    rng = np.random.default_rng(5)
+    baseline = [{'a': a, 'b': b} for a, b in zip(rng.normal(10.0, 2.0, 200), rng.normal(-3.0, 0.5, 200))]
+
+    monitor = RollingDriftMonitor.from_baseline(baseline, num_std = 2.0, window_size = 25)
+    for metric in ('a', 'b'):
+        values = np.array([result[metric] for result in baseline])
+        half_width = 2.0 * values.std(ddof = 1) / 5.0
+        lower, upper = monitor.bands[metric]
+        assert lower == pytest.approx(values.mean() - half_width)
+        assert upper == pytest.approx(values.mean() + half_width)
+
+    # Time-only windows use the raw standard deviation, and `metrics` restricts the monitored metrics
+    monitor = RollingDriftMonitor.from_baseline(baseline, metrics = ['a'], window_seconds = 60.0)
+    values = np.array([result['a'] for result in baseline])
+    assert list(monitor.bands) == ['a']
+    assert monitor.bands['a'][1] - monitor.bands['a'][0] == pytest.approx(6.0 * values.std(ddof = 1))
+
+    with pytest.raises(ValueError):
+        RollingDriftMonitor.from_baseline([], window_size = 10)
@@ -0,0 +1,56 @@
+import pytest
+
+from whetstone.utils.text.syllable_counter import SyllableCounter
+from whetstone.utils.text.text_parsers import count_syllables
+
+
+
+def test_counts_match_the_heuristic():
+    counter = SyllableCounter()
+    words = ['hello', 'extraordinary', 'the', 'naïve', 'rhythm', 'queue']
+    assert counter.count_words(words) == {word: count_syllables(word) for word in words}
+    assert counter.total_syllables(words + words) == 2 * sum(count_syllables(word) for word in words)
+
+
+
+def test_hits_and_misses_are_counted():
+    counter = SyllableCounter()
+    counter.count_words(['alpha', 'beta', 'alpha'])
+    assert counter.cache_info() == {'hits': 0, 'misses': 2, 'evictions': 0, 'currsize': 2, 'maxsize': 100_000}
+    counter.count('alpha')
+    counter.count_frequencies({'beta': 5, 'gamma': 1})
+    assert counter.cache_info() == {'hits': 2, 'misses': 3, 'evictions': 0, 'currsize': 3, 'maxsize': 100_000}
+
+
+
+def test_least_recently_used_word_is_evicted_at_maxsize():
+    counter = SyllableCounter(maxsize = 2)
+    counter.count('alpha')
+    counter.count('beta')
+
+    # Using 'alpha' again makes 'beta' the least recently used word, so 'gamma' evicts it
+    counter.count('alpha')
+    counter.count('gamma')
+    info = counter.cache_info()
+    assert (info['currsize'], info['evictions']) == (2, 1)
+
+    counter.count('alpha')
+    assert counter.cache_info()['hits'] == 2
+    counter.count('beta')
+    assert counter.cache_info()['misses'] == 4
+
+
+
+def test_cache_clear_resets_the_statistics():
+    counter = SyllableCounter(maxsize = 1)
+    for word in ['one', 'two', 'one']:
+        counter.count(word)
+    assert counter.cache_info()['evictions'] == 2
+    counter.cache_clear()
+    assert counter.cache_info() == {'hits': 0, 'misses': 0, 'evictions': 0, 'currsize': 0, 'maxsize': 1}
+
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        SyllableCounter(maxsize = 0)
@@ -0,0 +1,46 @@
+import pytest
+import reference_readability
+
+from whetstone.metrics.text.readability_metrics import calculate_all_readability_metrics
+from whetstone.utils import instrumentation
+from whetstone.utils.text.text_parsers import scan_text, split_words, tokenize_sentence
+from whetstone.utils.text.text_stats import ALL_TEXT_STATS_FIELDS, compute_text_stats
+
+
+
+def test_fused_sentence_split_matches_regex(corpus):
+    for text in corpus:
+        assert tokenize_sentence(text) == tokenize_sentence(text, mode = 'regex') == reference_readability.tokenize_sentence(text)
+
+
+
+def test_scan_text_matches_the_separate_tokenizers(corpus):
+    for text in corpus:
+        scan = scan_text(text)
+        assert len(scan.sentence_boundaries) + 1 == len(tokenize_sentence(text))
+        assert scan.words == split_words(text)
+        assert scan.num_characters == sum(map(len, scan.words))
+
+
+
+def test_all_metrics_match_the_reference(corpus):
+    assert calculate_all_readability_metrics(corpus) == reference_readability.calculate_all_readability_metrics(corpus)
+
+
+
+@pytest.mark.parametrize('field', sorted(ALL_TEXT_STATS_FIELDS))
+def test_single_field_matches_full_stats(corpus, field):
+    for text in corpus:
+        assert getattr(compute_text_stats(text, fields = [field]), field) == getattr(compute_text_stats(text), field)
+
+
+
+def test_instrumented_stages_are_timed_separately():
+    stages = []
+    callback = lambda stage, seconds: stages.append(stage)
+    instrumentation.register_callback(callback)
+    try:
+        compute_text_stats('One sentence here. And another one.')
+    finally:
+        instrumentation.unregister_callback(callback)
+    assert stages == ['tokenize_sentence', 'word_split', 'count_syllables', 'aggregate_counts']
@@ -1,2 +1,87 @@
-from .utils.text.text_parsers import *
-from .metrics.text.readability_metrics import *
\ No newline at end of file
+import importlib
+
+
+
+# Mapping each public name to the submodule that defines it. Submodules (and their dependencies, such as `regex`
+# and `numpy`) are only imported the first time one of their names is accessed, which keeps `import whetstone` fast.
+_LAZY_EXPORTS = {
+    'whetstone.utils.text.text_parsers': ['TextScan', 'scan_text', 'find_sentence_boundaries', 'tokenize_sentence', 'split_words',
+                                          'count_syllables'],
+    'whetstone.utils.text.lexicon': ['Lexicon', 'build_lexicon', 'load_cmudict_syllables'],
+    'whetstone.utils.text.syllable_counter': ['SyllableCounter', 'default_syllable_counter'],
+    'whetstone.utils.text.text_stats': ['TextStats', 'ALL_TEXT_STATS_FIELDS', 'compute_text_stats'],
+    'whetstone.utils.text.corpus_reader': ['CORPUS_FORMATS', 'CorpusReader', 'iter_byte_range'],
+    'whetstone.utils.result_cache': ['ResultCache', 'default_cache_version'],
+    'whetstone.metrics.registry': ['METRIC_REGISTRY', 'list_metrics', 'register_metric', 'get_metric'],
+    'whetstone.metrics.text.readability_metrics': [
+        'READABILITY_FORMULAS',
+        'calculate_readability_metrics_from_stats',
+        'calculate_flesch_kincaid_reading_ease',
+        'calculate_flesch_kincaid_grade_level',
+        'calculate_gunning_fog_index',
+        'calculate_coleman_liau_index',
+        'calculate_automated_readability_index',
+        'calculate_smog_index',
+        'calculate_dale_chall_readability_score',
+        'calculate_spache_readability_formula',
+        'calculate_linsear_write_formula',
+        'calculate_forcast_readability_formula',
+        'calculate_raygor_readability_estimate',
+        'calculate_lix_readability_score',
+        'calculate_rix_readability_score',
+        'calculate_strain_index',
+        'calculate_new_dale_chall_readability_score',
+        'calculate_readability_consensus_grade',
+        'calculate_all_readability_metrics',
+        'iter_readability_metrics',
+        'METRIC_DEPENDENCIES',
+        'resolve_metric_dependencies',
+        'compute_metrics'
+    ],
+    'whetstone.metrics.text.readability_async': ['AsyncReadabilityScorer', 'calculate_all_readability_metrics_async'],
+    'whetstone.metrics.text.readability_index': ['DocumentIndex'],
+    'whetstone.metrics.text.readability_stream': ['IncrementalReadabilityScorer', 'iter_incremental_readability_metrics'],
+    'whetstone.metrics.text.rag_metrics': [
+        'RETRIEVAL_METRICS',
+        'pad_ragged',
+        'retrieval_relevance',
+        'calculate_retrieval_metrics',
+        'calculate_retrieval_metrics_from_labels',
+        'calculate_recall_at_k',
+        'calculate_precision_at_k',
+        'calculate_hit_rate_at_k',
+        'calculate_mean_reciprocal_rank',
+        'calculate_ndcg_at_k',
+        'minhash_num_perm',
+        'MinHashSignatures',
+        'MinHasher',
+        'estimate_jaccard',
+        'estimate_containment',
+        'MinHashLSHIndex',
+        'calculate_ngram_overlap',
+        'flag_ungrounded_answers'
+    ],
+    'whetstone.drift.rolling_monitor': ['DriftAlert', 'RollingWindowStats', 'RollingDriftMonitor'],
+    'whetstone.drift.distribution_drift': ['DRIFT_STATISTICS', 'MetricDriftDetector', 'calculate_distribution_drift'],
+    'whetstone.drift.quantile_sketch': ['TDigest', 'MetricQuantileSketch'],
+    'whetstone.drift.embedding_drift': ['EMBEDDING_DRIFT_STATISTICS', 'EmbeddingDriftDetector', 'calculate_embedding_drift', 'median_heuristic_gamma']
+}
+
+_EXPORT_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+__all__ = list(_EXPORT_MODULES)
+
+
+
+def __getattr__(name):
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'whetstone' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,6 @@
+import sys
+from whetstone.cli import main
+
+
+
+sys.exit(main())
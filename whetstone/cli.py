@@ -0,0 +1,232 @@
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+
+
+
+INPUT_FORMATS = ('jsonl', 'csv', 'text')
+
+
+
+def _infer_format(path: str) -> str:
+    # Inferring the input format from the file extension, treating anything unrecognized as plain text
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if extension in ('.csv', '.tsv'):
+        return 'csv'
+    return 'text'
+
+
+
+def _iter_line_records(file, format: str, text_field: str) -> Iterator[Tuple[dict, Optional[str], int]]:
+    # Yielding (record, text, byte offset after the record) for JSONL and plain text, read as binary to track offsets
+    offset = file.tell() if file.seekable() else 0
+    for line in iter(file.readline, b''):
+        offset += len(line)
+        text = line.decode('utf-8').rstrip('\n').rstrip('\r')
+        if format == 'text':
+            yield {}, text, offset
+            continue
+        if not text.strip():
+            continue
+        record = json.loads(text)
+        value = record.get(text_field) if isinstance(record, dict) else None
+        yield record, value if isinstance(value, str) else None, offset
+
+
+
+def _iter_csv_records(file, text_field: str, delimiter: str) -> Iterator[Tuple[dict, Optional[str], int]]:
+    # CSV fields can span lines, so CSV checkpoints record a count of rows rather than a byte offset
+    for row in csv.DictReader(io.TextIOWrapper(file, encoding = 'utf-8', newline = ''), delimiter = delimiter):
+        yield row, row.get(text_field), -1
+
+
+
+def _load_checkpoint(path: str) -> dict:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {'records': 0, 'offset': 0}
+
+
+
+def _save_checkpoint(path: str, records: int, offset: int) -> None:
+    # Replacing the checkpoint atomically so an interrupted write never leaves it unreadable
+    temporary_path = f'{path}.tmp'
+    with open(temporary_path, 'w') as file:
+        json.dump({'records': records, 'offset': offset}, file)
+    os.replace(temporary_path, path)
+
+
+
+def _iter_scored_batches(records: Iterator[Tuple[dict, Optional[str], int]],
+                         metrics: List[str],
+                         batch_size: int,
+                         executor: Optional[Executor] = None,
+                         max_in_flight: int = 1) -> Iterator[Tuple[list, List[dict]]]:
+    # Yielding (batch, metrics of its texts) in input order, scoring each batch in a worker when there is an executor
+    from whetstone.metrics.text.readability_metrics import compute_metrics
+
+    pending = deque()
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        texts = [text for _, text, _ in batch if text is not None]
+        if executor is None:
+            yield batch, compute_metrics(texts, metrics)
+            continue
+
+        # Keeping a bounded window of batches scoring in the workers while the next ones are read and the finished ones written
+        pending.append((batch, executor.submit(compute_metrics, texts, metrics)))
+        if len(pending) >= max_in_flight:
+            batch, future = pending.popleft()
+            yield batch, future.result()
+    while pending:
+        batch, future = pending.popleft()
+        yield batch, future.result()
+
+
+
+def score_command(args: argparse.Namespace) -> int:
+    '''
+    Runs `whetstone score`: streams records from a JSONL, CSV, or text file, scores them in ordered batches, and
+    writes one JSON line of metrics per record.
+
+    With `--jobs`, whole batches are scored in worker processes, with up to two batches per worker in flight while
+    the input is read and finished batches are written and checkpointed in order.
+    '''
+    from whetstone.metrics.text.readability_metrics import _validate_metric_names
+    from whetstone.utils.parallel import get_process_pool, resolve_n_jobs
+
+    metrics = _validate_metric_names(args.metrics.split(',') if args.metrics else None)
+    format = args.format or ('text' if args.input == '-' else _infer_format(args.input))
+    keep_fields = args.keep.split(',') if args.keep else []
+    num_workers = resolve_n_jobs(args.jobs)
+
+    # Resuming from the checkpoint: seeking straight to the byte offset when the input allows it, otherwise skipping records
+    checkpoint = _load_checkpoint(args.checkpoint) if args.checkpoint and args.resume else {'records': 0, 'offset': 0}
+    records_done = checkpoint['records']
+    input_file = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    skip = records_done
+    if format != 'csv' and input_file.seekable() and checkpoint['offset']:
+        input_file.seek(checkpoint['offset'])
+        skip = 0
+    if format == 'csv':
+        records = _iter_csv_records(input_file, args.text_field, '\t' if args.input.endswith('.tsv') else ',')
+    else:
+        records = _iter_line_records(input_file, format, args.text_field)
+    records = islice(records, skip, None)
+
+    if args.output in (None, '-'):
+        output_file = sys.stdout
+    else:
+        output_file = open(args.output, 'a' if args.resume else 'w', encoding = 'utf-8')
+
+    started = last_report = time.perf_counter()
+    scored = 0
+    offset = checkpoint['offset']
+    executor = get_process_pool(num_workers) if num_workers > 1 else None
+    try:
+        for batch, results in _iter_scored_batches(records, metrics, args.batch_size, executor, max_in_flight = 2 * num_workers):
+            results = iter(results)
+            lines = []
+            for i, (record, text, _) in enumerate(batch):
+                output = {'record': records_done + i}
+                output.update((field, record.get(field)) for field in keep_fields)
+                output.update(next(results) if text is not None else dict.fromkeys(metrics))
+                lines.append(json.dumps(output))
+            output_file.write('\n'.join(lines) + '\n')
+            output_file.flush()
+
+            records_done += len(batch)
+            scored += len(batch)
+            offset = batch[-1][2] if batch[-1][2] >= 0 else 0
+            if args.checkpoint:
+                _save_checkpoint(args.checkpoint, records_done, offset)
+
+            now = time.perf_counter()
+            if not args.quiet and now - last_report >= args.progress_interval:
+                print(f'whetstone: scored {scored:,} records ({scored / (now - started):,.0f} records/s)', file = sys.stderr)
+                last_report = now
+    finally:
+        if input_file is not sys.stdin.buffer:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    if not args.quiet:
+        elapsed = time.perf_counter() - started
+        rate = scored / elapsed if elapsed else 0.0
+        print(f'whetstone: done, scored {scored:,} records in {elapsed:.1f}s ({rate:,.0f} records/s)', file = sys.stderr)
+    return 0
+
+
+
+def build_parser() -> argparse.ArgumentParser:
+    '''
+    Builds the argument parser for the `whetstone` command.
+
+    Returns:
+        - parser (argparse.ArgumentParser): The parser, with one subcommand per tool.
+    '''
+    parser = argparse.ArgumentParser(prog = 'whetstone', description = 'Whetstone ML command-line tools.')
+    subparsers = parser.add_subparsers(dest = 'command', required = True)
+
+    score = subparsers.add_parser('score', help = 'Score the readability of every record in a file, writing JSON lines.')
+    score.add_argument('input', help = "The input file, or '-' for standard input.")
+    score.add_argument('--format', choices = INPUT_FORMATS, help = 'The input format. Defaults to inferring it from the file extension.')
+    score.add_argument('--text-field', default = 'text', help = "The JSONL or CSV field holding the text. Defaults to 'text'.")
+    score.add_argument('--metrics', help = 'A comma-separated list of metrics to calculate. Defaults to every metric.')
+    score.add_argument('--keep', help = 'A comma-separated list of input fields to copy to each output line, such as an id.')
+    score.add_argument('--jobs', '-j', type = int, default = 1, help = 'The number of worker processes. -1 uses every CPU. Defaults to 1.')
+    score.add_argument('--batch-size', type = int, default = 1_000, help = 'The number of records scored and written at a time. Defaults to 1,000.')
+    score.add_argument('--output', '-o', help = 'The output file. Defaults to standard output.')
+    score.add_argument('--checkpoint', help = 'A file recording progress after every batch.')
+    score.add_argument('--resume', action = 'store_true', help = 'Resume from --checkpoint, appending to --output.')
+    score.add_argument('--progress-interval', type = float, default = 5.0, help = 'Seconds between throughput reports on stderr. Defaults to 5.')
+    score.add_argument('--quiet', '-q', action = 'store_true', help = 'Do not report progress.')
+    score.set_defaults(handler = score_command)
+    return parser
+
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    '''
+    Entry point of the `whetstone` console script.
+
+    Inputs:
+        - argv (list[str], optional): The command-line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        - exit_code (int): The process exit code.
+    '''
+    args = build_parser().parse_args(argv)
+    if getattr(args, 'batch_size', 1) <= 0:
+        build_parser().error('--batch-size must be a positive integer')
+    if args.resume and not args.checkpoint:
+        build_parser().error('--resume requires --checkpoint')
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # Exiting quietly when the output is piped into a command that stops reading, such as `head`
+        sys.stderr.close()
+        return 1
+    except (ValueError, KeyError, OSError) as e:
+        print(f'whetstone: error: {e}', file = sys.stderr)
+        return 1
+
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import importlib
+
+
+
+# Mapping each public name to the submodule that defines it, so that `numpy` is only imported when a NumPy-backed tool is used
+_LAZY_EXPORTS = {
+    'whetstone.drift.rolling_monitor': ['DriftAlert', 'RollingWindowStats', 'RollingDriftMonitor'],
+    'whetstone.drift.distribution_drift': ['DRIFT_STATISTICS', 'MetricDriftDetector', 'calculate_distribution_drift'],
+    'whetstone.drift.quantile_sketch': ['TDigest', 'MetricQuantileSketch'],
+    'whetstone.drift.embedding_drift': ['EMBEDDING_DRIFT_STATISTICS', 'EmbeddingDriftDetector', 'calculate_embedding_drift', 'median_heuristic_gamma']
+}
+
+_EXPORT_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+__all__ = list(_EXPORT_MODULES)
+
+
+
+def __getattr__(name):
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'whetstone.drift' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,203 @@
+import numpy as np
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence
+
+
+
+# Smoothing added to empty bins so that PSI and the divergences stay finite
+EPSILON = 1e-6
+
+DRIFT_STATISTICS = ('psi', 'ks', 'js', 'wasserstein')
+
+
+
+def _to_matrix(data, metrics: Optional[Sequence[str]] = None):
+    '''
+    Converts metric results into a float matrix with one column per metric.
+
+    Accepts a list of per-text dictionaries (as returned by `calculate_all_readability_metrics`), a dictionary of
+    arrays (as returned by its columnar output modes), or a 2D array whose columns are in the order of `metrics`.
+    '''
+    if isinstance(data, dict):
+        metrics = list(data) if metrics is None else list(metrics)
+        matrix = np.column_stack([np.asarray(data[name], dtype = np.float64) for name in metrics]) if metrics else np.zeros((0, 0))
+        return matrix, metrics
+
+    if isinstance(data, np.ndarray) and data.dtype.names is not None:
+        metrics = list(data.dtype.names) if metrics is None else list(metrics)
+        return np.column_stack([data[name].astype(np.float64) for name in metrics]), metrics
+
+    if isinstance(data, (list, tuple)) and not data:
+        metrics = [] if metrics is None else list(metrics)
+        return np.zeros((0, len(metrics))), metrics
+
+    if isinstance(data, (list, tuple)) and isinstance(data[0], dict):
+        # Pulling out one metric column at a time rather than building a row per result
+        metrics = list(data[0]) if metrics is None else list(metrics)
+        columns = [np.fromiter(map(itemgetter(name), data), dtype = np.float64, count = len(data)) for name in metrics]
+        return np.column_stack(columns) if columns else np.zeros((len(data), 0)), metrics
+
+    matrix = np.asarray(data, dtype = np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[:, None]
+    if metrics is None:
+        metrics = [f'metric_{i}' for i in range(matrix.shape[1])]
+    if len(metrics) != matrix.shape[1]:
+        raise ValueError(f'Expected {len(metrics)} metric columns, got {matrix.shape[1]}')
+    return matrix, list(metrics)
+
+
+
+class MetricDriftDetector:
+    '''
+    Compares baseline and production distributions of many metrics at once using fixed-bin histograms.
+
+    Bin edges are fixed from the baseline's range, with an extra underflow and overflow bin on either side for production
+    values outside it, and the baseline histogram is built once. Production values are binned for every metric in a single vectorized pass and
+    accumulated into the production histogram in place, so arbitrarily large windows can be streamed through `update`.
+    `compare` then evaluates PSI, the KS statistic, Jensen-Shannon divergence, and Wasserstein distance for every
+    metric as matrix operations over the (metrics x bins) histograms. The Wasserstein distance also tracks how far
+    out-of-range values lie beyond the baseline range, so it keeps growing however far production moves.
+
+    Inputs:
+        - baseline: The baseline results, as a list of per-text dictionaries, a dictionary of arrays, or a 2D array.
+        - metrics (list[str], optional): The metrics to compare. Defaults to every metric in the baseline.
+        - bins (int): The number of histogram bins per metric. Defaults to 20.
+    '''
+
+    def __init__(self, baseline, metrics: Optional[List[str]] = None, bins: int = 20):
+        if bins < 2:
+            raise ValueError('bins must be at least 2')
+        matrix, self.metrics = _to_matrix(baseline, metrics)
+        if len(matrix) == 0:
+            raise ValueError('baseline must contain at least one result')
+        self.bins = bins
+
+        # Fixing uniform bin edges per metric from the baseline range, widening constant metrics to a unit range
+        lower = np.nanmin(matrix, axis = 0)
+        upper = np.nanmax(matrix, axis = 0)
+        constant = ~(upper > lower)
+        lower = np.where(constant, lower - 0.5, lower)
+        upper = np.where(constant, upper + 0.5, upper)
+        self.lower = lower
+        self.upper = upper
+        self.bin_width = (upper - lower) / bins
+        self.edges = lower[:, None] + self.bin_width[:, None] * np.arange(bins + 1)
+
+        self.baseline_counts, _ = self._histogram(matrix)
+        self.production_counts = np.zeros_like(self.baseline_counts)
+        self.production_excess = np.zeros((len(self.metrics), 2))
+
+
+    def _histogram(self, matrix: np.ndarray):
+        # Binning every metric column at once and counting all bins with a single bincount. Column 0 counts values
+        # below the baseline range and column bins + 1 values above it, and the total distance of those values
+        # beyond the range is returned alongside the counts.
+        num_metrics = len(self.metrics)
+        num_columns = self.bins + 2
+        valid = ~np.isnan(matrix)
+        values = np.where(valid, matrix, self.lower)
+        bin_index = np.clip(np.floor((values - self.lower) / self.bin_width) + 1, 0, self.bins).astype(np.int64)
+        bin_index[values > self.upper] = self.bins + 1
+        flat_index = (bin_index + np.arange(num_metrics) * num_columns)[valid]
+        counts = np.bincount(flat_index, minlength = num_metrics * num_columns).reshape(num_metrics, num_columns).astype(np.float64)
+
+        excess = np.column_stack([np.clip(self.lower - values, 0, None).sum(axis = 0), np.clip(values - self.upper, 0, None).sum(axis = 0)])
+        return counts, excess
+
+
+    def update(self, production) -> None:
+        '''
+        Adds a batch of production results to the production histograms in place.
+
+        Inputs:
+            - production: The production results, in any format accepted for the baseline.
+        '''
+        matrix, _ = _to_matrix(production, self.metrics)
+        if len(matrix):
+            counts, excess = self._histogram(matrix)
+            self.production_counts += counts
+            self.production_excess += excess
+
+
+    def reset(self) -> None:
+        '''
+        Clears the production histograms, keeping the baseline.
+        '''
+        self.production_counts[:] = 0
+        self.production_excess[:] = 0
+
+
+    def compare_arrays(self) -> Dict[str, np.ndarray]:
+        '''
+        Evaluates every drift statistic for every metric against the accumulated production histograms.
+
+        Returns:
+            - statistics (dict[str, np.ndarray]): A mapping of 'psi', 'ks', 'js', and 'wasserstein' to an array with one value per metric.
+        '''
+        baseline = self.baseline_counts / self.baseline_counts.sum(axis = 1, keepdims = True).clip(min = 1)
+        num_production = self.production_counts.sum(axis = 1, keepdims = True).clip(min = 1)
+        production = self.production_counts / num_production
+
+        # Population Stability Index over smoothed bin proportions
+        smoothed_baseline = np.clip(baseline, EPSILON, None)
+        smoothed_production = np.clip(production, EPSILON, None)
+        psi = np.sum((smoothed_production - smoothed_baseline) * np.log(smoothed_production / smoothed_baseline), axis = 1)
+
+        # KS statistic from the cumulative distributions at every bin edge
+        cdf_difference = np.abs(np.cumsum(baseline, axis = 1) - np.cumsum(production, axis = 1))
+        ks = cdf_difference.max(axis = 1)
+
+        # Wasserstein distance as the area between the cumulative distributions, taken as linear within each bin
+        # over the baseline range, plus the mean distance of production values beyond the range, where the
+        # baseline has no mass
+        edge_difference = cdf_difference[:, :self.bins + 1]
+        inner_area = 0.5 * (edge_difference[:, :-1] + edge_difference[:, 1:]).sum(axis = 1) * self.bin_width
+        wasserstein = inner_area + self.production_excess.sum(axis = 1) / num_production[:, 0]
+
+        # Jensen-Shannon divergence in bits, bounded between 0 and 1
+        mixture = 0.5 * (baseline + production)
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            kl_baseline = np.where(baseline > 0, baseline * np.log2(baseline / mixture), 0.0).sum(axis = 1)
+            kl_production = np.where(production > 0, production * np.log2(production / mixture), 0.0).sum(axis = 1)
+        js = 0.5 * kl_baseline + 0.5 * kl_production
+
+        return {'psi': psi, 'ks': ks, 'js': js, 'wasserstein': wasserstein}
+
+
+    def compare(self, production = None) -> Dict[str, Dict[str, float]]:
+        '''
+        Compares the baseline against production, optionally adding a batch of production results first.
+
+        Inputs:
+            - production (optional): A batch of production results to add before comparing.
+
+        Returns:
+            - drift (dict[str, dict[str, float]]): A mapping of each metric to its 'psi', 'ks', 'js', and 'wasserstein' values.
+        '''
+        if production is not None:
+            self.update(production)
+        statistics = self.compare_arrays()
+        return {metric: {name: float(statistics[name][i]) for name in DRIFT_STATISTICS} for i, metric in enumerate(self.metrics)}
+
+
+
+def calculate_distribution_drift(baseline,
+                                 production,
+                                 metrics: Optional[List[str]] = None,
+                                 bins: int = 20) -> Dict[str, Dict[str, float]]:
+    '''
+    Calculate PSI, KS statistic, Jensen-Shannon divergence, and Wasserstein distance between a baseline and a production window.
+
+    Inputs:
+        - baseline: The baseline results, as a list of per-text dictionaries, a dictionary of arrays, or a 2D array.
+        - production: The production results, in the same format.
+        - metrics (list[str], optional): The metrics to compare. Defaults to every metric in the baseline.
+        - bins (int): The number of histogram bins per metric. Defaults to 20.
+
+    Returns:
+        - drift (dict[str, dict[str, float]]): A mapping of each metric to its drift statistics.
+    '''
+    return MetricDriftDetector(baseline, metrics = metrics, bins = bins).compare(production)
+
+__all__ = ['DRIFT_STATISTICS', 'MetricDriftDetector', 'calculate_distribution_drift']
@@ -0,0 +1,306 @@
+import numpy as np
+from typing import Dict, Iterator, Optional, Sequence
+
+
+
+EMBEDDING_DRIFT_STATISTICS = ('centroid_shift', 'centroid_cosine_distance', 'mmd2_linear', 'mmd2_rbf', 'nn_coverage',
+                              'nn_outside_fraction', 'nn_mean_distance')
+
+MMD_METHODS = ('random_features', 'exact')
+
+
+
+def _check_embeddings(embeddings, name: str):
+    # Validating the shape without converting, so memory-mapped matrices stay on disk
+    if not hasattr(embeddings, 'shape') or not hasattr(embeddings, 'dtype'):
+        embeddings = np.asarray(embeddings, dtype = np.float64)
+    if len(embeddings.shape) != 2:
+        raise ValueError(f'{name} must be a 2D (rows x dimensions) matrix')
+    if embeddings.shape[0] == 0:
+        raise ValueError(f'{name} must contain at least one embedding')
+    return embeddings
+
+
+
+def _prepare(chunk, normalize: bool) -> np.ndarray:
+    # Reading one chunk of rows into memory as float64, optionally scaling every row to unit length
+    chunk = np.asarray(chunk, dtype = np.float64)
+    if normalize:
+        norms = np.linalg.norm(chunk, axis = 1, keepdims = True)
+        chunk = chunk / np.where(norms > 0, norms, 1.0)
+    return chunk
+
+
+
+def _iter_chunks(embeddings, chunk_size: int, normalize: bool) -> Iterator[np.ndarray]:
+    for start in range(0, embeddings.shape[0], chunk_size):
+        yield _prepare(embeddings[start:start + chunk_size], normalize)
+
+
+
+def _sample_rows(embeddings, max_rows: Optional[int], rng: np.random.Generator, normalize: bool) -> np.ndarray:
+    # Reading a uniform sample of rows in sorted order, so a memory-mapped matrix only pages in the sampled rows
+    if max_rows is None or embeddings.shape[0] <= max_rows:
+        return np.concatenate(list(_iter_chunks(embeddings, 65_536, normalize)))
+    rows = np.sort(rng.choice(embeddings.shape[0], size = max_rows, replace = False))
+    return _prepare(embeddings[rows], normalize)
+
+
+
+def _squared_distances(a: np.ndarray, b: np.ndarray, a_norms: np.ndarray, b_norms: np.ndarray) -> np.ndarray:
+    # ||a - b||^2 = ||a||^2 + ||b||^2 - 2 a.b, with the cross term as one BLAS matrix product
+    distances = a @ b.T
+    distances *= -2.0
+    distances += a_norms[:, None]
+    distances += b_norms[None, :]
+    return np.maximum(distances, 0.0, out = distances)
+
+
+
+def median_heuristic_gamma(embeddings, max_rows: int = 1_000, normalize: bool = False, seed: int = 0) -> float:
+    '''
+    Chooses the RBF kernel width `gamma` (in exp(-gamma ||x - y||^2)) as the inverse median squared distance between embeddings.
+
+    Inputs:
+        - embeddings: A (rows x dimensions) matrix, such as a `np.memmap`.
+        - max_rows (int): The number of rows sampled to estimate the median. Defaults to 1,000.
+        - normalize (bool): Whether to scale every embedding to unit length first. Defaults to False.
+        - seed (int): The sampling seed. Defaults to 0.
+
+    Returns:
+        - gamma (float): The kernel width.
+    '''
+    sample = _sample_rows(_check_embeddings(embeddings, 'embeddings'), max_rows, np.random.default_rng(seed), normalize)
+    norms = np.einsum('ij,ij->i', sample, sample)
+    distances = _squared_distances(sample, sample, norms, norms)[np.triu_indices(len(sample), k = 1)]
+    median = float(np.median(distances[distances > 0])) if np.any(distances > 0) else 0.0
+    return 1.0 / median if median > 0 else 1.0
+
+
+
+class EmbeddingDriftDetector:
+    '''
+    Compares a production window of embeddings against a baseline in the embedding space itself.
+
+    Embedding matrices (which may be `np.memmap`s) are never loaded whole: they are read `chunk_size` rows at a time
+    and every statistic is accumulated over the chunks with BLAS-backed matrix products. The baseline summaries
+    (centroid, random-feature mean, and nearest-neighbor radii) are computed once, so many production windows can be
+    compared against the same baseline cheaply.
+
+    - Centroid shift: the Euclidean and cosine distances between the mean embeddings.
+    - MMD: the squared maximum mean discrepancy with a linear kernel (the squared centroid shift) and an RBF kernel,
+      estimated in linear time with `num_features` random Fourier features, or exactly (quadratic time, in blocks).
+    - Nearest-neighbor coverage: the share of (sampled) baseline embeddings whose k-nearest-neighbor ball contains a
+      production embedding, the share of production embeddings outside every baseline ball, and the mean distance
+      from each production embedding to its nearest baseline embedding. These pairwise statistics are evaluated on
+      uniform samples of at most `max_neighbor_samples` rows per side to bound their quadratic cost.
+
+    Inputs:
+        - baseline: The (rows x dimensions) baseline embeddings.
+        - gamma (float, optional): The RBF kernel width. Defaults to the median heuristic on the baseline.
+        - mmd_method (str): 'random_features' (default) or 'exact'.
+        - num_features (int): The number of random Fourier features. Defaults to 2,048.
+        - nearest_neighbors (int): The k of the k-nearest-neighbor balls. Defaults to 5.
+        - max_neighbor_samples (int, optional): The maximum number of rows per side used by the nearest-neighbor statistics. Defaults to 10,000; None uses every row (and reads both matrices into memory).
+        - normalize (bool): Whether to scale every embedding to unit length, as for cosine-similarity embeddings. Defaults to False.
+        - chunk_size (int): The number of rows read and processed at a time. Defaults to 4,096.
+        - seed (int): The seed of the random features and samples. Defaults to 0.
+    '''
+
+    def __init__(self,
+                 baseline,
+                 gamma: Optional[float] = None,
+                 mmd_method: str = 'random_features',
+                 num_features: int = 2_048,
+                 nearest_neighbors: int = 5,
+                 max_neighbor_samples: Optional[int] = 10_000,
+                 normalize: bool = False,
+                 chunk_size: int = 4_096,
+                 seed: int = 0):
+        if mmd_method not in MMD_METHODS:
+            raise ValueError(f"Unknown MMD method {mmd_method!r}. Available methods: {list(MMD_METHODS)}")
+        if num_features <= 0 or nearest_neighbors <= 0 or chunk_size <= 0:
+            raise ValueError('num_features, nearest_neighbors, and chunk_size must be positive integers')
+        self.baseline = _check_embeddings(baseline, 'baseline')
+        self.dimensions = self.baseline.shape[1]
+        self.mmd_method = mmd_method
+        self.num_features = num_features
+        self.nearest_neighbors = nearest_neighbors
+        self.max_neighbor_samples = max_neighbor_samples
+        self.normalize = normalize
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.gamma = median_heuristic_gamma(self.baseline, normalize = normalize, seed = seed) if gamma is None else gamma
+
+        # Drawing random Fourier features for the RBF kernel: E[z(x) . z(y)] = exp(-gamma ||x - y||^2)
+        rng = np.random.default_rng(seed)
+        self._weights = rng.normal(0.0, np.sqrt(2.0 * self.gamma), size = (self.dimensions, num_features))
+        self._phases = rng.uniform(0.0, 2.0 * np.pi, size = num_features)
+
+        # Summarizing the baseline in one pass: its centroid and mean random-feature vector
+        self.baseline_centroid, self._baseline_features = self._summarize(self.baseline)
+
+        # The baseline sample and its nearest-neighbor radii are computed on the first comparison that needs them
+        self._baseline_sample = None
+        self._baseline_norms = None
+        self.baseline_radii = None
+
+
+    def _features(self, chunk: np.ndarray) -> np.ndarray:
+        projection = chunk @ self._weights
+        projection += self._phases
+        return np.cos(projection, out = projection) * np.sqrt(2.0 / self.num_features)
+
+
+    def _summarize(self, embeddings):
+        # Streaming the sums of the embeddings and of their random features over row chunks
+        total = np.zeros(self.dimensions)
+        feature_total = np.zeros(self.num_features) if self.mmd_method == 'random_features' else None
+        for chunk in _iter_chunks(embeddings, self.chunk_size, self.normalize):
+            total += chunk.sum(axis = 0)
+            if feature_total is not None:
+                feature_total += self._features(chunk).sum(axis = 0)
+        rows = embeddings.shape[0]
+        return total / rows, None if feature_total is None else feature_total / rows
+
+
+    def _neighbor_radii(self) -> np.ndarray:
+        # Keeping the k + 1 smallest squared distances of each sampled baseline row (the first is the row itself)
+        sample, norms = self._baseline_sample, self._baseline_norms
+        k = min(self.nearest_neighbors, len(sample) - 1)
+        if k <= 0:
+            return np.zeros(len(sample))
+        radii = np.empty(len(sample))
+        for start in range(0, len(sample), self.chunk_size):
+            rows = slice(start, start + self.chunk_size)
+            smallest = np.full((len(sample[rows]), k + 1), np.inf)
+            for other in range(0, len(sample), self.chunk_size):
+                columns = slice(other, other + self.chunk_size)
+                distances = _squared_distances(sample[rows], sample[columns], norms[rows], norms[columns])
+                candidates = np.concatenate([smallest, distances], axis = 1)
+                smallest = np.partition(candidates, k, axis = 1)[:, :k + 1]
+            radii[rows] = np.sqrt(np.partition(smallest, k, axis = 1)[:, k])
+        return radii
+
+
+    def _exact_rbf_mmd2(self, production) -> float:
+        # Unbiased estimate of MMD^2 from kernel sums over blocks of rows, skipping the self-similarity diagonals
+        def kernel_sum(a, b, same: bool) -> float:
+            total = 0.0
+            for i in range(0, a.shape[0], self.chunk_size):
+                x = _prepare(a[i:i + self.chunk_size], self.normalize)
+                x_norms = np.einsum('ij,ij->i', x, x)
+                for j in range(i if same else 0, b.shape[0], self.chunk_size):
+                    y = x if same and j == i else _prepare(b[j:j + self.chunk_size], self.normalize)
+                    y_norms = np.einsum('ij,ij->i', y, y)
+                    block = np.exp(-self.gamma * _squared_distances(x, y, x_norms, y_norms)).sum()
+                    total += block if not same or j == i else 2.0 * block
+            return total
+
+        n, m = self.baseline.shape[0], production.shape[0]
+        if n < 2 or m < 2:
+            raise ValueError('The exact MMD needs at least two baseline and two production embeddings')
+        baseline_term = (kernel_sum(self.baseline, self.baseline, True) - n) / (n * (n - 1))
+        production_term = (kernel_sum(production, production, True) - m) / (m * (m - 1))
+        cross_term = kernel_sum(self.baseline, production, False) / (n * m)
+        return float(baseline_term + production_term - 2.0 * cross_term)
+
+
+    def _neighbor_statistics(self, production) -> Dict[str, float]:
+        # Sampling the baseline once and finding each sampled row's k-th nearest neighbor distance
+        if self.baseline_radii is None:
+            self._baseline_sample = _sample_rows(self.baseline, self.max_neighbor_samples, np.random.default_rng(self.seed + 1), self.normalize)
+            self._baseline_norms = np.einsum('ij,ij->i', self._baseline_sample, self._baseline_sample)
+            self.baseline_radii = self._neighbor_radii()
+
+        # Comparing the production sample against the sampled baseline balls one block of rows at a time
+        sample = _sample_rows(production, self.max_neighbor_samples, np.random.default_rng(self.seed + 2), self.normalize)
+        norms = np.einsum('ij,ij->i', sample, sample)
+        squared_radii = self.baseline_radii ** 2
+        covered = np.zeros(len(self._baseline_sample), dtype = bool)
+        inside = np.zeros(len(sample), dtype = bool)
+        nearest = np.full(len(sample), np.inf)
+        for start in range(0, len(self._baseline_sample), self.chunk_size):
+            rows = slice(start, start + self.chunk_size)
+            for other in range(0, len(sample), self.chunk_size):
+                columns = slice(other, other + self.chunk_size)
+                distances = _squared_distances(self._baseline_sample[rows], sample[columns], self._baseline_norms[rows], norms[columns])
+                within = distances <= squared_radii[rows, None]
+                covered[rows] |= within.any(axis = 1)
+                inside[columns] |= within.any(axis = 0)
+                np.minimum(nearest[columns], distances.min(axis = 0), out = nearest[columns])
+        return {
+            'nn_coverage': float(covered.mean()),
+            'nn_outside_fraction': float(1.0 - inside.mean()),
+            'nn_mean_distance': float(np.sqrt(nearest).mean())
+        }
+
+
+    def compare(self, production, statistics: Optional[Sequence[str]] = None) -> Dict[str, float]:
+        '''
+        Compares a production window of embeddings against the baseline.
+
+        Inputs:
+            - production: The (rows x dimensions) production embeddings, such as a `np.memmap`.
+            - statistics (list[str], optional): The statistics to compute, from `EMBEDDING_DRIFT_STATISTICS`. Defaults to every statistic.
+
+        Returns:
+            - drift (dict[str, float]): The value of each statistic.
+        '''
+        statistics = list(EMBEDDING_DRIFT_STATISTICS) if statistics is None else list(statistics)
+        unknown = [name for name in statistics if name not in EMBEDDING_DRIFT_STATISTICS]
+        if unknown:
+            raise ValueError(f"Unknown statistic(s) {unknown}. Available statistics: {list(EMBEDDING_DRIFT_STATISTICS)}")
+        production = _check_embeddings(production, 'production')
+        if production.shape[1] != self.dimensions:
+            raise ValueError(f'Expected {self.dimensions}-dimensional embeddings, got {production.shape[1]}')
+
+        drift = {}
+        if {'centroid_shift', 'centroid_cosine_distance', 'mmd2_linear', 'mmd2_rbf'} & set(statistics):
+            centroid, features = self._summarize(production)
+            shift = centroid - self.baseline_centroid
+            drift['centroid_shift'] = float(np.linalg.norm(shift))
+            norms = np.linalg.norm(centroid) * np.linalg.norm(self.baseline_centroid)
+            drift['centroid_cosine_distance'] = float(1.0 - centroid @ self.baseline_centroid / norms) if norms > 0 else 0.0
+            drift['mmd2_linear'] = float(shift @ shift)
+            if 'mmd2_rbf' in statistics:
+                if self.mmd_method == 'exact':
+                    drift['mmd2_rbf'] = self._exact_rbf_mmd2(production)
+                else:
+                    difference = features - self._baseline_features
+                    drift['mmd2_rbf'] = float(difference @ difference)
+        if {'nn_coverage', 'nn_outside_fraction', 'nn_mean_distance'} & set(statistics):
+            drift.update(self._neighbor_statistics(production))
+        return {name: drift[name] for name in statistics}
+
+
+
+def calculate_embedding_drift(baseline,
+                              production,
+                              statistics: Optional[Sequence[str]] = None,
+                              gamma: Optional[float] = None,
+                              mmd_method: str = 'random_features',
+                              num_features: int = 2_048,
+                              nearest_neighbors: int = 5,
+                              max_neighbor_samples: Optional[int] = 10_000,
+                              normalize: bool = False,
+                              chunk_size: int = 4_096,
+                              seed: int = 0) -> Dict[str, float]:
+    '''
+    Calculate centroid shift, MMD, and nearest-neighbor coverage between baseline and production embeddings.
+
+    Inputs:
+        - baseline: The (rows x dimensions) baseline embeddings, such as a `np.memmap`.
+        - production: The (rows x dimensions) production embeddings.
+        - statistics (list[str], optional): The statistics to compute, from `EMBEDDING_DRIFT_STATISTICS`. Defaults to every statistic.
+        - The remaining inputs are passed to `EmbeddingDriftDetector`.
+
+    Returns:
+        - drift (dict[str, float]): The value of each statistic.
+    '''
+    detector = EmbeddingDriftDetector(baseline, gamma = gamma, mmd_method = mmd_method, num_features = num_features,
+                                      nearest_neighbors = nearest_neighbors, max_neighbor_samples = max_neighbor_samples,
+                                      normalize = normalize, chunk_size = chunk_size, seed = seed)
+    return detector.compare(production, statistics = statistics)
+
+__all__ = ['EMBEDDING_DRIFT_STATISTICS', 'MMD_METHODS', 'median_heuristic_gamma', 'EmbeddingDriftDetector', 'calculate_embedding_drift']
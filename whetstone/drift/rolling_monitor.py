@@ -0,0 +1,309 @@
+import math
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+
+class DriftAlert(NamedTuple):
+    '''
+    Emitted by RollingDriftMonitor when a metric's window mean leaves its baseline band.
+
+    Fields:
+        - metric (str): The name of the metric that drifted.
+        - window_mean (float): The mean of the metric over the current window.
+        - lower (float): The lower edge of the baseline band.
+        - upper (float): The upper edge of the baseline band.
+        - count (int): The number of values in the current window.
+        - timestamp (float): The timestamp of the update that triggered the alert.
+    '''
+    metric: str
+    window_mean: float
+    lower: float
+    upper: float
+    count: int
+    timestamp: float
+
+
+
+class RollingWindowStats:
+    '''
+    Running mean, variance, minimum, and maximum over a sliding count or time window.
+
+    Every update is O(1) amortized. The mean and variance are maintained with Welford's algorithm, applied in
+    reverse when a value slides out of the window, and the minimum and maximum are maintained with monotonic deques,
+    so no statistic is ever recomputed over the stored history.
+
+    Inputs:
+        - window_size (int, optional): The maximum number of values in the window.
+        - window_seconds (float, optional): The maximum age of a value in the window, in the units of the timestamps passed to `update`.
+    '''
+
+    def __init__(self, window_size: Optional[int] = None, window_seconds: Optional[float] = None):
+        if window_size is not None and window_size <= 0:
+            raise ValueError('window_size must be a positive integer')
+        if window_seconds is not None and window_seconds <= 0:
+            raise ValueError('window_seconds must be positive')
+        self.window_size = window_size
+        self.window_seconds = window_seconds
+
+        self._values = deque()
+        self._min_deque = deque()
+        self._max_deque = deque()
+        self._sequence = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+
+    def _add(self, value: float, timestamp: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        # Dropping entries that can no longer be the window minimum or maximum
+        entry = (self._sequence, value)
+        while self._min_deque and self._min_deque[-1][1] >= value:
+            self._min_deque.pop()
+        self._min_deque.append(entry)
+        while self._max_deque and self._max_deque[-1][1] <= value:
+            self._max_deque.pop()
+        self._max_deque.append(entry)
+
+        self._values.append((self._sequence, value, timestamp))
+        self._sequence += 1
+
+
+    def _remove_oldest(self) -> None:
+        sequence, value, _ = self._values.popleft()
+        if self.count == 1:
+            self.count = 0
+            self.mean = 0.0
+            self._m2 = 0.0
+        else:
+            self.count -= 1
+            delta = value - self.mean
+            self.mean -= delta / self.count
+            self._m2 = max(self._m2 - delta * (value - self.mean), 0.0)
+
+        if self._min_deque and self._min_deque[0][0] == sequence:
+            self._min_deque.popleft()
+        if self._max_deque and self._max_deque[0][0] == sequence:
+            self._max_deque.popleft()
+
+
+    def expire(self, now: float) -> None:
+        '''
+        Slides values older than `window_seconds` out of the window.
+
+        Inputs:
+            - now (float): The current timestamp.
+        '''
+        if self.window_seconds is None:
+            return
+        cutoff = now - self.window_seconds
+        while self._values and self._values[0][2] <= cutoff:
+            self._remove_oldest()
+
+
+    def update(self, value: float, timestamp: Optional[float] = None) -> None:
+        '''
+        Adds a value to the window, sliding out any values that fall outside it.
+
+        Inputs:
+            - value (float): The new value.
+            - timestamp (float, optional): The time of the value. Defaults to `time.monotonic()`.
+        '''
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self._add(float(value), timestamp)
+        if self.window_size is not None and self.count > self.window_size:
+            self._remove_oldest()
+        self.expire(timestamp)
+
+
+    @property
+    def variance(self) -> float:
+        # Sample variance of the values in the window
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+    @property
+    def min(self) -> float:
+        return self._min_deque[0][1] if self._min_deque else math.nan
+
+
+    @property
+    def max(self) -> float:
+        return self._max_deque[0][1] if self._max_deque else math.nan
+
+
+    def summary(self) -> dict:
+        '''
+        Reports the window statistics.
+
+        Returns:
+            - summary (dict): The count, mean, variance, standard deviation, minimum, and maximum of the window.
+        '''
+        return {
+            'count': self.count,
+            'mean': self.mean if self.count else math.nan,
+            'variance': self.variance,
+            'std': self.std,
+            'min': self.min,
+            'max': self.max
+        }
+
+
+
+class RollingDriftMonitor:
+    '''
+    Stateful monitor that checks per-text metric results for drift as they arrive.
+
+    Each update is fed to a RollingWindowStats per metric in O(1). Whenever a metric's window mean moves outside
+    its baseline band (after at least `min_count` values), a DriftAlert is returned and passed to `on_alert`.
+    Alerts fire when a metric leaves its band, not on every update while it stays outside.
+
+    Inputs:
+        - bands (dict[str, tuple[float, float]]): The (lower, upper) band of acceptable window means for each monitored metric.
+        - window_size (int, optional): The maximum number of results in each window.
+        - window_seconds (float, optional): The maximum age of a result in each window.
+        - min_count (int): The number of results a window needs before it is checked. Defaults to 30.
+        - on_alert (callable, optional): Called with each DriftAlert as it is raised.
+    '''
+
+    def __init__(self,
+                 bands: Dict[str, Tuple[float, float]],
+                 window_size: Optional[int] = None,
+                 window_seconds: Optional[float] = None,
+                 min_count: int = 30,
+                 on_alert: Optional[Callable[[DriftAlert], None]] = None):
+        if window_size is None and window_seconds is None:
+            raise ValueError('At least one of window_size or window_seconds must be provided')
+        self.bands = dict(bands)
+        self.min_count = min_count
+        self.on_alert = on_alert
+        self.windows = {metric: RollingWindowStats(window_size, window_seconds) for metric in self.bands}
+        self._in_alert = {metric: False for metric in self.bands}
+
+
+    @classmethod
+    def from_baseline(cls,
+                      baseline_results: Iterable[dict],
+                      metrics: Optional[List[str]] = None,
+                      num_std: float = 3.0,
+                      window_size: Optional[int] = None,
+                      window_seconds: Optional[float] = None,
+                      **kwargs) -> 'RollingDriftMonitor':
+        '''
+        Builds a monitor whose bands are derived from baseline results, such as those from `calculate_all_readability_metrics`.
+
+        For count windows the band is the baseline mean plus or minus `num_std` standard errors of a window mean
+        (`std / sqrt(window_size)`). For time-only windows the band is the baseline mean plus or minus `num_std` standard deviations.
+
+        Inputs:
+            - baseline_results (iterable[dict]): Per-text metric results from the baseline period.
+            - metrics (list[str], optional): The metrics to monitor. Defaults to every key of the first baseline result.
+            - num_std (float): The width of the band in standard errors (or deviations). Defaults to 3.0.
+            - window_size (int, optional): The maximum number of results in each window.
+            - window_seconds (float, optional): The maximum age of a result in each window.
+            - **kwargs: Additional arguments passed to the RollingDriftMonitor constructor.
+
+        Returns:
+            - monitor (RollingDriftMonitor): The configured monitor.
+        '''
+        # Accumulating the baseline count, mean, and sum of squared deviations in one pass with Welford's algorithm
+        baseline = {}
+        for result in baseline_results:
+            if metrics is None:
+                metrics = list(result)
+            for metric in metrics:
+                count, mean, m2 = baseline.get(metric, (0, 0.0, 0.0))
+                value = float(result[metric])
+                count += 1
+                delta = value - mean
+                mean += delta / count
+                m2 += delta * (value - mean)
+                baseline[metric] = (count, mean, m2)
+        if not baseline:
+            raise ValueError('baseline_results must contain at least one result')
+
+        scale = math.sqrt(window_size) if window_size is not None else 1.0
+        bands = {}
+        for metric, (count, mean, m2) in baseline.items():
+            std = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+            half_width = num_std * std / scale
+            bands[metric] = (mean - half_width, mean + half_width)
+        return cls(bands, window_size = window_size, window_seconds = window_seconds, **kwargs)
+
+
+    def update(self, result: dict, timestamp: Optional[float] = None) -> List[DriftAlert]:
+        '''
+        Adds one per-text result to every monitored window and checks the windows against their bands.
+
+        Inputs:
+            - result (dict): A mapping of metric names to values, such as one entry of `calculate_all_readability_metrics`.
+            - timestamp (float, optional): The time of the result. Defaults to `time.monotonic()`.
+
+        Returns:
+            - alerts (list[DriftAlert]): The alerts raised by this update.
+        '''
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        alerts = []
+        for metric, window in self.windows.items():
+            value = result.get(metric)
+            if value is None:
+                window.expire(timestamp)
+                continue
+            window.update(value, timestamp)
+
+            lower, upper = self.bands[metric]
+            out_of_band = window.count >= self.min_count and not lower <= window.mean <= upper
+            if out_of_band and not self._in_alert[metric]:
+                alert = DriftAlert(metric, window.mean, lower, upper, window.count, timestamp)
+                alerts.append(alert)
+                if self.on_alert is not None:
+                    self.on_alert(alert)
+            self._in_alert[metric] = out_of_band
+        return alerts
+
+
+    def update_many(self, results: Iterable[dict], timestamps: Optional[Iterable[float]] = None) -> List[DriftAlert]:
+        '''
+        Adds a sequence of per-text results, in order.
+
+        Inputs:
+            - results (iterable[dict]): The per-text results.
+            - timestamps (iterable[float], optional): The time of each result. Defaults to `time.monotonic()` at each update.
+
+        Returns:
+            - alerts (list[DriftAlert]): Every alert raised while adding the results.
+        '''
+        alerts = []
+        if timestamps is None:
+            for result in results:
+                alerts.extend(self.update(result))
+        else:
+            for result, timestamp in zip(results, timestamps):
+                alerts.extend(self.update(result, timestamp))
+        return alerts
+
+
+    def summary(self) -> Dict[str, dict]:
+        '''
+        Reports the current window statistics for every monitored metric.
+
+        Returns:
+            - summary (dict[str, dict]): A mapping of each metric to its window count, mean, variance, standard deviation, minimum, and maximum.
+        '''
+        return {metric: window.summary() for metric, window in self.windows.items()}
+
+__all__ = ['DriftAlert', 'RollingWindowStats', 'RollingDriftMonitor']
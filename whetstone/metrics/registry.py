@@ -0,0 +1,75 @@
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+
+# Mapping each metric name to the module and function that calculate it. Modules are only imported when a metric is first requested.
+METRIC_REGISTRY: Dict[str, Tuple[str, str]] = {
+    'flesch_kincaid_reading_ease': ('whetstone.metrics.text.readability_metrics', 'calculate_flesch_kincaid_reading_ease'),
+    'flesch_kincaid_grade_level': ('whetstone.metrics.text.readability_metrics', 'calculate_flesch_kincaid_grade_level'),
+    'gunning_fog_index': ('whetstone.metrics.text.readability_metrics', 'calculate_gunning_fog_index'),
+    'coleman_liau_index': ('whetstone.metrics.text.readability_metrics', 'calculate_coleman_liau_index'),
+    'automated_readability_index': ('whetstone.metrics.text.readability_metrics', 'calculate_automated_readability_index'),
+    'smog_index': ('whetstone.metrics.text.readability_metrics', 'calculate_smog_index'),
+    'dale_chall_readability_score': ('whetstone.metrics.text.readability_metrics', 'calculate_dale_chall_readability_score'),
+    'spache_readability_formula': ('whetstone.metrics.text.readability_metrics', 'calculate_spache_readability_formula'),
+    'new_dale_chall_readability_score': ('whetstone.metrics.text.readability_metrics', 'calculate_new_dale_chall_readability_score'),
+    'linsear_write_formula': ('whetstone.metrics.text.readability_metrics', 'calculate_linsear_write_formula'),
+    'forcast_readability_formula': ('whetstone.metrics.text.readability_metrics', 'calculate_forcast_readability_formula'),
+    'raygor_readability_estimate': ('whetstone.metrics.text.readability_metrics', 'calculate_raygor_readability_estimate'),
+    'lix_readability_score': ('whetstone.metrics.text.readability_metrics', 'calculate_lix_readability_score'),
+    'rix_readability_score': ('whetstone.metrics.text.readability_metrics', 'calculate_rix_readability_score'),
+    'strain_index': ('whetstone.metrics.text.readability_metrics', 'calculate_strain_index'),
+    'readability_consensus_grade': ('whetstone.metrics.text.readability_metrics', 'calculate_readability_consensus_grade'),
+    'all_readability_metrics': ('whetstone.metrics.text.readability_metrics', 'calculate_all_readability_metrics'),
+    'retrieval_metrics': ('whetstone.metrics.text.rag_metrics', 'calculate_retrieval_metrics')
+}
+
+_loaded: Dict[str, Callable] = {}
+
+
+
+def list_metrics() -> List[str]:
+    '''
+    Lists every registered metric name without importing any metric module.
+
+    Returns:
+        - metrics (list[str]): The registered metric names.
+    '''
+    return list(METRIC_REGISTRY)
+
+
+
+def register_metric(name: str, module: str, attribute: str) -> None:
+    '''
+    Registers a metric to be loaded lazily from a module on first use.
+
+    Inputs:
+        - name (str): The metric name.
+        - module (str): The dotted path of the module that defines the metric.
+        - attribute (str): The name of the metric function within the module.
+    '''
+    METRIC_REGISTRY[name] = (module, attribute)
+    _loaded.pop(name, None)
+
+
+
+def get_metric(name: str) -> Callable:
+    '''
+    Returns the function for a registered metric, importing its module on first use.
+
+    Inputs:
+        - name (str): The metric name.
+
+    Returns:
+        - metric (callable): The function that calculates the metric.
+    '''
+    metric = _loaded.get(name)
+    if metric is None:
+        if name not in METRIC_REGISTRY:
+            raise KeyError(f"Unknown metric {name!r}. Registered metrics: {list(METRIC_REGISTRY)}")
+        module, attribute = METRIC_REGISTRY[name]
+        metric = _loaded[name] = getattr(importlib.import_module(module), attribute)
+    return metric
+
+__all__ = ['METRIC_REGISTRY', 'list_metrics', 'register_metric', 'get_metric']
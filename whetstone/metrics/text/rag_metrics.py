@@ -0,0 +1,997 @@
+import math
+import zlib
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from whetstone.utils.text.text_parsers import WORD_PATTERN
+
+
+
+# The retrieval metrics, each reported at every cutoff k as '<metric>@<k>'
+RETRIEVAL_METRICS = ('recall', 'precision', 'hit_rate', 'mrr', 'ndcg')
+
+RETRIEVAL_GAINS = ('linear', 'exponential')
+
+
+
+def pad_ragged(sequences: Sequence[Sequence], pad_id = -1, dtype = None) -> np.ndarray:
+    '''
+    Packs variable-length lists, such as the relevant document IDs of each query, into a padded matrix.
+
+    Inputs:
+        - sequences (sequence[sequence]): One list of values per query.
+        - pad_id: The value used to fill the rows shorter than the longest one. Defaults to -1.
+        - dtype (optional): The dtype of the matrix. Defaults to the dtype NumPy infers from the values.
+
+    Returns:
+        - matrix (np.ndarray): A (len(sequences), longest length) matrix.
+    '''
+    lengths = np.fromiter((len(sequence) for sequence in sequences), dtype = np.int64, count = len(sequences))
+    values = np.asarray([value for sequence in sequences for value in sequence], dtype = dtype)
+    if values.dtype.kind in 'US' and np.asarray(pad_id).dtype.kind in 'US':
+        values = values.astype(np.result_type(values, np.asarray(pad_id)))
+    matrix = np.full((len(sequences), int(lengths.max(initial = 0))), pad_id, dtype = values.dtype if len(values) else dtype)
+    matrix[np.arange(matrix.shape[1]) < lengths[:, None]] = values
+    return matrix
+
+
+
+def _as_matrix(values, name: str) -> np.ndarray:
+    matrix = np.asarray(values)
+    if matrix.ndim == 1:
+        matrix = matrix[:, None]
+    if matrix.ndim != 2:
+        raise ValueError(f'{name} must be a 1D array or a 2D (queries x ranks) matrix')
+    return matrix
+
+
+
+def retrieval_relevance(retrieved, relevant, relevance_scores = None, pad_id = -1) -> np.ndarray:
+    '''
+    Looks up the relevance of every retrieved document for a whole batch of queries, without a per-query loop.
+
+    Each (query, document ID) pair is encoded as a single sortable key, the keys of the relevant documents are
+    sorted once, and every retrieved document is found with one vectorized binary search.
+
+    Inputs:
+        - retrieved (array): A (queries x ranks) matrix of retrieved document IDs in rank order, padded with `pad_id`. Each row should list distinct documents.
+        - relevant (array): A (queries x max relevant) matrix of the relevant document IDs of each query, padded with `pad_id`.
+        - relevance_scores (array, optional): Graded relevance labels aligned with `relevant`. Defaults to 1 for every relevant document.
+        - pad_id: The padding value. Defaults to -1.
+
+    Returns:
+        - labels (np.ndarray): A (queries x ranks) float64 matrix with the relevance of each retrieved document, 0 when it is not relevant.
+    '''
+    retrieved = _as_matrix(retrieved, 'retrieved')
+    relevant = _as_matrix(relevant, 'relevant')
+    if len(retrieved) != len(relevant):
+        raise ValueError(f'retrieved and relevant must have one row per query, got {len(retrieved)} and {len(relevant)} rows')
+    retrieved_mask = retrieved != pad_id
+    relevant_mask = relevant != pad_id
+    if relevance_scores is None:
+        scores = np.ones(int(relevant_mask.sum()))
+    else:
+        scores = _as_matrix(relevance_scores, 'relevance_scores').astype(np.float64)[relevant_mask]
+
+    # Encoding each (query, ID) pair as row * stride + ID, ranking the IDs densely first unless they are small non-negative integers
+    retrieved_rows = np.nonzero(retrieved_mask)[0]
+    relevant_rows = np.nonzero(relevant_mask)[0]
+    retrieved_ids = retrieved[retrieved_mask]
+    relevant_ids = relevant[relevant_mask]
+    small_integers = False
+    if retrieved.dtype.kind in 'iu' and relevant.dtype.kind in 'iu':
+        lowest = min(retrieved_ids.min(initial = 0), relevant_ids.min(initial = 0))
+        stride = int(max(retrieved_ids.max(initial = 0), relevant_ids.max(initial = 0))) + 1
+        small_integers = lowest >= 0 and stride * max(len(retrieved), 1) < 2 ** 62
+    if small_integers:
+        retrieved_ids = retrieved_ids.astype(np.int64)
+        relevant_ids = relevant_ids.astype(np.int64)
+    else:
+        _, ranks = np.unique(np.concatenate([retrieved_ids, relevant_ids]), return_inverse = True)
+        ranks = ranks.reshape(-1)
+        retrieved_ids, relevant_ids = ranks[:len(retrieved_ids)], ranks[len(retrieved_ids):]
+        stride = int(ranks.max(initial = 0)) + 1
+    retrieved_keys = retrieved_rows * stride + retrieved_ids
+    relevant_keys = relevant_rows * stride + relevant_ids
+
+    # Sorting the relevant keys and binary searching every retrieved key at once
+    order = np.argsort(relevant_keys, kind = 'stable')
+    relevant_keys = relevant_keys[order]
+    scores = scores[order]
+    positions = np.searchsorted(relevant_keys, retrieved_keys)
+    positions = np.minimum(positions, max(len(relevant_keys) - 1, 0))
+    found = relevant_keys[positions] == retrieved_keys if len(relevant_keys) else np.zeros(len(retrieved_keys), dtype = bool)
+
+    labels = np.zeros(retrieved.shape, dtype = np.float64)
+    retrieved_labels = np.zeros(len(retrieved_keys), dtype = np.float64)
+    retrieved_labels[found] = scores[positions[found]]
+    labels[retrieved_mask] = retrieved_labels
+    return labels
+
+
+
+def _resolve_ks(ks: Union[int, Sequence[int]]) -> List[int]:
+    ks = [ks] if isinstance(ks, (int, np.integer)) else list(ks)
+    if not ks or any(k <= 0 for k in ks):
+        raise ValueError('ks must be one or more positive integers')
+    return [int(k) for k in ks]
+
+
+
+def _validate_retrieval_metric_names(metrics: Optional[Sequence[str]]) -> List[str]:
+    if metrics is None:
+        return list(RETRIEVAL_METRICS)
+    unknown = [name for name in metrics if name not in RETRIEVAL_METRICS]
+    if unknown:
+        raise ValueError(f"Unknown retrieval metric(s) {unknown}. Available metrics: {list(RETRIEVAL_METRICS)}")
+    return list(metrics)
+
+
+
+def _apply_gain(labels: np.ndarray, gain: str) -> np.ndarray:
+    if gain == 'linear':
+        return labels
+    if gain == 'exponential':
+        return np.exp2(labels) - 1.0
+    raise ValueError(f"Unknown gain {gain!r}. Available gains: {list(RETRIEVAL_GAINS)}")
+
+
+
+def _label_metrics(labels: np.ndarray,
+                   num_relevant: np.ndarray,
+                   ideal_labels: np.ndarray,
+                   ks: List[int],
+                   metrics: List[str],
+                   gain: str) -> Dict[str, np.ndarray]:
+    # Evaluating every metric at every cutoff from cumulative sums over the rank axis of one chunk of queries
+    num_queries, num_ranks = labels.shape
+    hits = labels > 0
+    cumulative_hits = np.zeros((num_queries, num_ranks + 1), dtype = np.int64)
+    np.cumsum(hits, axis = 1, out = cumulative_hits[:, 1:])
+    has_relevant = num_relevant > 0
+
+    results = {}
+    if 'mrr' in metrics:
+        first_hit = np.where(hits.any(axis = 1), hits.argmax(axis = 1), num_ranks) if num_ranks else np.zeros(num_queries, dtype = np.int64)
+    if 'ndcg' in metrics:
+        discounts = 1.0 / np.log2(np.arange(2, max(max(ks), num_ranks, ideal_labels.shape[1]) + 2))
+        cumulative_dcg = np.zeros((num_queries, num_ranks + 1))
+        np.cumsum(_apply_gain(labels, gain) * discounts[:num_ranks], axis = 1, out = cumulative_dcg[:, 1:])
+        ideal_gains = -np.sort(-_apply_gain(ideal_labels, gain), axis = 1)
+        cumulative_ideal = np.zeros((num_queries, ideal_gains.shape[1] + 1))
+        np.cumsum(ideal_gains * discounts[:ideal_gains.shape[1]], axis = 1, out = cumulative_ideal[:, 1:])
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        for k in ks:
+            cutoff = min(k, num_ranks)
+            hits_at_k = cumulative_hits[:, cutoff]
+            if 'recall' in metrics:
+                results[f'recall@{k}'] = np.where(has_relevant, hits_at_k / num_relevant, np.nan)
+            if 'precision' in metrics:
+                results[f'precision@{k}'] = hits_at_k / k
+            if 'hit_rate' in metrics:
+                results[f'hit_rate@{k}'] = (hits_at_k > 0).astype(np.float64)
+            if 'mrr' in metrics:
+                results[f'mrr@{k}'] = np.where(first_hit < cutoff, 1.0 / (first_hit + 1), 0.0)
+            if 'ndcg' in metrics:
+                ideal = cumulative_ideal[:, min(k, ideal_gains.shape[1])]
+                results[f'ndcg@{k}'] = np.where(ideal > 0, cumulative_dcg[:, cutoff] / ideal, np.nan)
+    return {f'{name}@{k}': results[f'{name}@{k}'] for name in metrics for k in ks}
+
+
+
+def _reduce(per_query: Dict[str, List[np.ndarray]], reduce: Optional[str]):
+    columns = {name: np.concatenate(chunks) if chunks else np.zeros(0) for name, chunks in per_query.items()}
+    if reduce is None:
+        return columns
+    if reduce != 'mean':
+        raise ValueError("reduce must be 'mean' or None")
+    # Averaging over the queries each metric is defined for (recall and nDCG are undefined without relevant documents)
+    with np.errstate(invalid = 'ignore'):
+        return {name: float(np.nanmean(values)) if np.any(~np.isnan(values)) else float('nan') for name, values in columns.items()}
+
+
+
+def calculate_retrieval_metrics(retrieved,
+                                relevant,
+                                ks: Union[int, Sequence[int]] = (1, 5, 10),
+                                metrics: Optional[List[str]] = None,
+                                relevance_scores = None,
+                                pad_id = -1,
+                                gain: str = 'linear',
+                                reduce: Optional[str] = 'mean',
+                                chunk_size: int = 100_000) -> Dict[str, Union[float, np.ndarray]]:
+    '''
+    Computes recall@k, precision@k, hit rate@k, MRR@k, and nDCG@k over a whole evaluation set at once.
+
+    Queries are processed in chunks of `chunk_size` rows; within a chunk every metric at every k is evaluated with
+    matrix operations (a vectorized relevance lookup, then cumulative sums over the rank axis), with no per-query loop.
+
+    Inputs:
+        - retrieved (array): A (queries x ranks) matrix of retrieved document IDs in rank order, padded with `pad_id`. Each row should list distinct documents.
+        - relevant (array): A (queries x max relevant) matrix of the relevant document IDs of each query, padded with `pad_id`. See `pad_ragged`.
+        - ks (int | sequence[int]): The cutoffs to evaluate. Defaults to (1, 5, 10).
+        - metrics (list[str], optional): The metrics to compute, from `RETRIEVAL_METRICS`. Defaults to every metric.
+        - relevance_scores (array, optional): Graded relevance labels aligned with `relevant`, used by nDCG. Defaults to binary relevance.
+        - pad_id: The padding value. Defaults to -1.
+        - gain (str): The nDCG gain, 'linear' (the label) or 'exponential' (2^label - 1). Defaults to 'linear'.
+        - reduce (str, optional): 'mean' (default) to average each metric over the queries, or None to return the per-query values.
+        - chunk_size (int): The number of queries evaluated at a time, which bounds memory. Defaults to 100,000.
+
+    Returns:
+        - results (dict): A value for each '<metric>@<k>': the mean over the queries, or a per-query float64 array when `reduce` is None.
+          Recall and nDCG are NaN for queries without relevant documents, and the mean skips them.
+    '''
+    ks = _resolve_ks(ks)
+    metrics = _validate_retrieval_metric_names(metrics)
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be a positive integer')
+    retrieved = _as_matrix(retrieved, 'retrieved')
+    relevant = _as_matrix(relevant, 'relevant')
+    if relevance_scores is not None:
+        relevance_scores = _as_matrix(relevance_scores, 'relevance_scores')
+
+    per_query = {f'{name}@{k}': [] for name in metrics for k in ks}
+    for start in range(0, len(retrieved), chunk_size):
+        stop = start + chunk_size
+        relevant_chunk = relevant[start:stop]
+        scores_chunk = None if relevance_scores is None else relevance_scores[start:stop]
+        labels = retrieval_relevance(retrieved[start:stop], relevant_chunk, scores_chunk, pad_id = pad_id)
+
+        # The ideal ranking lists every relevant document, retrieved or not, in decreasing order of relevance
+        relevant_mask = relevant_chunk != pad_id
+        ideal_labels = relevant_mask.astype(np.float64) if scores_chunk is None else np.where(relevant_mask, scores_chunk, 0.0).astype(np.float64)
+        num_relevant = (ideal_labels > 0).sum(axis = 1)
+        for name, values in _label_metrics(labels, num_relevant, ideal_labels, ks, metrics, gain).items():
+            per_query[name].append(values)
+    return _reduce(per_query, reduce)
+
+
+
+def calculate_retrieval_metrics_from_labels(labels,
+                                            ks: Union[int, Sequence[int]] = (1, 5, 10),
+                                            metrics: Optional[List[str]] = None,
+                                            num_relevant = None,
+                                            ideal_labels = None,
+                                            gain: str = 'linear',
+                                            reduce: Optional[str] = 'mean',
+                                            chunk_size: int = 100_000) -> Dict[str, Union[float, np.ndarray]]:
+    '''
+    Computes the retrieval metrics from relevance labels that are already aligned with the ranked results.
+
+    Inputs:
+        - labels (array): A (queries x ranks) matrix of the relevance of each retrieved document in rank order (0 when not relevant, pad with 0).
+        - ks (int | sequence[int]): The cutoffs to evaluate. Defaults to (1, 5, 10).
+        - metrics (list[str], optional): The metrics to compute, from `RETRIEVAL_METRICS`. Defaults to every metric.
+        - num_relevant (array, optional): The total number of relevant documents of each query, used by recall. Defaults to the number of relevant results in `labels`.
+        - ideal_labels (array, optional): A (queries x max relevant) matrix of the labels of every relevant document of each query, used by nDCG. Defaults to `labels`.
+        - gain (str): The nDCG gain, 'linear' (the label) or 'exponential' (2^label - 1). Defaults to 'linear'.
+        - reduce (str, optional): 'mean' (default) to average each metric over the queries, or None to return the per-query values.
+        - chunk_size (int): The number of queries evaluated at a time, which bounds memory. Defaults to 100,000.
+
+    Returns:
+        - results (dict): A value for each '<metric>@<k>', as returned by `calculate_retrieval_metrics`.
+    '''
+    ks = _resolve_ks(ks)
+    metrics = _validate_retrieval_metric_names(metrics)
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be a positive integer')
+    labels = _as_matrix(labels, 'labels')
+    if ideal_labels is not None:
+        ideal_labels = _as_matrix(ideal_labels, 'ideal_labels')
+    if num_relevant is not None:
+        num_relevant = np.asarray(num_relevant)
+
+    per_query = {f'{name}@{k}': [] for name in metrics for k in ks}
+    for start in range(0, len(labels), chunk_size):
+        stop = start + chunk_size
+        labels_chunk = labels[start:stop].astype(np.float64)
+        ideal_chunk = labels_chunk if ideal_labels is None else ideal_labels[start:stop].astype(np.float64)
+        relevant_chunk = (ideal_chunk > 0).sum(axis = 1) if num_relevant is None else num_relevant[start:stop]
+        for name, values in _label_metrics(labels_chunk, relevant_chunk, ideal_chunk, ks, metrics, gain).items():
+            per_query[name].append(values)
+    return _reduce(per_query, reduce)
+
+
+
+def calculate_recall_at_k(retrieved, relevant, k: int = 10, pad_id = -1) -> np.ndarray:
+    '''
+    Computes recall@k, the fraction of each query's relevant documents found in its top k results.
+
+    Inputs:
+        - retrieved (array): A (queries x ranks) matrix of retrieved document IDs in rank order, padded with `pad_id`.
+        - relevant (array): A (queries x max relevant) matrix of relevant document IDs, padded with `pad_id`.
+        - k (int): The cutoff. Defaults to 10.
+        - pad_id: The padding value. Defaults to -1.
+
+    Returns:
+        - recall (np.ndarray): The recall@k of each query, NaN for queries without relevant documents.
+    '''
+    return calculate_retrieval_metrics(retrieved, relevant, ks = k, metrics = ['recall'], pad_id = pad_id, reduce = None)[f'recall@{k}']
+
+
+
+def calculate_precision_at_k(retrieved, relevant, k: int = 10, pad_id = -1) -> np.ndarray:
+    '''
+    Computes precision@k, the fraction of each query's top k results that are relevant.
+
+    Inputs:
+        - retrieved (array): A (queries x ranks) matrix of retrieved document IDs in rank order, padded with `pad_id`.
+        - relevant (array): A (queries x max relevant) matrix of relevant document IDs, padded with `pad_id`.
+        - k (int): The cutoff. Defaults to 10.
+        - pad_id: The padding value. Defaults to -1.
+
+    Returns:
+        - precision (np.ndarray): The precision@k of each query. Missing results count as not relevant.
+    '''
+    return calculate_retrieval_metrics(retrieved, relevant, ks = k, metrics = ['precision'], pad_id = pad_id, reduce = None)[f'precision@{k}']
+
+
+
+def calculate_hit_rate_at_k(retrieved, relevant, k: int = 10, pad_id = -1) -> np.ndarray:
+    '''
+    Computes hit rate@k, whether any relevant document appears in each query's top k results.
+
+    Inputs:
+        - retrieved (array): A (queries x ranks) matrix of retrieved document IDs in rank order, padded with `pad_id`.
+        - relevant (array): A (queries x max relevant) matrix of relevant document IDs, padded with `pad_id`.
+        - k (int): The cutoff. Defaults to 10.
+        - pad_id: The padding value. Defaults to -1.
+
+    Returns:
+        - hit_rate (np.ndarray): 1.0 for each query with a relevant document in its top k results, otherwise 0.0.
+    '''
+    return calculate_retrieval_metrics(retrieved, relevant, ks = k, metrics = ['hit_rate'], pad_id = pad_id, reduce = None)[f'hit_rate@{k}']
+
+
+
+def calculate_mean_reciprocal_rank(retrieved, relevant, k: int = 10, pad_id = -1) -> float:
+    '''
+    Computes MRR@k, the mean over the queries of the reciprocal rank of the first relevant result within the top k.
+
+    Inputs:
+        - retrieved (array): A (queries x ranks) matrix of retrieved document IDs in rank order, padded with `pad_id`.
+        - relevant (array): A (queries x max relevant) matrix of relevant document IDs, padded with `pad_id`.
+        - k (int): The cutoff. Defaults to 10.
+        - pad_id: The padding value. Defaults to -1.
+
+    Returns:
+        - mrr (float): The mean reciprocal rank, counting queries without a relevant result in the top k as 0.
+    '''
+    return calculate_retrieval_metrics(retrieved, relevant, ks = k, metrics = ['mrr'], pad_id = pad_id)[f'mrr@{k}']
+
+
+
+def calculate_ndcg_at_k(retrieved, relevant, k: int = 10, relevance_scores = None, pad_id = -1, gain: str = 'linear') -> np.ndarray:
+    '''
+    Computes nDCG@k, the discounted cumulative gain of each query's top k results relative to the ideal ranking.
+
+    Inputs:
+        - retrieved (array): A (queries x ranks) matrix of retrieved document IDs in rank order, padded with `pad_id`.
+        - relevant (array): A (queries x max relevant) matrix of relevant document IDs, padded with `pad_id`.
+        - k (int): The cutoff. Defaults to 10.
+        - relevance_scores (array, optional): Graded relevance labels aligned with `relevant`. Defaults to binary relevance.
+        - pad_id: The padding value. Defaults to -1.
+        - gain (str): 'linear' (the label) or 'exponential' (2^label - 1). Defaults to 'linear'.
+
+    Returns:
+        - ndcg (np.ndarray): The nDCG@k of each query, NaN for queries without relevant documents.
+    '''
+    return calculate_retrieval_metrics(retrieved, relevant, ks = k, metrics = ['ndcg'], relevance_scores = relevance_scores,
+                                       pad_id = pad_id, gain = gain, reduce = None)[f'ndcg@{k}']
+
+
+
+# Multipliers that combine the word hashes of an n-gram into one shingle hash, and the splitmix64 finalizer constants
+_SHINGLE_MULTIPLIERS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+                                 0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB, 0xBF58476D1CE4E5B9], dtype = np.uint64)
+_MIX_MULTIPLIERS = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+
+# The value that fills the signatures of texts with no shingles, which are never indexed or compared
+_EMPTY_HASH = np.uint32(0xFFFFFFFF)
+
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    # The splitmix64 finalizer, which spreads the bits of combined hashes before they are permuted or banded
+    values = values ^ (values >> np.uint64(30))
+    values = values * _MIX_MULTIPLIERS[0]
+    values = values ^ (values >> np.uint64(27))
+    values = values * _MIX_MULTIPLIERS[1]
+    return values ^ (values >> np.uint64(31))
+
+
+
+def minhash_num_perm(error: float) -> int:
+    '''
+    Computes the number of MinHash permutations needed for a target accuracy.
+
+    The standard error of a MinHash Jaccard estimate with `num_perm` permutations is at most 1 / sqrt(num_perm).
+
+    Inputs:
+        - error (float): The largest acceptable standard error of the Jaccard estimates, such as 0.05.
+
+    Returns:
+        - num_perm (int): The number of permutations.
+    '''
+    if not 0 < error < 1:
+        raise ValueError('error must be between 0 and 1')
+    return math.ceil(1.0 / error ** 2)
+
+
+
+class MinHashSignatures(NamedTuple):
+    '''
+    MinHash signatures of a batch of texts, as returned by `MinHasher.signatures`.
+
+    Fields:
+        - signatures (np.ndarray): A (texts x num_perm) uint32 matrix of minimum permuted shingle hashes.
+        - sizes (np.ndarray): The number of distinct shingles of each text, used to turn Jaccard estimates into containment.
+    '''
+    signatures: np.ndarray
+    sizes: np.ndarray
+
+
+
+class MinHasher:
+    '''
+    Computes hashed word n-gram shingles and MinHash signatures for batches of texts.
+
+    Texts are lowercased and split into `\\w+` words; each distinct word is hashed once, and the word hashes are
+    combined into n-gram shingle hashes with vectorized arithmetic over the whole batch. Each of the `num_perm`
+    permutations is a multiply-add hash of the shingle hashes, and the signature of a text is the per-permutation
+    minimum, evaluated over chunks of shingles so memory stays bounded. The fraction of equal signature entries of
+    two texts estimates the Jaccard similarity of their shingle sets with a standard error of at most
+    1 / sqrt(num_perm) (see `minhash_num_perm`).
+
+    Inputs:
+        - num_perm (int): The number of permutations (signature length). Defaults to 128.
+        - ngram (int): The number of words per shingle. Defaults to 3; texts with fewer words form one shingle.
+        - seed (int): The seed of the permutations. Signatures are only comparable between hashers with the same settings. Defaults to 1.
+        - chunk_size (int): The number of shingles hashed at a time. Defaults to 16,384.
+    '''
+
+    def __init__(self, num_perm: int = 128, ngram: int = 3, seed: int = 1, chunk_size: int = 16_384):
+        if num_perm <= 0:
+            raise ValueError('num_perm must be a positive integer')
+        if not 0 < ngram <= len(_SHINGLE_MULTIPLIERS):
+            raise ValueError(f'ngram must be between 1 and {len(_SHINGLE_MULTIPLIERS)}')
+        self.num_perm = num_perm
+        self.ngram = ngram
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+        # Drawing the multiply-add permutations; odd multipliers make each permutation a bijection of 64-bit hashes
+        rng = np.random.default_rng(seed)
+        self._multipliers = rng.integers(0, 2 ** 63, size = num_perm, dtype = np.uint64) * np.uint64(2) + np.uint64(1)
+        self._increments = rng.integers(0, 2 ** 63, size = num_perm, dtype = np.uint64)
+
+
+    def shingle_hashes(self, texts: Sequence[Union[str, Sequence[str]]]) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Computes the distinct shingle hashes of a batch of texts.
+
+        Inputs:
+            - texts (sequence): The texts. An item may also be a list of texts, such as the retrieved contexts of one answer,
+              whose shingle sets are unioned (shingles never span two texts).
+
+        Returns:
+            - item_ids (np.ndarray): The index of the item each shingle belongs to, in increasing order.
+            - hashes (np.ndarray): The uint64 shingle hashes, distinct within each item.
+        '''
+        # Flattening the items into texts and splitting every text into lowercased words
+        text_items = []
+        words = []
+        lengths = []
+        for item, value in enumerate(texts):
+            for text in ([value] if isinstance(value, str) else value):
+                text_words = WORD_PATTERN.findall(text.lower())
+                words.extend(text_words)
+                lengths.append(len(text_words))
+                text_items.append(item)
+        if not words:
+            return np.zeros(0, dtype = np.int64), np.zeros(0, dtype = np.uint64)
+
+        # Hashing each distinct word once
+        vocabulary = {word: code for code, word in enumerate(dict.fromkeys(words))}
+        word_codes = np.fromiter(map(vocabulary.__getitem__, words), dtype = np.int64, count = len(words))
+        digests = b''.join(zlib.crc32(word.encode('utf-8')).to_bytes(4, 'little') + zlib.adler32(word.encode('utf-8')).to_bytes(4, 'little')
+                           for word in vocabulary)
+        word_hashes = _mix64(np.frombuffer(digests, dtype = '<u8').astype(np.uint64))[word_codes]
+
+        # Combining n consecutive word hashes into a shingle hash wherever the n words belong to the same text
+        lengths = np.asarray(lengths, dtype = np.int64)
+        word_texts = np.repeat(np.arange(len(lengths)), lengths)
+        n = self.ngram
+        num_starts = max(len(words) - n + 1, 0)
+        combined = np.zeros(num_starts, dtype = np.uint64)
+        for offset in range(n):
+            combined += word_hashes[offset:offset + num_starts] * _SHINGLE_MULTIPLIERS[offset]
+        valid = word_texts[:num_starts] == word_texts[n - 1:n - 1 + num_starts]
+        hashes = [combined[valid]]
+        shingle_texts = [word_texts[:num_starts][valid]]
+
+        # Texts shorter than n words form a single shingle of all their words
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        for text in np.nonzero((lengths > 0) & (lengths < n))[0]:
+            start = starts[text]
+            value = np.zeros(1, dtype = np.uint64)
+            for offset in range(lengths[text]):
+                value += word_hashes[start + offset:start + offset + 1] * _SHINGLE_MULTIPLIERS[offset]
+            hashes.append(value)
+            shingle_texts.append(np.array([text]))
+
+        # Deduplicating the shingles of each item and sorting them by item
+        hashes = _mix64(np.concatenate(hashes))
+        item_ids = np.asarray(text_items, dtype = np.int64)[np.concatenate(shingle_texts)]
+        order = np.lexsort((hashes, item_ids))
+        item_ids, hashes = item_ids[order], hashes[order]
+        distinct = np.ones(len(hashes), dtype = bool)
+        distinct[1:] = (item_ids[1:] != item_ids[:-1]) | (hashes[1:] != hashes[:-1])
+        return item_ids[distinct], hashes[distinct]
+
+
+    def signatures(self, texts: Sequence[Union[str, Sequence[str]]]) -> MinHashSignatures:
+        '''
+        Computes the MinHash signatures of a batch of texts.
+
+        Inputs:
+            - texts (sequence): The texts. An item may also be a list of texts, whose shingle sets are unioned.
+
+        Returns:
+            - signatures (MinHashSignatures): The (texts x num_perm) signatures and the shingle set sizes. Texts without
+              words get the empty signature and size 0.
+        '''
+        item_ids, hashes = self.shingle_hashes(texts)
+        signatures = np.full((len(texts), self.num_perm), _EMPTY_HASH, dtype = np.uint32)
+
+        # Permuting a chunk of shingles at a time, laid out (permutations x shingles) so each item's shingles are
+        # contiguous, and folding the per-item minimums of each chunk into the signatures
+        buffer = np.empty((self.num_perm, min(self.chunk_size, len(hashes))), dtype = np.uint64)
+        for start in range(0, len(hashes), self.chunk_size):
+            chunk_items = item_ids[start:start + self.chunk_size]
+            permuted = buffer[:, :len(chunk_items)]
+            np.multiply(self._multipliers[:, None], hashes[None, start:start + self.chunk_size], out = permuted)
+            permuted += self._increments[:, None]
+            permuted >>= np.uint64(32)
+            segment_starts = np.flatnonzero(np.concatenate([[True], chunk_items[1:] != chunk_items[:-1]]))
+            items = chunk_items[segment_starts]
+            minimums = np.minimum.reduceat(permuted, segment_starts, axis = 1).T.astype(np.uint32)
+            signatures[items] = np.minimum(signatures[items], minimums)
+        return MinHashSignatures(signatures, np.bincount(item_ids, minlength = len(texts)))
+
+
+
+def estimate_jaccard(a: MinHashSignatures, b: MinHashSignatures) -> np.ndarray:
+    '''
+    Estimates the Jaccard similarity of the shingle sets of paired texts from their MinHash signatures.
+
+    Inputs:
+        - a (MinHashSignatures): The signatures of the first text of each pair.
+        - b (MinHashSignatures): The signatures of the second text of each pair, row-aligned with `a`.
+
+    Returns:
+        - jaccard (np.ndarray): The estimated Jaccard similarity of each pair, 0 when either text has no shingles.
+    '''
+    jaccard = (a.signatures == b.signatures).mean(axis = 1)
+    return np.where((a.sizes > 0) & (b.sizes > 0), jaccard, 0.0)
+
+
+
+def estimate_containment(a: MinHashSignatures, b: MinHashSignatures) -> np.ndarray:
+    '''
+    Estimates the fraction of each first text's shingles that also appear in the second text, such as the share of an
+    answer's n-grams found in its context, from the Jaccard estimate and the two set sizes.
+
+    Inputs:
+        - a (MinHashSignatures): The signatures of the contained text of each pair, such as the answers.
+        - b (MinHashSignatures): The signatures of the containing text of each pair, such as the contexts.
+
+    Returns:
+        - containment (np.ndarray): The estimated containment of each pair, between 0 and 1.
+    '''
+    return _containment(estimate_jaccard(a, b), a.sizes, b.sizes)
+
+
+
+def _containment(jaccard: np.ndarray, sizes_a: np.ndarray, sizes_b: np.ndarray) -> np.ndarray:
+    # |A ∩ B| = J (|A| + |B|) / (1 + J), divided by |A|
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        containment = jaccard * (sizes_a + sizes_b) / ((1.0 + jaccard) * sizes_a)
+    return np.clip(np.where(sizes_a > 0, containment, 0.0), 0.0, 1.0)
+
+
+
+@lru_cache(maxsize = None)
+def _optimal_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    # Choosing the (bands, rows) split whose S-curve minimizes the false positive plus false negative probability mass around the threshold
+    similarities = np.linspace(0.0, 1.0, 1_001)
+    below = similarities < threshold
+    best = None
+    for num_bands in range(1, num_perm + 1):
+        rows = num_perm // num_bands
+        probabilities = 1.0 - (1.0 - similarities ** rows) ** num_bands
+        error = probabilities[below].sum() + (1.0 - probabilities[~below]).sum()
+        if best is None or error < best[0]:
+            best = (error, num_bands, rows)
+    return best[1], best[2]
+
+
+
+def _containment_threshold(min_containment: float, sizes_a: np.ndarray, size_b: int) -> np.ndarray:
+    # The Jaccard similarity of a set of size |A| with a set of size |B| holding `min_containment` of it, the lowest
+    # similarity a grounded pair can have: J = c |A| / (|A| + |B| - c |A|)
+    contained = min_containment * sizes_a
+    return contained / (sizes_a + size_b - contained)
+
+
+
+class MinHashLSHIndex:
+    '''
+    Locality-sensitive hashing index of MinHash signatures, such as those of a pool of retrieval contexts.
+
+    Each signature is cut into `num_bands` bands of `rows_per_band` entries and every band is hashed to one key.
+    Two texts become candidates when any of their band keys match, which happens with probability
+    1 - (1 - J^rows)^bands for Jaccard similarity J, so the bands are chosen to make that S-curve steep around
+    `threshold`. The band keys of the indexed texts are kept as sorted arrays, so a whole batch of queries is looked
+    up with vectorized binary searches and no pairwise comparisons.
+
+    Note that `threshold` is a Jaccard threshold: a short answer fully contained in a long context still has a low
+    Jaccard similarity with it. `candidates` can band for a lower threshold than the index's, which is how
+    `flag_ungrounded_answers` finds contained answers; each banding's sorted keys are built once on first use.
+
+    Inputs:
+        - hasher (MinHasher, optional): The hasher whose signatures are indexed. Defaults to `MinHasher()`.
+        - threshold (float): The Jaccard similarity around which candidates are found. Defaults to 0.5.
+        - num_bands (int, optional): The number of bands. Defaults to the split that best separates similarities around `threshold`.
+    '''
+
+    def __init__(self, hasher: Optional[MinHasher] = None, threshold: float = 0.5, num_bands: Optional[int] = None):
+        if not 0 < threshold < 1:
+            raise ValueError('threshold must be between 0 and 1')
+        self.hasher = MinHasher() if hasher is None else hasher
+        self.threshold = threshold
+        if num_bands is None:
+            self.num_bands, self.rows_per_band = _optimal_bands(self.hasher.num_perm, threshold)
+        else:
+            if not 0 < num_bands <= self.hasher.num_perm:
+                raise ValueError('num_bands must be between 1 and num_perm')
+            self.num_bands, self.rows_per_band = num_bands, self.hasher.num_perm // num_bands
+
+        self._signature_chunks: List[np.ndarray] = []
+        self._size_chunks: List[np.ndarray] = []
+        self._id_chunks: List[np.ndarray] = []
+        self._built = None
+        self._band_tables: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+
+    def __len__(self) -> int:
+        return sum(len(sizes) for sizes in self._size_chunks)
+
+
+    def _band_keys(self, signatures: np.ndarray, num_bands: int, rows_per_band: int) -> np.ndarray:
+        # Hashing each band of each signature to a uint64 key
+        bands = signatures[:, :num_bands * rows_per_band].reshape(len(signatures), num_bands, rows_per_band)
+        return _mix64((bands.astype(np.uint64) * _SHINGLE_MULTIPLIERS[np.arange(rows_per_band) % len(_SHINGLE_MULTIPLIERS)]
+                       + np.arange(1, rows_per_band + 1, dtype = np.uint64)).sum(axis = 2, dtype = np.uint64))
+
+
+    def add(self, signatures: MinHashSignatures, ids = None) -> None:
+        '''
+        Adds signatures to the index.
+
+        Inputs:
+            - signatures (MinHashSignatures): The signatures, from this index's hasher.
+            - ids (array, optional): An ID for each signature, returned by searches. Defaults to consecutive integers in insertion order.
+        '''
+        if signatures.signatures.shape[1] != self.hasher.num_perm:
+            raise ValueError(f'Expected signatures of length {self.hasher.num_perm}, got {signatures.signatures.shape[1]}')
+        if ids is None:
+            ids = np.arange(len(self), len(self) + len(signatures.sizes))
+        ids = np.asarray(ids)
+        if len(ids) != len(signatures.sizes):
+            raise ValueError('ids must have one entry per signature')
+        self._signature_chunks.append(signatures.signatures)
+        self._size_chunks.append(np.asarray(signatures.sizes))
+        self._id_chunks.append(ids)
+        self._built = None
+        self._band_tables = {}
+
+
+    def add_texts(self, texts: Sequence[Union[str, Sequence[str]]], ids = None) -> None:
+        '''
+        Computes the signatures of a batch of texts with the index's hasher and adds them.
+
+        Inputs:
+            - texts (sequence): The texts, such as retrieval contexts.
+            - ids (array, optional): An ID for each text. Defaults to consecutive integers in insertion order.
+        '''
+        self.add(self.hasher.signatures(texts), ids = ids)
+
+
+    def _build(self):
+        # Concatenating the added signatures once, on the first search after a change
+        if self._built is None:
+            signatures = np.concatenate(self._signature_chunks) if self._signature_chunks else np.zeros((0, self.hasher.num_perm), dtype = np.uint32)
+            sizes = np.concatenate(self._size_chunks) if self._size_chunks else np.zeros(0, dtype = np.int64)
+            ids = np.concatenate(self._id_chunks) if self._id_chunks else np.zeros(0, dtype = np.int64)
+            self._signature_chunks, self._size_chunks, self._id_chunks = [signatures], [sizes], [ids]
+            self._built = (signatures, sizes, ids)
+        return self._built
+
+
+    def _band_table(self, num_bands: int, rows_per_band: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Sorting every band's keys once per banding; texts without shingles share the empty signature and are never candidates
+        table = self._band_tables.get((num_bands, rows_per_band))
+        if table is None:
+            signatures, sizes, _ = self._build()
+            indexed = np.flatnonzero(sizes > 0)
+            keys = self._band_keys(signatures[indexed], num_bands, rows_per_band).T
+            order = np.argsort(keys, axis = 1, kind = 'stable')
+            table = (np.take_along_axis(keys, order, axis = 1), indexed[order])
+            self._band_tables[(num_bands, rows_per_band)] = table
+        return table
+
+
+    def candidates(self, signatures: MinHashSignatures, threshold: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Finds the indexed texts that share at least one band with each query.
+
+        Inputs:
+            - signatures (MinHashSignatures): The signatures of the queries.
+            - threshold (float, optional): The Jaccard similarity to band for, such as a lower one to find contained texts. Defaults to the index's bands.
+
+        Returns:
+            - query_index (np.ndarray): The position of the query of each candidate pair.
+            - position (np.ndarray): The insertion position of the indexed text of each candidate pair. Pairs are distinct.
+        '''
+        if threshold is None:
+            num_bands, rows_per_band = self.num_bands, self.rows_per_band
+        else:
+            if not 0 < threshold < 1:
+                raise ValueError('threshold must be between 0 and 1')
+            num_bands, rows_per_band = _optimal_bands(self.hasher.num_perm, threshold)
+        sorted_keys, sorted_positions = self._band_table(num_bands, rows_per_band)
+        queries = np.flatnonzero(signatures.sizes > 0)
+        query_keys = self._band_keys(signatures.signatures[queries], num_bands, rows_per_band)
+        pairs = []
+        for band in range(num_bands):
+            # Every indexed text whose band key equals the query's lies in one run of the sorted keys
+            left = np.searchsorted(sorted_keys[band], query_keys[:, band], side = 'left')
+            counts = np.searchsorted(sorted_keys[band], query_keys[:, band], side = 'right') - left
+            total = int(counts.sum())
+            if not total:
+                continue
+            query_index = np.repeat(queries, counts)
+            run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            positions = sorted_positions[band][np.repeat(left, counts) + run_offsets]
+            pairs.append((query_index.astype(np.int64) << 32) | positions)
+        if not pairs:
+            return np.zeros(0, dtype = np.int64), np.zeros(0, dtype = np.int64)
+        pairs = np.unique(np.concatenate(pairs))
+        return pairs >> 32, pairs & 0xFFFFFFFF
+
+
+    def search(self, signatures: MinHashSignatures, min_jaccard: Optional[float] = None) -> Dict[str, np.ndarray]:
+        '''
+        Finds the indexed texts similar to each query and estimates their similarity.
+
+        Inputs:
+            - signatures (MinHashSignatures): The signatures of the queries.
+            - min_jaccard (float, optional): Drops candidate pairs whose estimated Jaccard similarity is below this. Defaults to the index threshold.
+
+        Returns:
+            - results (dict): Row-aligned arrays over the matching pairs: 'query' (the query position), 'id' (the indexed text's ID),
+              'jaccard' (the estimated Jaccard similarity), and 'containment' (the estimated share of the query's shingles in the indexed text).
+        '''
+        indexed_signatures, indexed_sizes, ids = self._build()
+        query_index, positions = self.candidates(signatures)
+        jaccard = (signatures.signatures[query_index] == indexed_signatures[positions]).mean(axis = 1) if len(query_index) else np.zeros(0)
+        keep = jaccard >= (self.threshold if min_jaccard is None else min_jaccard)
+        query_index, positions, jaccard = query_index[keep], positions[keep], jaccard[keep]
+        return {
+            'query': query_index,
+            'id': ids[positions],
+            'jaccard': jaccard,
+            'containment': _containment(jaccard, signatures.sizes[query_index], indexed_sizes[positions])
+        }
+
+
+    def save(self, path: str) -> None:
+        '''
+        Saves the index (its signatures, sizes, IDs, and settings) to a `.npz` file.
+
+        Inputs:
+            - path (str): The file to write.
+        '''
+        signatures, sizes, ids = self._build()
+        np.savez(path, signatures = signatures, sizes = sizes, ids = ids,
+                 settings = np.array([self.hasher.num_perm, self.hasher.ngram, self.hasher.seed, self.num_bands]), threshold = self.threshold)
+
+
+    @classmethod
+    def load(cls, path: str) -> 'MinHashLSHIndex':
+        '''
+        Loads an index saved with `save`.
+
+        Inputs:
+            - path (str): The `.npz` file to read.
+
+        Returns:
+            - index (MinHashLSHIndex): The index, with a hasher matching the one it was built with.
+        '''
+        with np.load(path) as data:
+            num_perm, ngram, seed, num_bands = (int(value) for value in data['settings'])
+            index = cls(MinHasher(num_perm = num_perm, ngram = ngram, seed = seed), threshold = float(data['threshold']), num_bands = num_bands)
+            index.add(MinHashSignatures(data['signatures'], data['sizes']), ids = data['ids'])
+        return index
+
+
+
+def calculate_ngram_overlap(answers: Sequence[str],
+                            contexts: Sequence[Union[str, Sequence[str]]],
+                            hasher: Optional[MinHasher] = None,
+                            method: str = 'minhash') -> Dict[str, np.ndarray]:
+    '''
+    Computes the word n-gram overlap between each generated answer and its retrieved context(s).
+
+    Inputs:
+        - answers (sequence[str]): The generated answers.
+        - contexts (sequence): The context of each answer, as a text or a list of texts whose n-grams are unioned.
+        - hasher (MinHasher, optional): The shingling and signature settings. Defaults to `MinHasher()` (word trigrams).
+        - method (str): 'minhash' (default) to estimate the overlap from signatures, or 'exact' to compare the hashed shingle sets exactly.
+
+    Returns:
+        - overlap (dict): Per-answer float arrays: 'jaccard' (the Jaccard similarity of the n-gram sets) and 'containment'
+          (the share of the answer's n-grams found in the context, a groundedness score). Both are 0 for answers without words.
+    '''
+    if len(answers) != len(contexts):
+        raise ValueError(f'answers and contexts must have the same length, got {len(answers)} and {len(contexts)}')
+    hasher = MinHasher() if hasher is None else hasher
+    if method == 'minhash':
+        answer_signatures = hasher.signatures(answers)
+        context_signatures = hasher.signatures(contexts)
+        jaccard = estimate_jaccard(answer_signatures, context_signatures)
+        return {'jaccard': jaccard, 'containment': _containment(jaccard, answer_signatures.sizes, context_signatures.sizes)}
+    if method != 'exact':
+        raise ValueError("method must be 'minhash' or 'exact'")
+
+    # Counting each pair's shared shingles by sorting the (pair, hash) keys of both sides together and finding repeats
+    answer_items, answer_hashes = hasher.shingle_hashes(answers)
+    context_items, context_hashes = hasher.shingle_hashes(contexts)
+    answer_sizes = np.bincount(answer_items, minlength = len(answers))
+    context_sizes = np.bincount(context_items, minlength = len(contexts))
+    items = np.concatenate([answer_items, context_items])
+    hashes = np.concatenate([answer_hashes, context_hashes])
+    order = np.lexsort((hashes, items))
+    items, hashes = items[order], hashes[order]
+    shared = (items[1:] == items[:-1]) & (hashes[1:] == hashes[:-1])
+    intersection = np.bincount(items[1:][shared], minlength = len(answers))
+    union = answer_sizes + context_sizes - intersection
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        jaccard = np.where((answer_sizes > 0) & (context_sizes > 0), intersection / union, 0.0)
+        containment = np.where(answer_sizes > 0, intersection / answer_sizes, 0.0)
+    return {'jaccard': jaccard, 'containment': containment}
+
+
+
+def _grounding_candidates(index: MinHashLSHIndex, signatures: MinHashSignatures, min_containment: float) -> Tuple[np.ndarray, np.ndarray]:
+    # Banding each power-of-two size class of answers for the Jaccard similarity its smallest member would have with
+    # the largest indexed context when `min_containment` of the answer is in it, so contained answers are still found
+    _, indexed_sizes, _ = index._build()
+    largest = int(indexed_sizes.max()) if len(indexed_sizes) else 0
+    queries = np.flatnonzero(signatures.sizes > 0)
+    size_classes = np.floor(np.log2(signatures.sizes[queries])).astype(np.int64)
+    pairs = []
+    for size_class in np.unique(size_classes):
+        members = queries[size_classes == size_class]
+        threshold = float(_containment_threshold(min_containment, 2.0 ** size_class, largest))
+        threshold = min(max(math.floor(threshold * 1_000) / 1_000, 0.001), 0.999)
+        query_index, positions = index.candidates(MinHashSignatures(signatures.signatures[members], signatures.sizes[members]), threshold = threshold)
+        pairs.append((members[query_index], positions))
+    if not pairs:
+        return np.zeros(0, dtype = np.int64), np.zeros(0, dtype = np.int64)
+    return np.concatenate([query_index for query_index, _ in pairs]), np.concatenate([positions for _, positions in pairs])
+
+
+
+def _shared_shingles(answer_items: np.ndarray,
+                     answer_hashes: np.ndarray,
+                     num_answers: int,
+                     context_vocabulary: np.ndarray,
+                     context_keys: np.ndarray,
+                     query_index: np.ndarray,
+                     positions: np.ndarray) -> np.ndarray:
+    # Counting, for each (answer, context) pair, the answer shingles found in the context's shingle set. Context
+    # shingles are keyed as (context << 32 | rank of the hash among all context hashes), so each lookup is one binary search
+    answer_sizes = np.bincount(answer_items, minlength = num_answers)
+    answer_starts = np.concatenate([[0], np.cumsum(answer_sizes)[:-1]])
+    counts = answer_sizes[query_index]
+    total = int(counts.sum())
+    pair_ids = np.repeat(np.arange(len(query_index)), counts)
+    hashes = answer_hashes[np.repeat(answer_starts[query_index], counts) + np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)]
+
+    ranks = np.searchsorted(context_vocabulary, hashes)
+    found = context_vocabulary[np.minimum(ranks, len(context_vocabulary) - 1)] == hashes if len(context_vocabulary) else np.zeros(total, dtype = bool)
+    keys = (positions[pair_ids].astype(np.uint64) << np.uint64(32)) | ranks.astype(np.uint64)
+    slots = np.minimum(np.searchsorted(context_keys, keys), max(len(context_keys) - 1, 0))
+    if len(context_keys):
+        found &= context_keys[slots] == keys
+    return np.bincount(pair_ids[found], minlength = len(query_index))
+
+
+
+def flag_ungrounded_answers(answers: Sequence[str],
+                            index: MinHashLSHIndex,
+                            min_containment: float = 0.5,
+                            chunk_size: int = 10_000,
+                            contexts: Optional[Sequence[Union[str, Sequence[str]]]] = None) -> Dict[str, np.ndarray]:
+    '''
+    Flags answers whose n-grams are not found in any context of a prebuilt LSH index.
+
+    Answers are signed in chunks and their candidate contexts are looked up in the index (no pairwise comparison with
+    the pool). Because a short answer contained in a long context has a low Jaccard similarity with it, candidates are
+    banded for the lowest Jaccard similarity an answer of that size can have with the largest indexed context while
+    still holding `min_containment` of its n-grams, rather than for the index's own threshold. Each answer keeps the
+    candidate with the highest containment, computed exactly from the shingle sets when `contexts` is given and
+    estimated from the signatures otherwise.
+
+    Inputs:
+        - answers (sequence[str]): The generated answers.
+        - index (MinHashLSHIndex): The index of the context pool.
+        - min_containment (float): The smallest share of an answer's n-grams that must appear in one context for it to count as grounded. Defaults to 0.5.
+        - chunk_size (int): The number of answers processed at a time. Defaults to 10,000.
+        - contexts (sequence, optional): The indexed texts, in insertion order, to verify candidates with exact containment. Defaults to the MinHash estimate.
+
+    Returns:
+        - results (dict): Per-answer arrays: 'containment' (the best containment, 0 without candidates),
+          'jaccard' (the Jaccard similarity with that context), 'context_index' (the position of the best
+          context in the index, -1 without candidates; see `MinHashLSHIndex.search` for IDs), and 'ungrounded' (bool).
+    '''
+    if not 0 <= min_containment <= 1:
+        raise ValueError('min_containment must be between 0 and 1')
+    containment = np.zeros(len(answers))
+    jaccard = np.zeros(len(answers))
+    best = np.full(len(answers), -1, dtype = np.int64)
+    indexed_signatures, indexed_sizes, _ = index._build()
+
+    # Keying every context shingle once for the exact verification
+    if contexts is not None:
+        if len(contexts) != len(indexed_sizes):
+            raise ValueError(f'contexts must have one entry per indexed text, got {len(contexts)} for {len(indexed_sizes)}')
+        context_items, context_hashes = index.hasher.shingle_hashes(contexts)
+        context_vocabulary = np.unique(context_hashes)
+        context_keys = np.sort((context_items.astype(np.uint64) << np.uint64(32))
+                               | np.searchsorted(context_vocabulary, context_hashes).astype(np.uint64))
+        context_sizes = np.bincount(context_items, minlength = len(contexts))
+
+    for start in range(0, len(answers), chunk_size):
+        chunk = answers[start:start + chunk_size]
+        signatures = index.hasher.signatures(chunk)
+        query_index, positions = _grounding_candidates(index, signatures, min_containment)
+        if not len(query_index):
+            continue
+        if contexts is None:
+            pair_jaccard = (signatures.signatures[query_index] == indexed_signatures[positions]).mean(axis = 1)
+            pair_containment = _containment(pair_jaccard, signatures.sizes[query_index], indexed_sizes[positions])
+        else:
+            answer_items, answer_hashes = index.hasher.shingle_hashes(chunk)
+            shared = _shared_shingles(answer_items, answer_hashes, len(chunk), context_vocabulary, context_keys, query_index, positions)
+            answer_sizes = signatures.sizes[query_index]
+            pair_containment = shared / answer_sizes
+            pair_jaccard = shared / (answer_sizes + context_sizes[positions] - shared)
+
+        # Keeping the pair with the highest containment per answer: the last one after sorting by (answer, containment)
+        order = np.lexsort((pair_containment, query_index))
+        last = np.flatnonzero(np.concatenate([query_index[order][1:] != query_index[order][:-1], [True]]))
+        chosen = order[last]
+        rows = start + query_index[chosen]
+        containment[rows] = pair_containment[chosen]
+        jaccard[rows] = pair_jaccard[chosen]
+        best[rows] = positions[chosen]
+    return {'containment': containment, 'jaccard': jaccard, 'context_index': best, 'ungrounded': containment < min_containment}
+
+__all__ = ['RETRIEVAL_METRICS', 'RETRIEVAL_GAINS', 'pad_ragged', 'retrieval_relevance', 'calculate_retrieval_metrics',
+           'calculate_retrieval_metrics_from_labels', 'calculate_recall_at_k', 'calculate_precision_at_k', 'calculate_hit_rate_at_k',
+           'calculate_mean_reciprocal_rank', 'calculate_ndcg_at_k', 'minhash_num_perm', 'MinHashSignatures', 'MinHasher', 'estimate_jaccard',
+           'estimate_containment', 'MinHashLSHIndex', 'calculate_ngram_overlap', 'flag_ungrounded_answers']
@@ -0,0 +1,213 @@
+import asyncio
+from functools import partial
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional
+from whetstone.metrics.text.readability_metrics import (READABILITY_FORMULAS, _validate_metric_names,
+                                                        _all_readability_metrics_chunk, _selected_readability_metrics_chunk)
+
+
+
+class AsyncReadabilityScorer:
+    '''
+    Asyncio front end that scores texts off the event loop in micro-batches.
+
+    `score` enqueues a text and awaits its result. Background batcher tasks drain the queue, gathering up to
+    `batch_size` texts (waiting at most `max_batch_delay` seconds for a batch to fill), and run each batch on an
+    executor so the CPU work never blocks the event loop. The queue holds at most `max_queue_size` pending texts;
+    once it is full, `score` waits for space, which applies backpressure to the producers instead of letting memory
+    and latency grow without bound. If a batch fails, its texts are rescored one at a time, so an error only reaches
+    the callers whose own text could not be scored.
+
+    Inputs:
+        - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric returned by `calculate_all_readability_metrics`.
+        - executor (Executor, optional): The thread or process executor to score batches on. Defaults to the event loop's default thread pool.
+        - batch_size (int): The maximum number of texts scored per executor call. Defaults to 64.
+        - max_batch_delay (float): The maximum time, in seconds, to wait for a batch to fill before scoring it. Defaults to 0.002.
+        - max_queue_size (int): The maximum number of texts waiting to be scored. Defaults to 4,096.
+        - concurrency (int): The number of batches that may be scoring at once. Defaults to 1; raise it to the number of workers of a process executor.
+
+    Example:
+        async with AsyncReadabilityScorer(executor = ProcessPoolExecutor(4), concurrency = 4) as scorer:
+            result = await scorer.score(response_text)
+    '''
+
+    def __init__(self,
+                 metrics: Optional[List[str]] = None,
+                 executor: Optional[Executor] = None,
+                 batch_size: int = 64,
+                 max_batch_delay: float = 0.002,
+                 max_queue_size: int = 4_096,
+                 concurrency: int = 1):
+        if batch_size <= 0:
+            raise ValueError('batch_size must be a positive integer')
+        if max_queue_size <= 0:
+            raise ValueError('max_queue_size must be a positive integer')
+        if concurrency <= 0:
+            raise ValueError('concurrency must be a positive integer')
+        if max_batch_delay < 0:
+            raise ValueError('max_batch_delay must not be negative')
+
+        self.metrics = _validate_metric_names(metrics)
+        self.executor = executor
+        self.batch_size = batch_size
+        self.max_batch_delay = max_batch_delay
+        self.max_queue_size = max_queue_size
+        self.concurrency = concurrency
+
+        if self.metrics == list(READABILITY_FORMULAS):
+            self._chunk_func = _all_readability_metrics_chunk
+        else:
+            self._chunk_func = partial(_selected_readability_metrics_chunk, metrics = self.metrics)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._closed = False
+
+
+    async def start(self) -> None:
+        '''
+        Starts the background batcher tasks. Called automatically by `score` and when entering the context manager.
+        '''
+        if self._closed:
+            raise RuntimeError('AsyncReadabilityScorer is closed')
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize = self.max_queue_size)
+        self._workers = [asyncio.create_task(self._run_batches()) for _ in range(self.concurrency)]
+
+
+    async def close(self) -> None:
+        '''
+        Scores every text already queued, then stops the batcher tasks.
+        '''
+        self._closed = True
+        if not self._workers:
+            return
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions = True)
+        self._workers = []
+
+
+    async def __aenter__(self) -> 'AsyncReadabilityScorer':
+        await self.start()
+        return self
+
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+    async def score(self, text: str) -> dict:
+        '''
+        Scores one text, waiting for queue space if the scorer is saturated.
+
+        Inputs:
+            - text (str): The input text.
+
+        Returns:
+            - result (dict): The calculated metrics for the text.
+        '''
+        if not isinstance(text, str):
+            raise TypeError(f'text must be a str, got {type(text).__name__}')
+        if self._closed:
+            raise RuntimeError('AsyncReadabilityScorer is closed')
+        if not self._workers:
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+
+    async def score_many(self, texts: Iterable[str]) -> List[dict]:
+        '''
+        Scores many texts concurrently, subject to the same backpressure as `score`.
+
+        Inputs:
+            - texts (iterable[str]): The input texts.
+
+        Returns:
+            - results (list[dict]): One dictionary of metrics per input text, in input order.
+        '''
+        return list(await asyncio.gather(*(self.score(text) for text in texts)))
+
+
+    async def _next_batch(self) -> list:
+        # Blocking for the first text, then gathering more until the batch is full or the batch delay runs out
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_batch_delay
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+
+    async def _run_batches(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            try:
+                # Skipping texts whose callers have already given up
+                pending = [(text, future) for text, future in batch if not future.done()]
+                if not pending:
+                    continue
+                try:
+                    try:
+                        results = await loop.run_in_executor(self.executor, self._chunk_func, [text for text, _ in pending])
+                    except Exception as error:
+                        if len(pending) == 1:
+                            results = [error]
+                        else:
+                            # Rescoring the texts one at a time so that only the callers whose text fails get the error
+                            results = await asyncio.gather(*(loop.run_in_executor(self.executor, self._chunk_func, [text])
+                                                             for text, _ in pending), return_exceptions = True)
+                            results = [result if isinstance(result, BaseException) else result[0] for result in results]
+                except asyncio.CancelledError:
+                    for _, future in pending:
+                        future.cancel()
+                    raise
+                for (_, future), result in zip(pending, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+
+async def calculate_all_readability_metrics_async(texts: Iterable[str],
+                                                  metrics: Optional[List[str]] = None,
+                                                  executor: Optional[Executor] = None,
+                                                  batch_size: int = 64) -> List[dict]:
+    '''
+    Calculate readability metrics for a collection of texts without blocking the event loop.
+
+    Inputs:
+        - texts (iterable[str]): The input texts.
+        - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric returned by `calculate_all_readability_metrics`.
+        - executor (Executor, optional): The thread or process executor to score batches on. Defaults to the event loop's default thread pool.
+        - batch_size (int): The maximum number of texts scored per executor call. Defaults to 64.
+
+    Returns:
+        - results (list[dict]): One dictionary of metrics per input text, in input order.
+    '''
+    if isinstance(texts, str):
+        texts = [texts]
+    async with AsyncReadabilityScorer(metrics = metrics, executor = executor, batch_size = batch_size) as scorer:
+        return await scorer.score_many(texts)
+
+__all__ = ['AsyncReadabilityScorer', 'calculate_all_readability_metrics_async']
@@ -0,0 +1,291 @@
+import numpy as np
+from time import perf_counter
+from functools import partial
+from concurrent.futures import Executor
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+from whetstone.utils import instrumentation
+from whetstone.utils.parallel import map_in_chunks
+from whetstone.utils.text.text_stats import TextStats, compute_text_stats
+
+
+
+# Output formats supported by the columnar mode
+COLUMNAR_OUTPUTS = ('dict', 'structured', 'pandas', 'polars')
+
+# Column index of each TextStats field in a stats array
+_FIELD = {name: index for index, name in enumerate(TextStats._fields)}
+
+
+
+def _text_stats_chunk(texts: List[str], fields: Optional[frozenset] = None) -> List[TextStats]:
+    return [compute_text_stats(text, fields = fields) for text in texts]
+
+
+
+def compute_text_stats_array(texts: Union[str, List[str]],
+                             n_jobs: Optional[int] = 1,
+                             executor: Optional[Executor] = None,
+                             fields: Optional[Iterable[str]] = None) -> np.ndarray:
+    '''
+    Gathers the TextStats counts for one or multiple texts into a single integer matrix.
+
+    Inputs:
+        - texts (str or list[str]): The input text(s).
+        - n_jobs (int, optional): The number of worker processes to tokenize with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+        - fields (iterable[str], optional): The TextStats fields to compute. Defaults to every field; the other columns are left at 0.
+
+    Returns:
+        - stats_array (np.ndarray): An int64 array of shape (num_texts, len(TextStats._fields)), one column per TextStats field.
+    '''
+    # Wrapping the input in a list if it is a single string
+    if isinstance(texts, str):
+        texts = [texts]
+
+    chunk_func = _text_stats_chunk if fields is None else partial(_text_stats_chunk, fields = frozenset(fields))
+    stats = map_in_chunks(chunk_func, texts, n_jobs = n_jobs, executor = executor)
+    if not stats:
+        return np.zeros((0, len(TextStats._fields)), dtype = np.int64)
+    return np.array(stats, dtype = np.int64)
+
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    # Dividing elementwise, leaving 0.0 wherever the denominator is zero
+    return np.divide(numerator, denominator, out = np.zeros(numerator.shape, dtype = np.float64), where = denominator != 0)
+
+
+
+def _round(values: np.ndarray, ndigits: int = 2) -> np.ndarray:
+    # np.round scales, rounds, and unscales, which can land on the other side of a tie than Python's correctly
+    # rounded `round`, so values close to a tie fall back to `round` to keep scores identical to the per-text formulas
+    rounded = np.round(values, ndigits)
+    scaled = values * 10 ** ndigits
+    near_tie = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    if len(near_tie):
+        rounded[near_tie] = [round(float(value), ndigits) for value in values[near_tie]]
+    return rounded
+
+
+
+def calculate_readability_metrics_from_stats_array(stats_array: np.ndarray) -> Dict[str, np.ndarray]:
+    '''
+    Evaluates every readability formula as a vectorized array expression over a stats matrix.
+
+    The arithmetic and rounding match the per-text formulas term for term, so scores are identical
+    to those returned by `calculate_all_readability_metrics`.
+
+    Inputs:
+        - stats_array (np.ndarray): A matrix of counts, as returned by `compute_text_stats_array`.
+
+    Returns:
+        - metrics (dict[str, np.ndarray]): A mapping of each metric name to a float64 array with one score per text.
+    '''
+    stats_array = np.asarray(stats_array, dtype = np.int64).reshape(-1, len(TextStats._fields))
+    column = lambda name: stats_array[:, _FIELD[name]]
+
+    num_sentences = column('num_sentences')
+    num_words = column('num_words')
+    num_characters = column('num_characters')
+    num_syllables = column('num_syllables')
+    num_complex_words = column('num_complex_words')
+    num_long_words = column('num_long_words')
+    num_whitespace_words = column('num_whitespace_words')
+    num_whitespace_syllables = column('num_whitespace_syllables')
+    num_punctuation_sentences = column('num_punctuation_sentences')
+    num_lowercase_words = column('num_lowercase_words')
+    num_lowercase_complex_words = column('num_lowercase_complex_words')
+    num_difficult_words = column('num_difficult_words')
+
+    # Masks mirroring the zero guards of the per-text formulas
+    has_sentences = num_sentences != 0
+    has_words_and_sentences = has_sentences & (num_words != 0)
+    has_fog_counts = (num_punctuation_sentences != 0) & (num_lowercase_words != 0)
+    zeros = np.zeros(len(stats_array), dtype = np.float64)
+
+    # Flesch-Kincaid averages over whitespace tokens
+    fk_words_per_sentence = _safe_divide(num_whitespace_words, num_sentences)
+    fk_syllables_per_word = _safe_divide(num_whitespace_syllables, num_whitespace_words)
+
+    # Shared averages over the `\b\w+\b` words
+    words_per_sentence = _safe_divide(num_words, num_sentences)
+    characters_per_word = _safe_divide(num_characters, num_words)
+    syllables_per_word = _safe_divide(num_syllables, num_words)
+    percent_complex_words = _safe_divide(num_complex_words, num_words) * 100
+    percent_difficult_words = _safe_divide(num_difficult_words, num_words) * 100
+
+    fog_sentence_length = _safe_divide(num_lowercase_words, num_punctuation_sentences)
+    fog_percent_complex_words = _safe_divide(num_lowercase_complex_words, num_lowercase_words) * 100
+
+    # Keys follow the order of calculate_all_readability_metrics, with the consensus grade added last
+    metrics = {
+        'flesch_kincaid_reading_ease': _round(206.835 - 1.015 * fk_words_per_sentence - 84.6 * fk_syllables_per_word, 2),
+        'flesch_kincaid_grade_level': _round(.39 * fk_words_per_sentence + 11.8 * fk_syllables_per_word - 15.59, 2),
+        'gunning_fog_index': np.where(has_fog_counts, 0.4 * (fog_sentence_length + fog_percent_complex_words), zeros),
+        'coleman_liau_index': np.where(has_words_and_sentences,
+                                       _round(0.0588 * (characters_per_word * 100) - 0.296 * (_safe_divide(num_sentences, num_words) * 100) - 15.8, 2),
+                                       zeros),
+        'automated_readability_index': np.where(has_words_and_sentences,
+                                                _round(4.71 * characters_per_word + 0.5 * words_per_sentence - 21.43, 2),
+                                                zeros),
+        'smog_index': np.where(has_words_and_sentences,
+                               _round(1.043 * np.sqrt(num_complex_words * _safe_divide(np.full(len(stats_array), 30), num_sentences)) + 3.1291, 2),
+                               zeros),
+        'dale_chall_readability_score': np.where(has_words_and_sentences,
+                                                 _round(0.1579 * (percent_difficult_words + 0.0496 * words_per_sentence), 2),
+                                                 zeros),
+        'spache_readability_formula': np.where(has_words_and_sentences,
+                                               _round(0.121 * words_per_sentence + 0.082 * syllables_per_word - 0.659, 2),
+                                               zeros),
+        'new_dale_chall_readability_score': np.where(has_words_and_sentences,
+                                                     _round(0.1579 * percent_difficult_words + 0.0496 * words_per_sentence + 3.6365, 2),
+                                                     zeros),
+        'linsear_write_formula': np.where(has_words_and_sentences,
+                                          _round(_safe_divide(num_words * 2, num_sentences) - 2, 2),
+                                          zeros),
+        'forcast_readability_formula': np.where(has_sentences,
+                                                _round(20 - _safe_divide(num_syllables * 0.1, num_sentences), 2),
+                                                zeros),
+        'raygor_readability_estimate': np.where(has_words_and_sentences,
+                                                _round(0.1579 * words_per_sentence + 0.0496 * percent_complex_words + 3.6365, 2),
+                                                zeros),
+        'lix_readability_score': np.where(has_words_and_sentences,
+                                          _round(words_per_sentence + _safe_divide(num_long_words * 100, num_words), 2),
+                                          zeros),
+        'rix_readability_score': np.where(has_sentences, _round(_safe_divide(num_long_words, num_sentences), 2), zeros),
+        'strain_index': np.where(has_sentences, _round(_safe_divide(num_long_words * 100, num_sentences), 2), zeros),
+    }
+
+    # Summing the 14 consensus metrics in the same order as the per-text consensus grade
+    consensus_sum = metrics['flesch_kincaid_grade_level'].copy()
+    for name in ('gunning_fog_index', 'coleman_liau_index', 'automated_readability_index', 'smog_index',
+                 'dale_chall_readability_score', 'spache_readability_formula', 'new_dale_chall_readability_score',
+                 'linsear_write_formula', 'forcast_readability_formula', 'raygor_readability_estimate',
+                 'lix_readability_score', 'rix_readability_score', 'strain_index'):
+        consensus_sum += metrics[name]
+    metrics['readability_consensus_grade'] = _round(consensus_sum / 14, 2)
+
+    return metrics
+
+
+
+def format_columnar_metrics(metrics: Dict[str, np.ndarray], output: str = 'dict'):
+    '''
+    Converts a mapping of metric arrays into the requested columnar container.
+
+    Inputs:
+        - metrics (dict[str, np.ndarray]): A mapping of each metric name to its array of scores.
+        - output (str): One of 'dict' (the mapping itself), 'structured' (a NumPy structured array),
+          'pandas' (a pandas DataFrame), or 'polars' (a polars DataFrame).
+
+    Returns:
+        - results: The scores in the requested container.
+    '''
+    if output == 'dict':
+        return metrics
+
+    if output == 'structured':
+        num_rows = len(next(iter(metrics.values()))) if metrics else 0
+        structured = np.empty(num_rows, dtype = [(name, np.float64) for name in metrics])
+        for name, values in metrics.items():
+            structured[name] = values
+        return structured
+
+    if output == 'pandas':
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("output='pandas' requires pandas to be installed") from e
+        return pd.DataFrame(metrics, copy = False)
+
+    if output == 'polars':
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise ImportError("output='polars' requires polars to be installed") from e
+        return pl.DataFrame(metrics)
+
+    raise ValueError(f"output must be one of {COLUMNAR_OUTPUTS}, got {output!r}")
+
+
+
+def calculate_all_readability_metrics_columnar(texts: Union[str, List[str]],
+                                               output: str = 'dict',
+                                               n_jobs: Optional[int] = 1,
+                                               executor: Optional[Executor] = None):
+    '''
+    Calculate all readability metrics for one or multiple texts, returning one column per metric.
+
+    Per-text counts are gathered into a NumPy matrix and each formula is evaluated once over the whole batch,
+    so no per-text result dictionaries are allocated.
+
+    Inputs:
+        - texts (str or list[str]): The input text(s) for which to calculate the readability metrics.
+        - output (str): One of 'dict', 'structured', 'pandas', or 'polars'. Defaults to 'dict'.
+        - n_jobs (int, optional): The number of worker processes to tokenize with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+
+    Returns:
+        - results: The readability metrics in the requested columnar container.
+    '''
+    if output not in COLUMNAR_OUTPUTS:
+        raise ValueError(f"output must be one of {COLUMNAR_OUTPUTS}, got {output!r}")
+
+    stats_array = compute_text_stats_array(texts, n_jobs = n_jobs, executor = executor)
+    if instrumentation.enabled:
+        start = perf_counter()
+        metrics = calculate_readability_metrics_from_stats_array(stats_array)
+        instrumentation.record_stage('formulas', start)
+    else:
+        metrics = calculate_readability_metrics_from_stats_array(stats_array)
+    return format_columnar_metrics(metrics, output = output)
+
+
+
+def score_text_column(texts: Sequence,
+                      metrics: Optional[List[str]] = None,
+                      chunk_size: int = 10_000,
+                      n_jobs: Optional[int] = 1,
+                      executor: Optional[Executor] = None) -> Dict[str, np.ndarray]:
+    '''
+    Scores a column of texts chunk by chunk into preallocated metric arrays.
+
+    Only `chunk_size` texts are tokenized at a time, and their scores are written straight into one float64 array per
+    metric, so no per-row result dictionaries are built. As with `compute_metrics`, only the extraction passes the
+    requested metrics depend on are run. Missing values (anything that is not a string, such as None
+    or NaN) score as NaN.
+
+    Inputs:
+        - texts (sequence): The column of texts, such as a list, a NumPy object array, or a DataFrame column's values.
+        - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric returned by `calculate_all_readability_metrics`.
+        - chunk_size (int): The number of texts scored at a time. Defaults to 10,000.
+        - n_jobs (int, optional): The number of worker processes to tokenize with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+
+    Returns:
+        - metrics (dict[str, np.ndarray]): A mapping of each requested metric to a float64 array with one score per text.
+    '''
+    from whetstone.metrics.text.readability_metrics import _validate_metric_names, resolve_metric_dependencies
+
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be a positive integer')
+    metrics = _validate_metric_names(metrics)
+    fields = resolve_metric_dependencies(metrics)
+    num_texts = len(texts)
+    columns = {name: np.full(num_texts, np.nan) for name in metrics}
+
+    for start in range(0, num_texts, chunk_size):
+        chunk = texts[start:start + chunk_size]
+        rows = [i for i, text in enumerate(chunk) if isinstance(text, str)]
+        if not rows:
+            continue
+        strings = [chunk[i] for i in rows]
+        stats_array = compute_text_stats_array(strings, n_jobs = n_jobs, executor = executor, fields = fields)
+        scores = calculate_readability_metrics_from_stats_array(stats_array)
+        positions = start + np.asarray(rows)
+        for name in metrics:
+            columns[name][positions] = scores[name]
+    return columns
+
+__all__ = ['COLUMNAR_OUTPUTS', 'compute_text_stats_array', 'calculate_readability_metrics_from_stats_array',
+           'format_columnar_metrics', 'calculate_all_readability_metrics_columnar', 'score_text_column']
@@ -0,0 +1,247 @@
+from concurrent.futures import Executor
+from typing import List, Optional
+from whetstone.metrics.text.readability_columnar import score_text_column
+from whetstone.metrics.text.readability_metrics import _validate_metric_names
+
+
+
+# The name the accessors and namespaces are registered under, e.g. `df['response'].readability.scores()`
+ACCESSOR_NAME = 'readability'
+
+
+
+class ReadabilitySeriesAccessor:
+    '''
+    pandas Series accessor, available as `series.readability` once this module is imported.
+
+    Example:
+        scores = df['response'].readability.scores()
+    '''
+
+    def __init__(self, series):
+        self._series = series
+
+
+    def scores(self,
+               metrics: Optional[List[str]] = None,
+               prefix: str = '',
+               chunk_size: int = 10_000,
+               n_jobs: Optional[int] = 1,
+               executor: Optional[Executor] = None):
+        '''
+        Scores every text in the Series in batched chunks.
+
+        Inputs:
+            - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+            - prefix (str): A prefix added to every metric column name. Defaults to ''.
+            - chunk_size (int): The number of texts scored at a time. Defaults to 10,000.
+            - n_jobs (int, optional): The number of worker processes to tokenize with. Defaults to 1 (serial).
+            - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+
+        Returns:
+            - scores (pd.DataFrame): One float64 column per metric, sharing the Series' index. Missing texts score as NaN.
+        '''
+        import pandas as pd
+        columns = score_text_column(self._series.to_numpy(dtype = object), metrics = metrics, chunk_size = chunk_size,
+                                    n_jobs = n_jobs, executor = executor)
+        return pd.DataFrame({prefix + name: values for name, values in columns.items()}, index = self._series.index, copy = False)
+
+
+
+class ReadabilityFrameAccessor:
+    '''
+    pandas DataFrame accessor, available as `df.readability` once this module is imported.
+
+    Example:
+        df.readability.add_scores('response', metrics = ['flesch_kincaid_grade_level'])
+    '''
+
+    def __init__(self, frame):
+        self._frame = frame
+
+
+    def add_scores(self,
+                   column: str,
+                   metrics: Optional[List[str]] = None,
+                   prefix: str = '',
+                   chunk_size: int = 10_000,
+                   n_jobs: Optional[int] = 1,
+                   executor: Optional[Executor] = None):
+        '''
+        Scores a text column and writes one column per metric into the DataFrame in place.
+
+        Inputs:
+            - column (str): The name of the text column.
+            - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+            - prefix (str): A prefix added to every metric column name. Defaults to ''.
+            - chunk_size (int): The number of texts scored at a time. Defaults to 10,000.
+            - n_jobs (int, optional): The number of worker processes to tokenize with. Defaults to 1 (serial).
+            - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+
+        Returns:
+            - frame (pd.DataFrame): The same DataFrame, for chaining.
+        '''
+        columns = score_text_column(self._frame[column].to_numpy(dtype = object), metrics = metrics, chunk_size = chunk_size,
+                                    n_jobs = n_jobs, executor = executor)
+        for name, values in columns.items():
+            self._frame[prefix + name] = values
+        return self._frame
+
+
+
+class ReadabilityExpressionNamespace:
+    '''
+    polars expression namespace, available as `pl.col(...).readability` once this module is imported.
+
+    Scoring runs batch by batch through an elementwise `map_batches`, so lazy queries collected with the streaming
+    engine score each morsel as it arrives instead of materializing the column.
+
+    Example:
+        lf.with_columns(pl.col('response').readability.score().struct.unnest()).collect(engine = 'streaming')
+    '''
+
+    def __init__(self, expr):
+        self._expr = expr
+
+
+    def score(self,
+              metrics: Optional[List[str]] = None,
+              prefix: str = '',
+              chunk_size: int = 10_000,
+              n_jobs: Optional[int] = 1,
+              executor: Optional[Executor] = None):
+        '''
+        Scores a text expression into a struct with one float field per metric.
+
+        Inputs:
+            - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+            - prefix (str): A prefix added to every struct field name. Defaults to ''.
+            - chunk_size (int): The number of texts scored at a time within each batch. Defaults to 10,000.
+            - n_jobs (int, optional): The number of worker processes to tokenize with. Defaults to 1 (serial).
+            - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+
+        Returns:
+            - expr (pl.Expr): A struct expression; unnest it to get one column per metric.
+        '''
+        import polars as pl
+        metrics = _validate_metric_names(metrics)
+        return_dtype = pl.Struct({prefix + name: pl.Float64 for name in metrics})
+
+        def score_batch(series):
+            columns = score_text_column(series.to_list(), metrics = metrics, chunk_size = chunk_size, n_jobs = n_jobs, executor = executor)
+            return pl.DataFrame({prefix + name: values for name, values in columns.items()}).to_struct(series.name)
+
+        return self._expr.map_batches(score_batch, return_dtype = return_dtype, is_elementwise = True)
+
+
+
+class ReadabilitySeriesNamespace:
+    '''
+    polars Series namespace, available as `series.readability` once this module is imported.
+    '''
+
+    def __init__(self, series):
+        self._series = series
+
+
+    def scores(self,
+               metrics: Optional[List[str]] = None,
+               prefix: str = '',
+               chunk_size: int = 10_000,
+               n_jobs: Optional[int] = 1,
+               executor: Optional[Executor] = None):
+        '''
+        Scores every text in the Series in batched chunks.
+
+        Inputs:
+            - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+            - prefix (str): A prefix added to every metric column name. Defaults to ''.
+            - chunk_size (int): The number of texts scored at a time. Defaults to 10,000.
+            - n_jobs (int, optional): The number of worker processes to tokenize with. Defaults to 1 (serial).
+            - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+
+        Returns:
+            - scores (pl.DataFrame): One Float64 column per metric. Null texts score as NaN.
+        '''
+        import polars as pl
+        columns = score_text_column(self._series.to_list(), metrics = metrics, chunk_size = chunk_size, n_jobs = n_jobs, executor = executor)
+        return pl.DataFrame({prefix + name: values for name, values in columns.items()})
+
+
+
+class ReadabilityFrameNamespace:
+    '''
+    polars DataFrame and LazyFrame namespace, available as `frame.readability` once this module is imported.
+
+    Example:
+        scored = pl.scan_parquet('responses.parquet').readability.with_scores('response').collect(engine = 'streaming')
+    '''
+
+    def __init__(self, frame):
+        self._frame = frame
+
+
+    def with_scores(self,
+                    column: str,
+                    metrics: Optional[List[str]] = None,
+                    prefix: str = '',
+                    chunk_size: int = 10_000,
+                    n_jobs: Optional[int] = 1,
+                    executor: Optional[Executor] = None):
+        '''
+        Adds one column per metric, scored from a text column.
+
+        Inputs:
+            - column (str): The name of the text column.
+            - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+            - prefix (str): A prefix added to every metric column name. Defaults to ''.
+            - chunk_size (int): The number of texts scored at a time within each batch. Defaults to 10,000.
+            - n_jobs (int, optional): The number of worker processes to tokenize with. Defaults to 1 (serial).
+            - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+
+        Returns:
+            - frame (pl.DataFrame or pl.LazyFrame): The frame with the metric columns added.
+        '''
+        import polars as pl
+        score = ReadabilityExpressionNamespace(pl.col(column)).score(metrics = metrics, prefix = prefix, chunk_size = chunk_size,
+                                                                     n_jobs = n_jobs, executor = executor)
+        return self._frame.with_columns(score.struct.unnest())
+
+
+
+def register_dataframe_accessors() -> List[str]:
+    '''
+    Registers the `readability` accessors with pandas and the `readability` namespaces with polars, for whichever
+    of the two libraries is installed. Called when this module is imported.
+
+    Returns:
+        - registered (list[str]): The libraries the accessors were registered with.
+    '''
+    registered = []
+    try:
+        import pandas as pd
+    except ImportError:
+        pass
+    else:
+        pd.api.extensions.register_series_accessor(ACCESSOR_NAME)(ReadabilitySeriesAccessor)
+        pd.api.extensions.register_dataframe_accessor(ACCESSOR_NAME)(ReadabilityFrameAccessor)
+        registered.append('pandas')
+
+    try:
+        import polars as pl
+    except ImportError:
+        pass
+    else:
+        pl.api.register_expr_namespace(ACCESSOR_NAME)(ReadabilityExpressionNamespace)
+        pl.api.register_series_namespace(ACCESSOR_NAME)(ReadabilitySeriesNamespace)
+        pl.api.register_dataframe_namespace(ACCESSOR_NAME)(ReadabilityFrameNamespace)
+        pl.api.register_lazyframe_namespace(ACCESSOR_NAME)(ReadabilityFrameNamespace)
+        registered.append('polars')
+    return registered
+
+
+
+registered_libraries = register_dataframe_accessors()
+
+__all__ = ['ACCESSOR_NAME', 'ReadabilitySeriesAccessor', 'ReadabilityFrameAccessor', 'ReadabilityExpressionNamespace',
+           'ReadabilitySeriesNamespace', 'ReadabilityFrameNamespace', 'register_dataframe_accessors']
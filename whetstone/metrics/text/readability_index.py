@@ -0,0 +1,181 @@
+import numpy as np
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+from whetstone.metrics.text.readability_columnar import calculate_readability_metrics_from_stats_array, format_columnar_metrics
+from whetstone.metrics.text.readability_metrics import READABILITY_FORMULAS, _validate_metric_names
+from whetstone.utils.text.syllable_counter import SyllableCounter
+from whetstone.utils.text.text_parsers import find_sentence_boundaries
+from whetstone.utils.text.text_stats import TextStats, compute_text_stats
+
+
+
+# Column index of the sentence count, the only TextStats field that is not a plain sum over sentences
+_SENTENCES = TextStats._fields.index('num_sentences')
+
+
+
+class DocumentIndex:
+    '''
+    Prefix-sum index of per-sentence counts for scoring any run of sentences in a long document in O(1).
+
+    The document is tokenized once: each sentence found by `tokenize_sentence` is counted separately and the
+    counts are accumulated into a (num_sentences + 1) x len(TextStats._fields) prefix-sum matrix. Every count is
+    additive over sentences (words and tokens never straddle a sentence boundary), so the counts of sentences
+    `start` to `stop` are the difference of two prefix rows, and their scores are identical to scoring the
+    corresponding slice of the text from scratch. Whole sliding-window profiles are evaluated in linear time.
+
+    Inputs:
+        - text (str): The document.
+        - syllable_counter (SyllableCounter, optional): The syllable memo to use. Defaults to the shared `default_syllable_counter`.
+    '''
+
+    def __init__(self, text: str, syllable_counter: Optional[SyllableCounter] = None):
+        self.text = text
+
+        # Locating each sentence in the original text, after the leading whitespace that tokenize_sentence strips
+        stripped = text.strip()
+        lead = len(text) - len(text.lstrip())
+        spans = []
+        start = 0
+        for boundary in find_sentence_boundaries(stripped):
+            spans.append((lead + start, lead + boundary))
+            start = boundary + 1
+        spans.append((lead + start, lead + len(stripped)))
+        self.spans: List[Tuple[int, int]] = spans
+        self._starts = [start for start, _ in spans]
+
+        counts = np.array([compute_text_stats(text[start:end], syllable_counter = syllable_counter) for start, end in spans], dtype = np.int64)
+        self.prefix = np.zeros((len(spans) + 1, len(TextStats._fields)), dtype = np.int64)
+        np.cumsum(counts, axis = 0, out = self.prefix[1:])
+
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+
+    def sentence(self, index: int) -> str:
+        '''
+        Returns the text of one sentence.
+
+        Inputs:
+            - index (int): The sentence index.
+
+        Returns:
+            - sentence (str): The sentence, as returned by `tokenize_sentence`.
+        '''
+        start, end = self.spans[index]
+        return self.text[start:end]
+
+
+    def sentence_at(self, offset: int) -> int:
+        '''
+        Finds the sentence containing a character offset, for mapping section markers to sentence indices.
+
+        Inputs:
+            - offset (int): A character offset into the document.
+
+        Returns:
+            - index (int): The index of the sentence that contains (or, between sentences, precedes) the offset.
+        '''
+        return max(bisect_right(self._starts, offset) - 1, 0)
+
+
+    def _check_range(self, start: int, stop: int) -> None:
+        if not 0 <= start < stop <= len(self.spans):
+            raise ValueError(f'Sentence range [{start}, {stop}) is empty or outside the document ({len(self.spans)} sentences)')
+
+
+    def window_stats(self, start: int, stop: int) -> TextStats:
+        '''
+        Computes the counts of a run of sentences as a difference of prefix sums.
+
+        Inputs:
+            - start (int): The index of the first sentence.
+            - stop (int): The index one past the last sentence.
+
+        Returns:
+            - stats (TextStats): The counts of the sentences, as `compute_text_stats` would compute them for that slice of the text.
+        '''
+        self._check_range(start, stop)
+        counts = (self.prefix[stop] - self.prefix[start]).tolist()
+        counts[_SENTENCES] = stop - start
+        return TextStats(*counts)
+
+
+    def window_text(self, start: int, stop: int) -> str:
+        '''
+        Returns the slice of the document spanning a run of sentences.
+
+        Inputs:
+            - start (int): The index of the first sentence.
+            - stop (int): The index one past the last sentence.
+
+        Returns:
+            - text (str): The text from the start of sentence `start` to the end of sentence `stop - 1`.
+        '''
+        self._check_range(start, stop)
+        return self.text[self.spans[start][0]:self.spans[stop - 1][1]]
+
+
+    def score(self, start: int, stop: int, metrics: Optional[List[str]] = None) -> dict:
+        '''
+        Scores a run of sentences in O(1).
+
+        Inputs:
+            - start (int): The index of the first sentence.
+            - stop (int): The index one past the last sentence.
+            - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+
+        Returns:
+            - result (dict): The metrics of the sentences, identical to scoring `window_text(start, stop)`.
+        '''
+        stats = self.window_stats(start, stop)
+        return {name: READABILITY_FORMULAS[name](stats) for name in _validate_metric_names(metrics)}
+
+
+    def _score_ranges(self, starts: np.ndarray, stops: np.ndarray, metrics: Optional[List[str]], output: str):
+        # Differencing the prefix rows of every range at once and evaluating the formulas over the resulting matrix
+        metrics = _validate_metric_names(metrics)
+        stats_array = self.prefix[stops] - self.prefix[starts]
+        stats_array[:, _SENTENCES] = stops - starts
+        scores = calculate_readability_metrics_from_stats_array(stats_array)
+        return format_columnar_metrics({name: scores[name] for name in metrics}, output = output)
+
+
+    def score_sections(self, sections: Sequence[Tuple[int, int]], metrics: Optional[List[str]] = None, output: str = 'dict'):
+        '''
+        Scores many runs of sentences, such as the sections of a report, in one vectorized pass.
+
+        Inputs:
+            - sections (sequence[tuple[int, int]]): The (start, stop) sentence range of each section.
+            - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+            - output (str): The columnar container to return: 'dict', 'structured', 'pandas', or 'polars'. Defaults to 'dict'.
+
+        Returns:
+            - scores: One score per section for each metric.
+        '''
+        for start, stop in sections:
+            self._check_range(start, stop)
+        ranges = np.asarray(sections, dtype = np.int64).reshape(-1, 2)
+        return self._score_ranges(ranges[:, 0], ranges[:, 1], metrics, output)
+
+
+    def sliding_window_profile(self, window: int, step: int = 1, metrics: Optional[List[str]] = None, output: str = 'dict'):
+        '''
+        Scores every window of `window` consecutive sentences in linear time.
+
+        Inputs:
+            - window (int): The number of sentences per window.
+            - step (int): The number of sentences between the starts of consecutive windows. Defaults to 1.
+            - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+            - output (str): The columnar container to return: 'dict', 'structured', 'pandas', or 'polars'. Defaults to 'dict'.
+
+        Returns:
+            - profile: One score per window for each metric, the i-th covering sentences `i * step` to `i * step + window`.
+        '''
+        if window <= 0 or step <= 0:
+            raise ValueError('window and step must be positive integers')
+        starts = np.arange(0, max(len(self.spans) - window + 1, 0), step, dtype = np.int64)
+        return self._score_ranges(starts, starts + window, metrics, output)
+
+__all__ = ['DocumentIndex']
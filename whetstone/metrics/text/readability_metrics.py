@@ -1,128 +1,354 @@
-import re
 import math
-from typing import Union, List
-from whetstone.utils.text.text_parsers import tokenize_sentence, count_syllables
+from itertools import islice
+from functools import partial
+from concurrent.futures import Executor
+from time import perf_counter
+from typing import Union, List, Optional, Iterable, Iterator
+from whetstone.utils import instrumentation
+from whetstone.utils.parallel import default_batch_size, map_in_chunks
+from whetstone.utils.result_cache import ResultCache
+from whetstone.utils.text.text_stats import TextStats, compute_text_stats
 
 
 
-def calculate_flesch_kincaid_reading_ease(texts: Union[str, List[str]]) -> List[float]:
+# Each formula is evaluated from a precomputed TextStats record so that a text only needs to be tokenized once
+def _flesch_kincaid_reading_ease(stats: TextStats) -> float:
+    avg_words_per_sentence = stats.num_whitespace_words / stats.num_sentences if stats.num_sentences > 0 else 0
+    avg_syllables_per_word = stats.num_whitespace_syllables / stats.num_whitespace_words if stats.num_whitespace_words > 0 else 0
+    return round(206.835 - 1.015 * avg_words_per_sentence - 84.6 * avg_syllables_per_word, 2)
+
+
+def _flesch_kincaid_grade_level(stats: TextStats) -> float:
+    avg_words_per_sentence = stats.num_whitespace_words / stats.num_sentences if stats.num_sentences > 0 else 0
+    avg_syllables_per_word = stats.num_whitespace_syllables / stats.num_whitespace_words if stats.num_whitespace_words > 0 else 0
+    return round(.39 * avg_words_per_sentence + 11.8 * avg_syllables_per_word - 15.59, 2)
+
+
+def _gunning_fog_index(stats: TextStats) -> float:
+    if stats.num_punctuation_sentences == 0 or stats.num_lowercase_words == 0:
+        return 0.0
+    avg_sentence_length = stats.num_lowercase_words / stats.num_punctuation_sentences
+    percent_complex_words = (stats.num_lowercase_complex_words / stats.num_lowercase_words) * 100
+    return 0.4 * (avg_sentence_length + percent_complex_words)
+
+
+def _coleman_liau_index(stats: TextStats) -> float:
+    if stats.num_words == 0 or stats.num_sentences == 0:
+        return 0.0
+    avg_letters_per_100_words = (stats.num_characters / stats.num_words) * 100
+    avg_sentences_per_100_words = (stats.num_sentences / stats.num_words) * 100
+    return round(0.0588 * avg_letters_per_100_words - 0.296 * avg_sentences_per_100_words - 15.8, 2)
+
+
+def _automated_readability_index(stats: TextStats) -> float:
+    if stats.num_words == 0 or stats.num_sentences == 0:
+        return 0.0
+    avg_characters_per_word = stats.num_characters / stats.num_words
+    avg_words_per_sentence = stats.num_words / stats.num_sentences
+    return round(4.71 * avg_characters_per_word + 0.5 * avg_words_per_sentence - 21.43, 2)
+
+
+def _smog_index(stats: TextStats) -> float:
+    if stats.num_sentences == 0 or stats.num_words == 0:
+        return 0.0
+    smog = 1.043 * math.sqrt(stats.num_complex_words * (30 / stats.num_sentences)) + 3.1291
+    return round(smog, 2)
+
+
+def _dale_chall_readability_score(stats: TextStats) -> float:
+    if stats.num_sentences == 0 or stats.num_words == 0:
+        return 0.0
+    percentage_of_difficult_words = (stats.num_difficult_words / stats.num_words) * 100
+    average_words_per_sentence = stats.num_words / stats.num_sentences
+    return round(0.1579 * (percentage_of_difficult_words + 0.0496 * average_words_per_sentence), 2)
+
+
+def _spache_readability_formula(stats: TextStats) -> float:
+    if stats.num_sentences == 0 or stats.num_words == 0:
+        return 0.0
+    average_sentence_length = stats.num_words / stats.num_sentences
+    average_syllables_per_word = stats.num_syllables / stats.num_words
+    return round(0.121 * average_sentence_length + 0.082 * average_syllables_per_word - 0.659, 2)
+
+
+def _linsear_write_formula(stats: TextStats) -> float:
+    if stats.num_sentences == 0 or stats.num_words == 0:
+        return 0.0
+    # Easy (< 3 syllables) and hard (3+ syllables) words together make up every word
+    return round((stats.num_words * 2 / stats.num_sentences) - 2, 2)
+
+
+def _forcast_readability_formula(stats: TextStats) -> float:
+    if stats.num_sentences == 0:
+        return 0.0
+    return round(20 - ((stats.num_syllables * 0.1) / stats.num_sentences), 2)
+
+
+def _raygor_readability_estimate(stats: TextStats) -> float:
+    if stats.num_sentences == 0 or stats.num_words == 0:
+        return 0.0
+    percentage_of_difficult_words = (stats.num_complex_words / stats.num_words) * 100
+    average_words_per_sentence = stats.num_words / stats.num_sentences
+    return round(0.1579 * average_words_per_sentence + 0.0496 * percentage_of_difficult_words + 3.6365, 2)
+
+
+def _lix_readability_score(stats: TextStats) -> float:
+    if stats.num_sentences == 0 or stats.num_words == 0:
+        return 0.0
+    return round((stats.num_words / stats.num_sentences) + ((stats.num_long_words * 100) / stats.num_words), 2)
+
+
+def _rix_readability_score(stats: TextStats) -> float:
+    if stats.num_sentences == 0:
+        return 0.0
+    return round(stats.num_long_words / stats.num_sentences, 2)
+
+
+def _strain_index(stats: TextStats) -> float:
+    if stats.num_sentences == 0:
+        return 0.0
+    return round((stats.num_long_words * 100) / stats.num_sentences, 2)
+
+
+def _new_dale_chall_readability_score(stats: TextStats) -> float:
+    if stats.num_sentences == 0 or stats.num_words == 0:
+        return 0.0
+    percentage_of_difficult_words = (stats.num_difficult_words / stats.num_words) * 100
+    average_words_per_sentence = stats.num_words / stats.num_sentences
+    return round(0.1579 * percentage_of_difficult_words + 0.0496 * average_words_per_sentence + 3.6365, 2)
+
+
+# The 14 metrics averaged by the Readability Consensus Grade, in summation order
+_CONSENSUS_FORMULAS = [
+    _flesch_kincaid_grade_level,
+    _gunning_fog_index,
+    _coleman_liau_index,
+    _automated_readability_index,
+    _smog_index,
+    _dale_chall_readability_score,
+    _spache_readability_formula,
+    _new_dale_chall_readability_score,
+    _linsear_write_formula,
+    _forcast_readability_formula,
+    _raygor_readability_estimate,
+    _lix_readability_score,
+    _rix_readability_score,
+    _strain_index
+]
+
+
+def _readability_consensus_grade(stats: TextStats) -> float:
+    return round(sum(formula(stats) for formula in _CONSENSUS_FORMULAS) / 14, 2)
+
+
+# Every metric returned by calculate_all_readability_metrics, in output order
+READABILITY_FORMULAS = {
+    'flesch_kincaid_reading_ease': _flesch_kincaid_reading_ease,
+    'flesch_kincaid_grade_level': _flesch_kincaid_grade_level,
+    'gunning_fog_index': _gunning_fog_index,
+    'coleman_liau_index': _coleman_liau_index,
+    'automated_readability_index': _automated_readability_index,
+    'smog_index': _smog_index,
+    'dale_chall_readability_score': _dale_chall_readability_score,
+    'spache_readability_formula': _spache_readability_formula,
+    'new_dale_chall_readability_score': _new_dale_chall_readability_score,
+    'linsear_write_formula': _linsear_write_formula,
+    'forcast_readability_formula': _forcast_readability_formula,
+    'raygor_readability_estimate': _raygor_readability_estimate,
+    'lix_readability_score': _lix_readability_score,
+    'rix_readability_score': _rix_readability_score,
+    'strain_index': _strain_index,
+    'readability_consensus_grade': _readability_consensus_grade
+}
+
+
+# The TextStats fields each metric reads, so that only the extraction passes a request needs are run
+_FLESCH_KINCAID_FIELDS = frozenset({'num_sentences', 'num_whitespace_words', 'num_whitespace_syllables'})
+_WORD_LENGTH_FIELDS = frozenset({'num_sentences', 'num_words', 'num_characters'})
+_COMPLEX_WORD_FIELDS = frozenset({'num_sentences', 'num_words', 'num_complex_words'})
+_DIFFICULT_WORD_FIELDS = frozenset({'num_sentences', 'num_words', 'num_difficult_words'})
+
+METRIC_DEPENDENCIES = {
+    'flesch_kincaid_reading_ease': _FLESCH_KINCAID_FIELDS,
+    'flesch_kincaid_grade_level': _FLESCH_KINCAID_FIELDS,
+    'gunning_fog_index': frozenset({'num_punctuation_sentences', 'num_lowercase_words', 'num_lowercase_complex_words'}),
+    'coleman_liau_index': _WORD_LENGTH_FIELDS,
+    'automated_readability_index': _WORD_LENGTH_FIELDS,
+    'smog_index': _COMPLEX_WORD_FIELDS,
+    'dale_chall_readability_score': _DIFFICULT_WORD_FIELDS,
+    'spache_readability_formula': frozenset({'num_sentences', 'num_words', 'num_syllables'}),
+    'new_dale_chall_readability_score': _DIFFICULT_WORD_FIELDS,
+    'linsear_write_formula': frozenset({'num_sentences', 'num_words'}),
+    'forcast_readability_formula': frozenset({'num_sentences', 'num_syllables'}),
+    'raygor_readability_estimate': _COMPLEX_WORD_FIELDS,
+    'lix_readability_score': frozenset({'num_sentences', 'num_words', 'num_long_words'}),
+    'rix_readability_score': frozenset({'num_sentences', 'num_long_words'}),
+    'strain_index': frozenset({'num_sentences', 'num_long_words'})
+}
+METRIC_DEPENDENCIES['readability_consensus_grade'] = frozenset().union(
+    *(fields for name, fields in METRIC_DEPENDENCIES.items() if name != 'flesch_kincaid_reading_ease')
+)
+
+
+
+def resolve_metric_dependencies(metrics: List[str]) -> frozenset:
+    '''
+    Resolves the TextStats fields needed to calculate a set of metrics.
+
+    Inputs:
+        - metrics (list[str]): The metric names.
+
+    Returns:
+        - fields (frozenset[str]): The union of the TextStats fields the metrics read.
+    '''
+    return frozenset().union(*(METRIC_DEPENDENCIES[name] for name in metrics))
+
+
+
+def calculate_readability_metrics_from_stats(stats: TextStats) -> dict:
+    '''
+    Calculate all readability metrics from a precomputed TextStats record.
+
+    Inputs:
+        - stats (TextStats): The counts for a single text, as returned by `compute_text_stats`.
+
+    Returns:
+        - readability_metrics (dict): A dictionary containing all readability metrics for the text.
+    '''
+    return _apply_formula(_all_formulas, stats)
+
+
+def _all_formulas(stats: TextStats) -> dict:
+    return {name: formula(stats) for name, formula in READABILITY_FORMULAS.items()}
+
+
+def _apply_formula(formula, stats: TextStats):
+    # Evaluating a formula, timed as the 'formulas' stage only when instrumentation is enabled
+    if not instrumentation.enabled:
+        return formula(stats)
+    start = perf_counter()
+    result = formula(stats)
+    instrumentation.record_stage('formulas', start)
+    return result
+
+
+# Chunk-level workers shipped to process pools, so they must live at module level to be picklable
+def _readability_consensus_grade_chunk(texts: List[str]) -> List[float]:
+    return [_apply_formula(_readability_consensus_grade, compute_text_stats(text, fields = METRIC_DEPENDENCIES['readability_consensus_grade'])) for text in texts]
+
+
+def _all_readability_metrics_chunk(texts: List[str]) -> List[dict]:
+    return [calculate_readability_metrics_from_stats(compute_text_stats(text)) for text in texts]
+
+
+def _selected_readability_metrics_chunk(texts: List[str], metrics: List[str]) -> List[dict]:
+    formulas = [(name, READABILITY_FORMULAS[name]) for name in metrics]
+    fields = resolve_metric_dependencies(metrics)
+    selected_formulas = lambda stats: {name: formula(stats) for name, formula in formulas}
+    return [_apply_formula(selected_formulas, compute_text_stats(text, fields = fields)) for text in texts]
+
+
+def _validate_metric_names(metrics: Optional[List[str]]) -> List[str]:
+    # Defaulting to every metric and rejecting names that have no formula
+    if metrics is None:
+        return list(READABILITY_FORMULAS)
+    if isinstance(metrics, str):
+        metrics = [metrics]
+    unknown = [name for name in metrics if name not in READABILITY_FORMULAS]
+    if unknown:
+        raise ValueError(f"Unknown readability metric(s) {unknown}. Available metrics: {list(READABILITY_FORMULAS)}")
+    return list(metrics)
+
+
+
+def _score_with_cache(texts: List[str],
+                      metrics: List[str],
+                      cache: ResultCache,
+                      n_jobs: Optional[int] = 1,
+                      executor: Optional[Executor] = None) -> List[dict]:
+    # Looking every text up in bulk, then scoring and storing only the misses
+    results = cache.get_many(texts, metrics)
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        missing_texts = [texts[i] for i in missing]
+        chunk_func = _all_readability_metrics_chunk if metrics == list(READABILITY_FORMULAS) else partial(_selected_readability_metrics_chunk, metrics = metrics)
+        scored = map_in_chunks(chunk_func, missing_texts, n_jobs = n_jobs, executor = executor)
+        cache.put_many(missing_texts, scored)
+        for i, result in zip(missing, scored):
+            results[i] = result
+    return results
+
+
+
+def calculate_flesch_kincaid_reading_ease(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Flesch-Kincaid Reading Ease score for one or multiple texts.
 
     Inputs:
         - texts (str or list[str]): The input text(s) for which to calculate the Reading Ease score.
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - scores (list[float]): A list of Flesch-Kincaid Reading Ease scores corresponding to each input text.
     '''
-    # If a single text string is provided, wrap it in a list
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    results = []
-    for text in texts:
-        # Tokenizing the text into sentences and words
-        sentences = tokenize_sentence(text)
-        words = text.split()
-
-        # Calculating the number of sentences, words, and syllables
-        num_sentences = len(sentences)
-        num_words = len(words)
-        num_syllables = sum(count_syllables(word) for word in words)
-        
-        # Calculating the averages
-        avg_words_per_sentence = num_words / num_sentences if num_sentences > 0 else 0
-        avg_syllables_per_word = num_syllables / num_words if num_words > 0 else 0
-        
-        # Calculating the Flesch-Kincaid Reading Ease score
-        score = round(206.835 - 1.015 * avg_words_per_sentence - 84.6 * avg_syllables_per_word, 2)
-        results.append(score)
+    if cache is not None:
+        return [result['flesch_kincaid_reading_ease'] for result in _score_with_cache(texts, ['flesch_kincaid_reading_ease'], cache)]
 
-    return results
+    return [_apply_formula(_flesch_kincaid_reading_ease, compute_text_stats(text, fields = METRIC_DEPENDENCIES['flesch_kincaid_reading_ease'])) for text in texts]
 
 
 
-def calculate_flesch_kincaid_grade_level(texts: Union[str, List[str]]) -> List[float]:
+def calculate_flesch_kincaid_grade_level(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Flesch-Kincaid Grade Level score for one or multiple texts.
 
     Inputs:
         - texts (str or list[str]): The input text(s) for which to calculate the Grade Level score.
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - scores (list[float]): A list of Flesch-Kincaid Grade Level scores corresponding to each input text.
     '''
-    # If a single text string is provided, wrap it in a list
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    results = []
-    for text in texts:
-        # Tokenizing the text into sentences and words
-        sentences = tokenize_sentence(text)
-        words = text.split()
-
-        # Calculating the number of sentences, words, and syllables
-        num_sentences = len(sentences)
-        num_words = len(words)
-        num_syllables = sum(count_syllables(word) for word in words)
-        
-        # Calculating the averages
-        avg_words_per_sentence = num_words / num_sentences if num_sentences > 0 else 0
-        avg_syllables_per_word = num_syllables / num_words if num_words > 0 else 0
-        
-        # Calculating the Flesch-Kincaid Grade Level score
-        score = round(.39 * avg_words_per_sentence + 11.8 * avg_syllables_per_word - 15.59, 2)
-        results.append(score)
+    if cache is not None:
+        return [result['flesch_kincaid_grade_level'] for result in _score_with_cache(texts, ['flesch_kincaid_grade_level'], cache)]
 
-    return results
+    return [_apply_formula(_flesch_kincaid_grade_level, compute_text_stats(text, fields = METRIC_DEPENDENCIES['flesch_kincaid_grade_level'])) for text in texts]
 
 
 
-def calculate_gunning_fog_index(text: str) -> float:
+def calculate_gunning_fog_index(text: str, cache: Optional[ResultCache] = None) -> float:
     '''
     Calculates the Gunning Fog Index for the given text.
     
     Inputs:
         - text (str): The input text to analyze.
+        - cache (ResultCache, optional): A result cache to read a previously calculated score from and store a new one in.
     
     Returns:
         - gunning_fog_index (float): The Gunning Fog Index score
     '''
-    # Tokenizing sentences (basic method using punctuation)
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [sentence.strip() for sentence in sentences if sentence.strip()]
-    
-    # Tokenizing words
-    words = re.findall(r'\b\w+\b', text.lower())
-    
-    # Getting the complex words (words with 3+ syllables)
-    complex_words = [word for word in words if count_syllables(word) >= 3]
-    
-    # Getting number of sentences, words, and complex words
-    num_sentences = len(sentences)
-    num_words = len(words)
-    num_complex_words = len(complex_words)
-    
-    # Avoiding division by zero
-    if num_sentences == 0 or num_words == 0:
-        return 0.0
-    
-    # Performing the Gunning Fog Index calculation
-    avg_sentence_length = num_words / num_sentences
-    percent_complex_words = (num_complex_words / num_words) * 100
-    gunning_fog_index = 0.4 * (avg_sentence_length + percent_complex_words)
-    
-    return gunning_fog_index
+    if cache is not None:
+        return _score_with_cache([text], ['gunning_fog_index'], cache)[0]['gunning_fog_index']
+
+    return _apply_formula(_gunning_fog_index, compute_text_stats(text, fields = METRIC_DEPENDENCIES['gunning_fog_index']))
 
 
 
-def calculate_coleman_liau_index(texts: Union[str, List[str]]) -> List[float]:
+def calculate_coleman_liau_index(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Coleman-Liau Index for one or multiple texts.
 
     Inputs:
         - texts (str or list[str]): The input text(s) for which to calculate the Coleman-Liau Index.
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - cl_index_scores (list[float]): A list of Coleman-Liau Index scores corresponding to each input text.
@@ -131,40 +357,20 @@ def calculate_coleman_liau_index(texts: Union[str, List[str]]) -> List[float]:
     if isinstance(texts, str):
         texts = [texts]
 
-    cl_index_scores = []
-    for text in texts:
-        # Tokenizing sentences and words
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-        
-        # Calculating the number of sentences, words, and characters
-        num_sentences = len(sentences)
-        num_words = len(words)
-        num_characters = sum(len(word) for word in words)
-        
-        # Avoiding division by zero
-        if num_words == 0 or num_sentences == 0:
-            cl_index_scores.append(0.0)
-            continue
-        
-        # Calculating average number of letters per 100 words and sentences per 100 words
-        avg_letters_per_100_words = (num_characters / num_words) * 100
-        avg_sentences_per_100_words = (num_sentences / num_words) * 100
+    if cache is not None:
+        return [result['coleman_liau_index'] for result in _score_with_cache(texts, ['coleman_liau_index'], cache)]
 
-        # Calculating the Coleman-Liau Index
-        score = round(0.0588 * avg_letters_per_100_words - 0.296 * avg_sentences_per_100_words - 15.8, 2)
-        cl_index_scores.append(score)
+    return [_apply_formula(_coleman_liau_index, compute_text_stats(text, fields = METRIC_DEPENDENCIES['coleman_liau_index'])) for text in texts]
 
-    return cl_index_scores
 
 
-
-def calculate_automated_readability_index(texts: Union[str, List[str]]) -> List[float]:
+def calculate_automated_readability_index(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Automated Readability Index (ARI) for one or multiple texts.
 
     Inputs:
         - texts (str or list[str]): The input text(s) for which to calculate the ARI.
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - ari_scores (list[float]): A list of ARI scores corresponding to each input text.
@@ -173,33 +379,14 @@ def calculate_automated_readability_index(texts: Union[str, List[str]]) -> List[
     if isinstance(texts, str):
         texts = [texts]
 
-    ari_scores = []
-    for text in texts:
-        # Tokenizing sentences and words
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-        
-        # Calculating the number of sentences, words, and characters
-        num_sentences = len(sentences)
-        num_words = len(words)
-        num_characters = sum(len(word) for word in words)
-        
-        # Avoiding division by zero
-        if num_words == 0 or num_sentences == 0:
-            ari_scores.append(0.0)
-            continue
-        
-        # Calculating the ARI
-        avg_characters_per_word = num_characters / num_words
-        avg_words_per_sentence = num_words / num_sentences
-        score = round(4.71 * avg_characters_per_word + 0.5 * avg_words_per_sentence - 21.43, 2)
-        ari_scores.append(score)
-
-    return ari_scores
-
-
-
-def calculate_smog_index(texts: Union[str, List[str]]) -> List[float]:
+    if cache is not None:
+        return [result['automated_readability_index'] for result in _score_with_cache(texts, ['automated_readability_index'], cache)]
+
+    return [_apply_formula(_automated_readability_index, compute_text_stats(text, fields = METRIC_DEPENDENCIES['automated_readability_index'])) for text in texts]
+
+
+
+def calculate_smog_index(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the SMOG (Simple Measure of Gobbledygook) Index for one or multiple texts.
 
@@ -211,41 +398,23 @@ def calculate_smog_index(texts: Union[str, List[str]]) -> List[float]:
 
     Inputs:
         - texts (str or list[str]): The input text(s) to analyze.
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - smog_scores (list[float]): A list of SMOG scores corresponding to each input text.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    smog_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-        num_sentences = len(sentences)
-        num_words = len(words)
+    if cache is not None:
+        return [result['smog_index'] for result in _score_with_cache(texts, ['smog_index'], cache)]
 
-        if num_sentences == 0 or num_words == 0:
-            smog_scores.append(0.0)
-            continue
+    return [_apply_formula(_smog_index, compute_text_stats(text, fields = METRIC_DEPENDENCIES['smog_index'])) for text in texts]
 
-        # Count complex words (3+ syllables)
-        complex_words_count = sum(1 for w in words if count_syllables(w) >= 3)
 
-        # Avoid division by zero
-        if num_sentences == 0:
-            smog_scores.append(0.0)
-            continue
 
-        # Apply the SMOG formula
-        smog = 1.043 * math.sqrt(complex_words_count * (30 / num_sentences)) + 3.1291
-        smog_scores.append(round(smog, 2))
-
-    return smog_scores
-
-
-
-def calculate_dale_chall_readability_score(texts: Union[str, List[str]]) -> List[float]:
+def calculate_dale_chall_readability_score(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Dale-Chall Readability Score for one or multiple texts.
 
@@ -258,37 +427,23 @@ def calculate_dale_chall_readability_score(texts: Union[str, List[str]]) -> List
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - dale_chall_scores (list[float]): A list of Dale-Chall scores.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    dale_chall_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-        num_sentences = len(sentences)
-        num_words = len(words)
+    if cache is not None:
+        return [result['dale_chall_readability_score'] for result in _score_with_cache(texts, ['dale_chall_readability_score'], cache)]
 
-        if num_sentences == 0 or num_words == 0:
-            dale_chall_scores.append(0.0)
-            continue
+    return [_apply_formula(_dale_chall_readability_score, compute_text_stats(text, fields = METRIC_DEPENDENCIES['dale_chall_readability_score'])) for text in texts]
 
-        # Identify difficult words (3+ syllables)
-        difficult_words = [w for w in words if count_syllables(w) >= 3]
-        percentage_of_difficult_words = (len(difficult_words) / num_words) * 100
-        average_words_per_sentence = num_words / num_sentences
 
-        score = 0.1579 * (percentage_of_difficult_words + 0.0496 * average_words_per_sentence)
-        dale_chall_scores.append(round(score, 2))
 
-    return dale_chall_scores
-
-
-
-def calculate_spache_readability_formula(texts: Union[str, List[str]]) -> List[float]:
+def calculate_spache_readability_formula(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Spache Readability Formula for one or multiple texts.
 
@@ -301,36 +456,23 @@ def calculate_spache_readability_formula(texts: Union[str, List[str]]) -> List[f
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - spache_scores (list[float]): A list of Spache formula scores.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    spache_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-
-        num_sentences = len(sentences)
-        num_words = len(words)
-        if num_sentences == 0 or num_words == 0:
-            spache_scores.append(0.0)
-            continue
-
-        num_syllables = sum(count_syllables(w) for w in words)
-        average_sentence_length = num_words / num_sentences
-        average_syllables_per_word = num_syllables / num_words
+    if cache is not None:
+        return [result['spache_readability_formula'] for result in _score_with_cache(texts, ['spache_readability_formula'], cache)]
 
-        score = 0.121 * average_sentence_length + 0.082 * average_syllables_per_word - 0.659
-        spache_scores.append(round(score, 2))
+    return [_apply_formula(_spache_readability_formula, compute_text_stats(text, fields = METRIC_DEPENDENCIES['spache_readability_formula'])) for text in texts]
 
-    return spache_scores
 
 
-
-def calculate_linsear_write_formula(texts: Union[str, List[str]]) -> List[float]:
+def calculate_linsear_write_formula(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Linsear Write Formula for one or multiple texts.
 
@@ -342,35 +484,23 @@ def calculate_linsear_write_formula(texts: Union[str, List[str]]) -> List[float]
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - linsear_write_scores (list[float]): A list of Linsear Write scores.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    linsear_write_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-
-        num_sentences = len(sentences)
-        num_words = len(words)
-        if num_sentences == 0 or num_words == 0:
-            linsear_write_scores.append(0.0)
-            continue
-
-        easy_words = [w for w in words if count_syllables(w) < 3]
-        hard_words = [w for w in words if count_syllables(w) >= 3]
-
-        score = ((len(easy_words) + len(hard_words)) * 2 / num_sentences) - 2
-        linsear_write_scores.append(round(score, 2))
+    if cache is not None:
+        return [result['linsear_write_formula'] for result in _score_with_cache(texts, ['linsear_write_formula'], cache)]
 
-    return linsear_write_scores
+    return [_apply_formula(_linsear_write_formula, compute_text_stats(text, fields = METRIC_DEPENDENCIES['linsear_write_formula'])) for text in texts]
 
 
 
-def calculate_forcast_readability_formula(texts: Union[str, List[str]]) -> List[float]:
+def calculate_forcast_readability_formula(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the FORCAST Readability Formula for one or multiple texts.
 
@@ -381,33 +511,23 @@ def calculate_forcast_readability_formula(texts: Union[str, List[str]]) -> List[
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - forcast_scores (list[float]): A list of FORCAST scores.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    forcast_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-
-        num_sentences = len(sentences)
-        if num_sentences == 0:
-            forcast_scores.append(0.0)
-            continue
-
-        num_syllables = sum(count_syllables(w) for w in words)
+    if cache is not None:
+        return [result['forcast_readability_formula'] for result in _score_with_cache(texts, ['forcast_readability_formula'], cache)]
 
-        score = 20 - ((num_syllables * 0.1) / num_sentences)
-        forcast_scores.append(round(score, 2))
+    return [_apply_formula(_forcast_readability_formula, compute_text_stats(text, fields = METRIC_DEPENDENCIES['forcast_readability_formula'])) for text in texts]
 
-    return forcast_scores
 
 
-
-def calculate_raygor_readability_estimate(texts: Union[str, List[str]]) -> List[float]:
+def calculate_raygor_readability_estimate(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Raygor Readability Estimate for one or multiple texts.
 
@@ -419,36 +539,23 @@ def calculate_raygor_readability_estimate(texts: Union[str, List[str]]) -> List[
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - raygor_scores (list[float]): A list of Raygor readability estimates.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    raygor_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-
-        num_sentences = len(sentences)
-        num_words = len(words)
-        if num_sentences == 0 or num_words == 0:
-            raygor_scores.append(0.0)
-            continue
+    if cache is not None:
+        return [result['raygor_readability_estimate'] for result in _score_with_cache(texts, ['raygor_readability_estimate'], cache)]
 
-        difficult_words = [w for w in words if count_syllables(w) >= 3]
-        percentage_of_difficult_words = (len(difficult_words) / num_words) * 100
-        average_words_per_sentence = num_words / num_sentences
+    return [_apply_formula(_raygor_readability_estimate, compute_text_stats(text, fields = METRIC_DEPENDENCIES['raygor_readability_estimate'])) for text in texts]
 
-        score = 0.1579 * average_words_per_sentence + 0.0496 * percentage_of_difficult_words + 3.6365
-        raygor_scores.append(round(score, 2))
 
-    return raygor_scores
 
-
-
-def calculate_lix_readability_score(texts: Union[str, List[str]]) -> List[float]:
+def calculate_lix_readability_score(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the LIX (Läser–Lätthetsindex) readability score for one or multiple texts.
 
@@ -459,33 +566,23 @@ def calculate_lix_readability_score(texts: Union[str, List[str]]) -> List[float]
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - lix_scores (list[float]): A list of LIX scores.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    lix_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-
-        num_sentences = len(sentences)
-        num_words = len(words)
-        if num_sentences == 0 or num_words == 0:
-            lix_scores.append(0.0)
-            continue
-
-        long_words = [w for w in words if len(w) > 6]
-        score = (num_words / num_sentences) + ((len(long_words) * 100) / num_words)
-        lix_scores.append(round(score, 2))
+    if cache is not None:
+        return [result['lix_readability_score'] for result in _score_with_cache(texts, ['lix_readability_score'], cache)]
 
-    return lix_scores
+    return [_apply_formula(_lix_readability_score, compute_text_stats(text, fields = METRIC_DEPENDENCIES['lix_readability_score'])) for text in texts]
 
 
 
-def calculate_rix_readability_score(texts: Union[str, List[str]]) -> List[float]:
+def calculate_rix_readability_score(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the RIX readability score for one or multiple texts.
 
@@ -496,32 +593,23 @@ def calculate_rix_readability_score(texts: Union[str, List[str]]) -> List[float]
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - rix_scores (list[float]): A list of RIX scores.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    rix_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-
-        num_sentences = len(sentences)
-        if num_sentences == 0:
-            rix_scores.append(0.0)
-            continue
-
-        long_words = [w for w in words if len(w) > 6]
-        score = len(long_words) / num_sentences
-        rix_scores.append(round(score, 2))
+    if cache is not None:
+        return [result['rix_readability_score'] for result in _score_with_cache(texts, ['rix_readability_score'], cache)]
 
-    return rix_scores
+    return [_apply_formula(_rix_readability_score, compute_text_stats(text, fields = METRIC_DEPENDENCIES['rix_readability_score'])) for text in texts]
 
 
 
-def calculate_strain_index(texts: Union[str, List[str]]) -> List[float]:
+def calculate_strain_index(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Strain Index for one or multiple texts.
 
@@ -532,32 +620,23 @@ def calculate_strain_index(texts: Union[str, List[str]]) -> List[float]:
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - strain_scores (list[float]): A list of Strain Index scores.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    strain_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-
-        num_sentences = len(sentences)
-        if num_sentences == 0:
-            strain_scores.append(0.0)
-            continue
+    if cache is not None:
+        return [result['strain_index'] for result in _score_with_cache(texts, ['strain_index'], cache)]
 
-        long_words = [w for w in words if len(w) > 6]
-        score = (len(long_words) * 100) / num_sentences
-        strain_scores.append(round(score, 2))
+    return [_apply_formula(_strain_index, compute_text_stats(text, fields = METRIC_DEPENDENCIES['strain_index'])) for text in texts]
 
-    return strain_scores
 
 
-
-def calculate_new_dale_chall_readability_score(texts: Union[str, List[str]]) -> List[float]:
+def calculate_new_dale_chall_readability_score(texts: Union[str, List[str]], cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the "New Dale-Chall Readability Score" for one or multiple texts.
 
@@ -569,36 +648,26 @@ def calculate_new_dale_chall_readability_score(texts: Union[str, List[str]]) ->
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - new_dale_chall_scores (list[float]): A list of New Dale-Chall scores.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    new_dale_chall_scores = []
-    for text in texts:
-        sentences = tokenize_sentence(text)
-        words = re.findall(r'\b\w+\b', text)
-        num_sentences = len(sentences)
-        num_words = len(words)
-
-        if num_sentences == 0 or num_words == 0:
-            new_dale_chall_scores.append(0.0)
-            continue
-
-        difficult_words = [w for w in words if count_syllables(w) >= 3]
-        percentage_of_difficult_words = (len(difficult_words) / num_words) * 100
-        average_words_per_sentence = num_words / num_sentences
-
-        score = 0.1579 * percentage_of_difficult_words + 0.0496 * average_words_per_sentence + 3.6365
-        new_dale_chall_scores.append(round(score, 2))
+    if cache is not None:
+        return [result['new_dale_chall_readability_score'] for result in _score_with_cache(texts, ['new_dale_chall_readability_score'], cache)]
 
-    return new_dale_chall_scores
+    return [_apply_formula(_new_dale_chall_readability_score, compute_text_stats(text, fields = METRIC_DEPENDENCIES['new_dale_chall_readability_score'])) for text in texts]
 
 
 
-def calculate_readability_consensus_grade(texts: Union[str, List[str]]) -> List[float]:
+def calculate_readability_consensus_grade(texts: Union[str, List[str]],
+                                          n_jobs: Optional[int] = 1,
+                                          executor: Optional[Executor] = None,
+                                          cache: Optional[ResultCache] = None) -> List[float]:
     '''
     Calculate the Readability Consensus Grade for one or multiple texts.
 
@@ -623,107 +692,163 @@ def calculate_readability_consensus_grade(texts: Union[str, List[str]]) -> List[
 
     Inputs:
         - texts (str or list[str]): The input text(s).
+        - n_jobs (int, optional): The number of worker processes to score with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+        - cache (ResultCache, optional): A result cache to read previously calculated scores from and store new ones in.
 
     Returns:
         - consensus_scores (list[float]): A list of consensus scores corresponding to each input text.
     '''
+    # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
 
-    # Using the previously defined metrics
-    fk_grade_level = calculate_flesch_kincaid_grade_level(texts)
-    gunning_fog = [calculate_gunning_fog_index(text) for text in texts]
-    coleman_liau = calculate_coleman_liau_index(texts)
-    ari = calculate_automated_readability_index(texts)
-    smog = calculate_smog_index(texts)
-    dale_chall = calculate_dale_chall_readability_score(texts)
-    spache = calculate_spache_readability_formula(texts)
-    new_dale_chall = calculate_new_dale_chall_readability_score(texts)
-    linsear_write = calculate_linsear_write_formula(texts)
-    forcast = calculate_forcast_readability_formula(texts)
-    raygor = calculate_raygor_readability_estimate(texts)
-    lix = calculate_lix_readability_score(texts)
-    rix = calculate_rix_readability_score(texts)
-    strain = calculate_strain_index(texts)
-
-    consensus_scores = []
-    for i in range(len(texts)):
-        sum_scores = (fk_grade_level[i] 
-                      + gunning_fog[i] 
-                      + coleman_liau[i] 
-                      + ari[i] 
-                      + smog[i]
-                      + dale_chall[i] 
-                      + spache[i] 
-                      + new_dale_chall[i] 
-                      + linsear_write[i] 
-                      + forcast[i] 
-                      + raygor[i] 
-                      + lix[i] 
-                      + rix[i] 
-                      + strain[i])
-        
-        consensus = sum_scores / 14
-        consensus_scores.append(round(consensus, 2))
-
-    return consensus_scores
-
-
-
-def calculate_all_readability_metrics(texts: Union[str, List[str]]) -> List[dict]:
+    if cache is not None:
+        results = _score_with_cache(texts, ['readability_consensus_grade'], cache, n_jobs = n_jobs, executor = executor)
+        return [result['readability_consensus_grade'] for result in results]
+
+    return map_in_chunks(_readability_consensus_grade_chunk, texts, n_jobs = n_jobs, executor = executor)
+
+
+
+def calculate_all_readability_metrics(texts: Union[str, List[str]],
+                                      n_jobs: Optional[int] = 1,
+                                      executor: Optional[Executor] = None,
+                                      output: str = 'records',
+                                      cache: Optional[ResultCache] = None) -> List[dict]:
     '''
     Calculate all readability metrics for one or multiple texts.
     
     Inputs:
         - texts (str or list[str]): The input text(s) for which to calculate the readability metrics.
+        - n_jobs (int, optional): The number of worker processes to score with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+        - output (str): 'records' (default) for a list of dictionaries, or one of the columnar modes 'dict', 'structured',
+          'pandas', or 'polars', which evaluate every formula over NumPy arrays (see `readability_columnar`).
+        - cache (ResultCache, optional): A result cache to read previously calculated results from and store new ones in.
+          Only used with 'records' output.
     
     Returns:
-        - results (list[dict]): A list of dictionaries, each containing all readability metrics for the corresponding input text.
+        - results (list[dict]): A list of dictionaries, each containing all readability metrics for the corresponding input text,
+          or the metrics in the requested columnar container.
     '''
-    
     # Wrapping the input in a list if it is a single string
     if isinstance(texts, str):
         texts = [texts]
-    
-    # Calculating all the respective metrics all metrics as lists
-    fk_reading_ease_scores = calculate_flesch_kincaid_reading_ease(texts)
-    fk_grade_level_scores = calculate_flesch_kincaid_grade_level(texts)
-    gunning_fog_scores = [calculate_gunning_fog_index(text) for text in texts]
-    coleman_liau_scores = calculate_coleman_liau_index(texts)
-    ari_scores = calculate_automated_readability_index(texts)
-    smog_scores = calculate_smog_index(texts)
-    dale_chall_scores = calculate_dale_chall_readability_score(texts)
-    spache_scores = calculate_spache_readability_formula(texts)
-    new_dale_chall_scores = calculate_new_dale_chall_readability_score(texts)
-    linsear_write_scores = calculate_linsear_write_formula(texts)
-    forcast_scores = calculate_forcast_readability_formula(texts)
-    raygor_scores = calculate_raygor_readability_estimate(texts)
-    lix_scores = calculate_lix_readability_score(texts)
-    rix_scores = calculate_rix_readability_score(texts)
-    strain_scores = calculate_strain_index(texts)
-    consensus_scores = calculate_readability_consensus_grade(texts)
-
-    # Combining into a list of dictionaries
-    results = []
-    for i in range(len(texts)):
-        readability_metrics = {
-            'flesch_kincaid_reading_ease': fk_reading_ease_scores[i],
-            'flesch_kincaid_grade_level': fk_grade_level_scores[i],
-            'gunning_fog_index': gunning_fog_scores[i],
-            'coleman_liau_index': coleman_liau_scores[i],
-            'automated_readability_index': ari_scores[i],
-            'smog_index': smog_scores[i],
-            'dale_chall_readability_score': dale_chall_scores[i],
-            'spache_readability_formula': spache_scores[i],
-            'new_dale_chall_readability_score': new_dale_chall_scores[i],
-            'linsear_write_formula': linsear_write_scores[i],
-            'forcast_readability_formula': forcast_scores[i],
-            'raygor_readability_estimate': raygor_scores[i],
-            'lix_readability_score': lix_scores[i],
-            'rix_readability_score': rix_scores[i],
-            'strain_index': strain_scores[i],
-            'readability_consensus_grade': consensus_scores[i]
-        }
-        results.append(readability_metrics)
 
-    return results
+    # Delegating columnar modes, importing NumPy only when one is requested
+    if output != 'records':
+        from whetstone.metrics.text.readability_columnar import calculate_all_readability_metrics_columnar
+        return calculate_all_readability_metrics_columnar(texts, output = output, n_jobs = n_jobs, executor = executor)
+
+    if cache is not None:
+        return _score_with_cache(texts, list(READABILITY_FORMULAS), cache, n_jobs = n_jobs, executor = executor)
+
+    # Computing the counts once per text and evaluating every formula from them, in parallel chunks if requested
+    return map_in_chunks(_all_readability_metrics_chunk, texts, n_jobs = n_jobs, executor = executor)
+
+
+
+def iter_readability_metrics(texts: Iterable[str],
+                             metrics: Optional[List[str]] = None,
+                             batch_size: Optional[int] = None,
+                             n_jobs: Optional[int] = 1,
+                             executor: Optional[Executor] = None) -> Iterator[dict]:
+    '''
+    Lazily calculate readability metrics over any iterable of texts.
+
+    Texts are pulled from the iterable in micro-batches of at most `batch_size`, scored, and yielded one at a time,
+    so memory stays bounded by the batch size no matter how many texts the iterable produces. This makes it suitable
+    for file lines, database cursors, and other generators that are too large to materialize.
+
+    Inputs:
+        - texts (iterable[str]): Any iterable or iterator of texts.
+        - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric returned by `calculate_all_readability_metrics`.
+        - batch_size (int, optional): The maximum number of texts held in memory at once. Defaults to 1,000, or enough to keep every worker busy when scoring in parallel.
+        - n_jobs (int, optional): The number of worker processes to score each batch with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to fan chunks of each batch out to instead of the shared process pool.
+
+    Returns:
+        - results (iterator[dict]): An iterator yielding one dictionary of metrics per input text, in input order.
+    '''
+    if batch_size is None:
+        batch_size = default_batch_size(n_jobs, executor)
+    elif batch_size <= 0:
+        raise ValueError('batch_size must be a positive integer')
+    metrics = _validate_metric_names(metrics)
+
+    # Wrapping the input in a list if it is a single string
+    if isinstance(texts, str):
+        texts = [texts]
+
+    if metrics == list(READABILITY_FORMULAS):
+        chunk_func = _all_readability_metrics_chunk
+    else:
+        chunk_func = partial(_selected_readability_metrics_chunk, metrics = metrics)
+
+    # Pulling one bounded micro-batch at a time from the iterator
+    iterator = iter(texts)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield from map_in_chunks(chunk_func, batch, n_jobs = n_jobs, executor = executor)
+
+
+
+def compute_metrics(texts: Union[str, List[str]],
+                    metrics: Optional[List[str]] = None,
+                    n_jobs: Optional[int] = 1,
+                    executor: Optional[Executor] = None,
+                    cache: Optional[ResultCache] = None) -> List[dict]:
+    '''
+    Calculate a chosen set of readability metrics, running only the text extraction passes they depend on.
+
+    The requested metrics are resolved to the TextStats fields they read (sentences, words, characters, syllables,
+    complex words, long words, ...), and only the passes producing those fields are run. For example, LIX, RIX,
+    and the Strain Index never count syllables.
+
+    Inputs:
+        - texts (str or list[str]): The input text(s).
+        - metrics (list[str], optional): The metric names (the keys returned by `calculate_all_readability_metrics`). Defaults to every metric.
+        - n_jobs (int, optional): The number of worker processes to score with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to fan chunks of texts out to instead of the shared process pool.
+        - cache (ResultCache, optional): A result cache to read previously calculated results from and store new ones in.
+
+    Returns:
+        - results (list[dict]): A list of dictionaries, each containing the requested metrics for the corresponding input text.
+    '''
+    metrics = _validate_metric_names(metrics)
+
+    # Wrapping the input in a list if it is a single string
+    if isinstance(texts, str):
+        texts = [texts]
+
+    if cache is not None:
+        return _score_with_cache(texts, metrics, cache, n_jobs = n_jobs, executor = executor)
+
+    return map_in_chunks(partial(_selected_readability_metrics_chunk, metrics = metrics), texts, n_jobs = n_jobs, executor = executor)
+
+__all__ = ['READABILITY_FORMULAS',
+           'calculate_readability_metrics_from_stats',
+           'calculate_flesch_kincaid_reading_ease',
+           'calculate_flesch_kincaid_grade_level',
+           'calculate_gunning_fog_index',
+           'calculate_coleman_liau_index',
+           'calculate_automated_readability_index',
+           'calculate_smog_index',
+           'calculate_dale_chall_readability_score',
+           'calculate_spache_readability_formula',
+           'calculate_linsear_write_formula',
+           'calculate_forcast_readability_formula',
+           'calculate_raygor_readability_estimate',
+           'calculate_lix_readability_score',
+           'calculate_rix_readability_score',
+           'calculate_strain_index',
+           'calculate_new_dale_chall_readability_score',
+           'calculate_readability_consensus_grade',
+           'calculate_all_readability_metrics',
+           'iter_readability_metrics',
+           'METRIC_DEPENDENCIES',
+           'resolve_metric_dependencies',
+           'compute_metrics']
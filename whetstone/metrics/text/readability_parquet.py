@@ -0,0 +1,141 @@
+import numpy as np
+from collections import deque
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, Optional
+from whetstone.metrics.text.readability_columnar import score_text_column
+from whetstone.metrics.text.readability_metrics import _validate_metric_names
+from whetstone.utils.parallel import get_process_pool, resolve_n_jobs
+
+
+
+def _import_pyarrow():
+    # Importing pyarrow only when a pipeline runs, since it is an optional dependency
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError('Parquet scoring requires pyarrow to be installed') from e
+    return pyarrow
+
+
+
+def _score_text_array(texts: np.ndarray, metrics: List[str]) -> Dict[str, np.ndarray]:
+    # Module-level so that batches can be scored in process pool workers
+    return score_text_column(texts, metrics = metrics, chunk_size = max(len(texts), 1))
+
+
+
+def iter_scored_record_batches(source,
+                               text_column: str,
+                               metrics: Optional[List[str]] = None,
+                               keep_columns: Optional[List[str]] = None,
+                               prefix: str = '',
+                               batch_size: int = 10_000,
+                               n_jobs: Optional[int] = 1,
+                               executor: Optional[Executor] = None,
+                               max_in_flight: Optional[int] = None) -> Iterator:
+    '''
+    Streams a Parquet dataset's text column one record batch at a time and yields the scored batches.
+
+    Only the text column (and any `keep_columns`) is read, `batch_size` rows at a time. With `n_jobs` or an
+    `executor`, up to `max_in_flight` batches are scored concurrently while later batches are read, and batches are
+    yielded in their original order, so memory stays bounded by the number of batches in flight.
+
+    Inputs:
+        - source: A Parquet file, a directory of Parquet files, a list of files, or a `pyarrow.dataset.Dataset`.
+        - text_column (str): The name of the text column.
+        - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+        - keep_columns (list[str], optional): Columns copied from the input to each output batch, such as an id column.
+        - prefix (str): A prefix added to every metric column name. Defaults to ''.
+        - batch_size (int): The maximum number of rows per record batch. Defaults to 10,000.
+        - n_jobs (int, optional): The number of worker processes to score batches with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to score batches on instead of the shared process pool.
+        - max_in_flight (int, optional): The maximum number of batches being scored at once. Defaults to twice the number of workers.
+
+    Returns:
+        - batches (iterator[pyarrow.RecordBatch]): The kept columns followed by one float64 column per metric. Null texts score as NaN.
+    '''
+    pa = _import_pyarrow()
+    metrics = _validate_metric_names(metrics)
+    keep_columns = list(dict.fromkeys(keep_columns or []))
+    dataset = source if isinstance(source, pa.dataset.Dataset) else pa.dataset.dataset(source, format = 'parquet')
+
+    # Reading the text column once, even when it is also kept
+    batches = dataset.to_batches(columns = list(dict.fromkeys(keep_columns + [text_column])), batch_size = batch_size)
+    names = keep_columns + [prefix + name for name in metrics]
+
+    def to_record_batch(batch, scores):
+        arrays = [batch.column(name) for name in keep_columns] + [pa.array(scores[name], type = pa.float64()) for name in metrics]
+        return pa.RecordBatch.from_arrays(arrays, names = names)
+
+    num_workers = resolve_n_jobs(n_jobs)
+    if executor is None and num_workers == 1:
+        for batch in batches:
+            if batch.num_rows:
+                yield to_record_batch(batch, _score_text_array(batch.column(text_column).to_numpy(zero_copy_only = False), metrics))
+        return
+
+    # Keeping a bounded window of batches in flight and yielding them in order as they complete
+    if executor is None:
+        executor = get_process_pool(num_workers)
+    if max_in_flight is None:
+        max_in_flight = 2 * num_workers if num_workers > 1 else 4
+    pending = deque()
+    for batch in batches:
+        if not batch.num_rows:
+            continue
+        texts = batch.column(text_column).to_numpy(zero_copy_only = False)
+        pending.append((batch, executor.submit(_score_text_array, texts, metrics)))
+        if len(pending) >= max_in_flight:
+            batch, future = pending.popleft()
+            yield to_record_batch(batch, future.result())
+    while pending:
+        batch, future = pending.popleft()
+        yield to_record_batch(batch, future.result())
+
+
+
+def score_parquet(source,
+                  destination: str,
+                  text_column: str,
+                  metrics: Optional[List[str]] = None,
+                  keep_columns: Optional[List[str]] = None,
+                  prefix: str = '',
+                  batch_size: int = 10_000,
+                  n_jobs: Optional[int] = 1,
+                  executor: Optional[Executor] = None,
+                  compression: str = 'zstd') -> int:
+    '''
+    Scores a Parquet dataset's text column and writes the metric columns to a Parquet file, one record batch at a time.
+
+    Inputs:
+        - source: A Parquet file, a directory of Parquet files, a list of files, or a `pyarrow.dataset.Dataset`.
+        - destination (str): The Parquet file to write.
+        - text_column (str): The name of the text column.
+        - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+        - keep_columns (list[str], optional): Columns copied from the input to the output, such as an id column.
+        - prefix (str): A prefix added to every metric column name. Defaults to ''.
+        - batch_size (int): The maximum number of rows per record batch. Defaults to 10,000.
+        - n_jobs (int, optional): The number of worker processes to score batches with. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to score batches on instead of the shared process pool.
+        - compression (str): The Parquet compression codec. Defaults to 'zstd'.
+
+    Returns:
+        - num_rows (int): The number of rows written.
+    '''
+    pa = _import_pyarrow()
+    metrics = _validate_metric_names(metrics)
+    keep_columns = list(dict.fromkeys(keep_columns or []))
+    dataset = source if isinstance(source, pa.dataset.Dataset) else pa.dataset.dataset(source, format = 'parquet')
+    schema = pa.schema([dataset.schema.field(name) for name in keep_columns] + [pa.field(prefix + name, pa.float64()) for name in metrics])
+
+    num_rows = 0
+    with pa.parquet.ParquetWriter(destination, schema, compression = compression) as writer:
+        for batch in iter_scored_record_batches(dataset, text_column, metrics = metrics, keep_columns = keep_columns, prefix = prefix,
+                                                batch_size = batch_size, n_jobs = n_jobs, executor = executor):
+            writer.write_batch(batch)
+            num_rows += batch.num_rows
+    return num_rows
+
+__all__ = ['iter_scored_record_batches', 'score_parquet']
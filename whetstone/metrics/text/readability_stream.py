@@ -0,0 +1,244 @@
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional
+from whetstone.metrics.text.readability_metrics import READABILITY_FORMULAS, _validate_metric_names
+from whetstone.utils.text.syllable_counter import SyllableCounter, default_syllable_counter
+from whetstone.utils.text.text_parsers import WORD_PATTERN, find_sentence_boundaries
+from whetstone.utils.text.text_stats import TextStats
+
+
+
+# Matching the start of each non-blank piece of a split on terminal punctuation (Gunning Fog), and the punctuation itself
+_PUNCTUATION_SENTENCE_CONTENT_PATTERN = re.compile(r'[^.!?\s][^.!?]*')
+_TERMINAL_PUNCTUATION_PATTERN = re.compile(r'[.!?]')
+
+# The sentence boundary lookbehinds inspect at most the 4 characters before a candidate
+_BOUNDARY_CONTEXT = 4
+
+
+
+class IncrementalReadabilityScorer:
+    '''
+    Stateful scorer for text that arrives in appended chunks, such as a streamed LLM response.
+
+    Each `append` only scans the new chunk (plus the few characters of context the tokenizers need) and folds its
+    counts into running totals, so the cost per chunk is proportional to the chunk rather than to the text so far.
+    A word, whitespace token, or sentence that is split across chunk boundaries is held back until it is complete,
+    and counted as if the text ended there when the current scores are read. At every moment `stats` and `scores`
+    are identical to `compute_text_stats` and the readability functions applied to the whole text received so far.
+
+    Inputs:
+        - metrics (list[str], optional): The names of the metrics returned by `scores`. Defaults to every metric.
+        - syllable_counter (SyllableCounter, optional): The syllable memo to use. Defaults to the shared `default_syllable_counter`.
+
+    Example:
+        scorer = IncrementalReadabilityScorer(metrics = ['flesch_kincaid_grade_level'])
+        for chunk in response_stream:
+            scorer.append(chunk)
+            print(scorer.scores())
+    '''
+
+    def __init__(self, metrics: Optional[List[str]] = None, syllable_counter: Optional[SyllableCounter] = None):
+        self.metrics = _validate_metric_names(metrics)
+        self.syllable_counter = default_syllable_counter if syllable_counter is None else syllable_counter
+        self.reset()
+
+
+    def reset(self) -> None:
+        '''
+        Discards the text received so far, so the scorer can be reused for a new stream.
+        '''
+        self.length = 0
+
+        # Sentence boundaries: committed ones are followed by content, pending ones may turn out to be trailing whitespace
+        self._context = ''
+        self._num_boundaries = 0
+        self._num_pending_boundaries = 0
+
+        # Running totals over the completed words and whitespace tokens, and the partial one at the end of the text
+        self._word_totals = [0] * 8
+        self._word_buffer = ''
+        self._num_whitespace_words = 0
+        self._num_whitespace_syllables = 0
+        self._token_buffer = ''
+
+        # Punctuation sentences are counted when they start; `_in_segment` tracks whether the text ends inside one
+        self._num_punctuation_sentences = 0
+        self._in_segment = False
+
+
+    def _word_counts(self, frequencies: Dict[str, int]) -> List[int]:
+        # Counting [characters, syllables, complex, long, difficult, lowercase words, lowercase complex] the way compute_text_stats does
+        syllable_counts = self.syllable_counter.count_frequencies(frequencies)
+        lexicon = self.syllable_counter.lexicon
+        dale_chall = lexicon is not None and lexicon.has_dale_chall_words
+        counts = [0] * 8
+        lowercase_frequencies = Counter()
+        for word, frequency in frequencies.items():
+            syllables = syllable_counts[word]
+            counts[0] += frequency
+            counts[1] += len(word) * frequency
+            counts[2] += syllables * frequency
+            if syllables >= 3:
+                counts[3] += frequency
+            if len(word) > 6:
+                counts[4] += frequency
+            if dale_chall:
+                if not lexicon.is_dale_chall_easy(word):
+                    counts[5] += frequency
+            elif syllables >= 3:
+                counts[5] += frequency
+            if word.isascii():
+                counts[6] += frequency
+                if syllables >= 3:
+                    counts[7] += frequency
+            else:
+                for lowercase_word in WORD_PATTERN.findall(word.lower()):
+                    lowercase_frequencies[lowercase_word] += frequency
+        if lowercase_frequencies:
+            lowercase_syllable_counts = self.syllable_counter.count_frequencies(lowercase_frequencies)
+            for word, frequency in lowercase_frequencies.items():
+                counts[6] += frequency
+                if lowercase_syllable_counts[word] >= 3:
+                    counts[7] += frequency
+        return counts
+
+
+    def append(self, chunk: str) -> None:
+        '''
+        Folds the next chunk of the text into the running counts.
+
+        Inputs:
+            - chunk (str): The text appended since the previous call.
+        '''
+        if not chunk:
+            return
+
+        # Finding the sentence boundaries in the chunk, with enough preceding context for the abbreviation checks
+        scanned = self._context + chunk
+        offset = len(self._context)
+        boundaries = [i - offset for i in find_sentence_boundaries(scanned) if i >= offset]
+        self._context = scanned[-_BOUNDARY_CONTEXT:]
+
+        # A boundary only splits the text once non-whitespace content follows it; until then it is trailing whitespace
+        last_content = len(chunk.rstrip()) - 1
+        if last_content >= 0:
+            self._num_boundaries += self._num_pending_boundaries + sum(1 for i in boundaries if i < last_content)
+            self._num_pending_boundaries = sum(1 for i in boundaries if i > last_content)
+        else:
+            self._num_pending_boundaries += len(boundaries)
+
+        # Counting the completed words, holding back a word that may continue in the next chunk
+        text = self._word_buffer + chunk
+        words = WORD_PATTERN.findall(text)
+        self._word_buffer = words.pop() if words and WORD_PATTERN.match(text[-1]) else ''
+        if words:
+            for i, count in enumerate(self._word_counts(Counter(words))):
+                self._word_totals[i] += count
+
+        # Counting the completed whitespace tokens the same way
+        text = self._token_buffer + chunk
+        tokens = text.split()
+        self._token_buffer = tokens.pop() if tokens and not text[-1].isspace() else ''
+        if tokens:
+            self._num_whitespace_words += len(tokens)
+            self._num_whitespace_syllables += self.syllable_counter.total_syllables(tokens)
+
+        # Counting the punctuation sentences that start in the chunk; one that starts before the chunk's first
+        # punctuation mark continues the piece the previous chunk ended in
+        first = last = None
+        num_pieces = 0
+        for match in _PUNCTUATION_SENTENCE_CONTENT_PATTERN.finditer(chunk):
+            if first is None:
+                first = match
+            last = match
+            num_pieces += 1
+        if first is not None:
+            punctuation = _TERMINAL_PUNCTUATION_PATTERN.search(chunk)
+            if self._in_segment and (punctuation is None or first.start() < punctuation.start()):
+                num_pieces -= 1
+            self._num_punctuation_sentences += num_pieces
+            self._in_segment = last.end() == len(chunk)
+        elif _TERMINAL_PUNCTUATION_PATTERN.search(chunk):
+            self._in_segment = False
+
+        self.length += len(chunk)
+
+
+    def extend(self, chunks: Iterable[str]) -> None:
+        '''
+        Appends several chunks in order.
+
+        Inputs:
+            - chunks (iterable[str]): The chunks of text.
+        '''
+        for chunk in chunks:
+            self.append(chunk)
+
+
+    @property
+    def stats(self) -> TextStats:
+        '''
+        The counts of the text received so far, identical to `compute_text_stats` on the whole text.
+        '''
+        # Counting the partial word and token at the end of the text as complete, as they would be if the stream ended here
+        word_counts = list(self._word_totals)
+        if self._word_buffer:
+            for i, count in enumerate(self._word_counts({self._word_buffer: 1})):
+                word_counts[i] += count
+        num_whitespace_words = self._num_whitespace_words
+        num_whitespace_syllables = self._num_whitespace_syllables
+        if self._token_buffer:
+            num_whitespace_words += 1
+            num_whitespace_syllables += self.syllable_counter.count(self._token_buffer)
+
+        num_words, num_characters, num_syllables, num_complex_words, num_long_words, num_difficult_words, \
+            num_lowercase_words, num_lowercase_complex_words = word_counts
+        return TextStats(
+            num_sentences = self._num_boundaries + 1,
+            num_words = num_words,
+            num_characters = num_characters,
+            num_syllables = num_syllables,
+            num_complex_words = num_complex_words,
+            num_long_words = num_long_words,
+            num_whitespace_words = num_whitespace_words,
+            num_whitespace_syllables = num_whitespace_syllables,
+            num_punctuation_sentences = self._num_punctuation_sentences,
+            num_lowercase_words = num_lowercase_words,
+            num_lowercase_complex_words = num_lowercase_complex_words,
+            num_difficult_words = num_difficult_words
+        )
+
+
+    def scores(self) -> dict:
+        '''
+        Computes the current metric values.
+
+        Returns:
+            - result (dict): The metrics of the text received so far, identical to scoring the whole text from scratch.
+        '''
+        stats = self.stats
+        return {name: READABILITY_FORMULAS[name](stats) for name in self.metrics}
+
+
+
+def iter_incremental_readability_metrics(chunks: Iterable[str],
+                                         metrics: Optional[List[str]] = None,
+                                         syllable_counter: Optional[SyllableCounter] = None) -> Iterator[dict]:
+    '''
+    Scores a stream of text chunks, yielding the metrics of the text so far after each chunk.
+
+    Inputs:
+        - chunks (iterable[str]): The chunks of text, in order.
+        - metrics (list[str], optional): The names of the metrics to calculate. Defaults to every metric.
+        - syllable_counter (SyllableCounter, optional): The syllable memo to use. Defaults to the shared `default_syllable_counter`.
+
+    Returns:
+        - results (iterator[dict]): One dictionary of metrics per chunk.
+    '''
+    scorer = IncrementalReadabilityScorer(metrics = metrics, syllable_counter = syllable_counter)
+    for chunk in chunks:
+        scorer.append(chunk)
+        yield scorer.scores()
+
+__all__ = ['IncrementalReadabilityScorer', 'iter_incremental_readability_metrics']
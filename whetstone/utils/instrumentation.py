@@ -0,0 +1,232 @@
+import threading
+from time import perf_counter
+from typing import Callable, Dict, Optional
+
+
+
+# Read by the hot paths before doing any timing, so disabled instrumentation costs one attribute lookup per stage
+enabled = False
+
+_collectors = []
+_collectors_lock = threading.Lock()
+
+
+
+def _refresh() -> None:
+    global enabled
+    enabled = bool(_collectors)
+
+
+
+def add_collector(collector) -> None:
+    '''
+    Registers a collector that receives every instrumentation event.
+
+    A collector is any object with `on_stage(stage, seconds)` and `on_counts(texts, words)` methods.
+
+    Inputs:
+        - collector: The collector to register.
+    '''
+    with _collectors_lock:
+        _collectors.append(collector)
+        _refresh()
+
+
+
+def remove_collector(collector) -> None:
+    '''
+    Unregisters a collector added with `add_collector`.
+
+    Inputs:
+        - collector: The collector to unregister.
+    '''
+    with _collectors_lock:
+        if collector in _collectors:
+            _collectors.remove(collector)
+        _refresh()
+
+
+
+class _StageCallback:
+    # Adapts a plain `callback(stage, seconds)` function to the collector interface
+    def __init__(self, callback: Callable[[str, float], None]):
+        self.callback = callback
+
+    def on_stage(self, stage: str, seconds: float) -> None:
+        self.callback(stage, seconds)
+
+    def on_counts(self, texts: int, words: int) -> None:
+        pass
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _StageCallback) and other.callback == self.callback
+
+
+
+def register_callback(callback: Callable[[str, float], None]) -> None:
+    '''
+    Registers a function called with `(stage, seconds)` every time an instrumented stage completes.
+
+    Inputs:
+        - callback (callable): The function to call.
+    '''
+    add_collector(_StageCallback(callback))
+
+
+
+def unregister_callback(callback: Callable[[str, float], None]) -> None:
+    '''
+    Unregisters a function added with `register_callback`.
+
+    Inputs:
+        - callback (callable): The function to remove.
+    '''
+    remove_collector(_StageCallback(callback))
+
+
+
+def record_stage(stage: str, start: float) -> float:
+    '''
+    Reports that a stage which began at `start` has just completed. Only called while instrumentation is enabled.
+
+    Inputs:
+        - stage (str): The stage name.
+        - start (float): The `time.perf_counter()` value when the stage began.
+
+    Returns:
+        - now (float): The current `time.perf_counter()` value, for timing the next stage.
+    '''
+    now = perf_counter()
+    for collector in _collectors:
+        collector.on_stage(stage, now - start)
+    return now
+
+
+
+def record_counts(texts: int, words: int) -> None:
+    '''
+    Reports the number of texts and words processed. Only called while instrumentation is enabled.
+
+    Inputs:
+        - texts (int): The number of texts.
+        - words (int): The number of words.
+    '''
+    for collector in _collectors:
+        collector.on_counts(texts, words)
+
+
+
+class Instrumentation:
+    '''
+    Context manager that collects hot-path statistics for everything scored inside it.
+
+    Records the wall time and call count of each stage (`tokenize_sentence`, `word_split`, `count_syllables`,
+    `formulas`), the number of texts and words processed, and the syllable memo hit rate, and exports them as a
+    dictionary or as Prometheus text-format counters. Instrumentation is process-local: work done in process-pool
+    workers is not collected.
+
+    Inputs:
+        - syllable_counter (SyllableCounter, optional): The syllable memo whose hit rate to report. Defaults to the shared `default_syllable_counter`.
+
+    Example:
+        with Instrumentation() as instrumentation:
+            calculate_all_readability_metrics(texts)
+        print(instrumentation.to_dict())
+    '''
+
+    def __init__(self, syllable_counter = None):
+        if syllable_counter is None:
+            from whetstone.utils.text.syllable_counter import default_syllable_counter
+            syllable_counter = default_syllable_counter
+        self.syllable_counter = syllable_counter
+        self.stage_seconds: Dict[str, float] = {}
+        self.stage_calls: Dict[str, int] = {}
+        self.texts = 0
+        self.words = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+        self._start: Optional[float] = None
+        self._cache_start = None
+        self._cache_end = None
+
+
+    def on_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+            self.stage_calls[stage] = self.stage_calls.get(stage, 0) + 1
+
+
+    def on_counts(self, texts: int, words: int) -> None:
+        with self._lock:
+            self.texts += texts
+            self.words += words
+
+
+    def __enter__(self) -> 'Instrumentation':
+        self._cache_start = self.syllable_counter.cache_info()
+        self._cache_end = None
+        self._start = perf_counter()
+        add_collector(self)
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        remove_collector(self)
+        self.elapsed += perf_counter() - self._start
+        self._start = None
+        self._cache_end = self.syllable_counter.cache_info()
+
+
+    def _cache_delta(self) -> Dict[str, int]:
+        # Syllable memo activity since entering the context
+        if self._cache_start is None:
+            return {'hits': 0, 'misses': 0}
+        end = self._cache_end or self.syllable_counter.cache_info()
+        return {key: end[key] - self._cache_start[key] for key in ('hits', 'misses')}
+
+
+    def to_dict(self) -> dict:
+        '''
+        Exports the collected statistics.
+
+        Returns:
+            - statistics (dict): Per-stage seconds and calls, texts and words processed, throughput, and syllable memo hit rate.
+        '''
+        elapsed = self.elapsed + (perf_counter() - self._start if self._start is not None else 0.0)
+        cache = self._cache_delta()
+        lookups = cache['hits'] + cache['misses']
+        return {
+            'elapsed_seconds': elapsed,
+            'stages': {stage: {'seconds': seconds, 'calls': self.stage_calls[stage]} for stage, seconds in self.stage_seconds.items()},
+            'texts': self.texts,
+            'words': self.words,
+            'texts_per_second': self.texts / elapsed if elapsed else 0.0,
+            'words_per_second': self.words / elapsed if elapsed else 0.0,
+            'syllable_cache_hits': cache['hits'],
+            'syllable_cache_misses': cache['misses'],
+            'syllable_cache_hit_rate': cache['hits'] / lookups if lookups else 0.0
+        }
+
+
+    def to_prometheus(self, prefix: str = 'whetstone') -> str:
+        '''
+        Exports the collected statistics as Prometheus text-format counters.
+
+        Inputs:
+            - prefix (str): The metric name prefix. Defaults to 'whetstone'.
+
+        Returns:
+            - exposition (str): The counters in the Prometheus text exposition format.
+        '''
+        statistics = self.to_dict()
+        lines = [f'# TYPE {prefix}_stage_seconds_total counter']
+        lines += [f'{prefix}_stage_seconds_total{{stage="{stage}"}} {values["seconds"]}' for stage, values in statistics['stages'].items()]
+        lines.append(f'# TYPE {prefix}_stage_calls_total counter')
+        lines += [f'{prefix}_stage_calls_total{{stage="{stage}"}} {values["calls"]}' for stage, values in statistics['stages'].items()]
+        for name in ('texts', 'words', 'syllable_cache_hits', 'syllable_cache_misses'):
+            lines.append(f'# TYPE {prefix}_{name}_total counter')
+            lines.append(f'{prefix}_{name}_total {statistics[name]}')
+        return '\n'.join(lines) + '\n'
+
+__all__ = ['Instrumentation', 'add_collector', 'remove_collector', 'register_callback', 'unregister_callback',
+           'record_stage', 'record_counts']
@@ -0,0 +1,166 @@
+import os
+import math
+import atexit
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+
+# Below this many items per worker, the cost of pickling chunks outweighs the parallel speedup
+MIN_ITEMS_PER_WORKER = 64
+
+# Number of chunks handed to each worker so that uneven chunks still balance across the pool
+CHUNKS_PER_WORKER = 4
+
+# Smallest micro-batch streaming callers pull at once, whatever the number of workers
+MIN_BATCH_SIZE = 1_000
+
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pool_workers: Dict[int, int] = {}
+_process_pools_lock = threading.Lock()
+
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    '''
+    Resolves an `n_jobs` argument into a concrete number of workers.
+
+    Inputs:
+        - n_jobs (int, optional): The requested number of workers. `None` or `1` means serial execution, and `-1` uses every CPU.
+
+    Returns:
+        - num_workers (int): The number of workers to use, always at least 1.
+    '''
+    if n_jobs is None:
+        return 1
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f'Invalid n_jobs: {n_jobs}. n_jobs must be a positive number of workers, -1 for every CPU, or None.')
+    return n_jobs
+
+
+
+def _executor_workers(executor: Optional[Executor], n_jobs: Optional[int]) -> int:
+    '''
+    Looks up the number of workers behind an executor.
+
+    Inputs:
+        - executor (Executor, optional): The executor work will be submitted to.
+        - n_jobs (int, optional): The requested number of workers, used for executors not started by `get_process_pool`.
+
+    Returns:
+        - num_workers (int): The worker count recorded when the shared pool was started, or the resolved `n_jobs`.
+    '''
+    if executor is not None:
+        with _process_pools_lock:
+            num_workers = _process_pool_workers.get(id(executor))
+        if num_workers is not None:
+            return num_workers
+    return resolve_n_jobs(n_jobs)
+
+
+
+def default_batch_size(n_jobs: Optional[int] = 1, executor: Optional[Executor] = None) -> int:
+    '''
+    Picks a micro-batch size large enough for `map_in_chunks` to keep every worker busy.
+
+    Inputs:
+        - n_jobs (int, optional): The requested number of workers. Defaults to 1.
+        - executor (Executor, optional): The executor the batches will be submitted to. A shared pool's worker count takes precedence;
+          for any other executor, pass its number of workers as `n_jobs`.
+
+    Returns:
+        - batch_size (int): At least `MIN_BATCH_SIZE`, and at least `CHUNKS_PER_WORKER` full chunks per worker.
+    '''
+    num_workers = _executor_workers(executor, n_jobs)
+    return max(MIN_BATCH_SIZE, num_workers * MIN_ITEMS_PER_WORKER * CHUNKS_PER_WORKER)
+
+
+
+def get_process_pool(num_workers: int) -> ProcessPoolExecutor:
+    '''
+    Returns a process pool with the given number of workers, starting it on first use.
+
+    Pools are cached and reused across calls so that worker startup is only paid once per process,
+    and are shut down automatically when the interpreter exits.
+
+    Inputs:
+        - num_workers (int): The number of worker processes.
+
+    Returns:
+        - pool (ProcessPoolExecutor): The shared process pool.
+    '''
+    with _process_pools_lock:
+        pool = _process_pools.get(num_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers = num_workers)
+            _process_pools[num_workers] = pool
+            _process_pool_workers[id(pool)] = num_workers
+        return pool
+
+
+
+def shutdown_process_pools() -> None:
+    '''
+    Shuts down every cached process pool.
+    '''
+    with _process_pools_lock:
+        for pool in _process_pools.values():
+            pool.shutdown(wait = True, cancel_futures = True)
+        _process_pools.clear()
+        _process_pool_workers.clear()
+
+atexit.register(shutdown_process_pools)
+
+
+
+def map_in_chunks(func: Callable[[List], List],
+                  items: Sequence,
+                  n_jobs: Optional[int] = 1,
+                  executor: Optional[Executor] = None,
+                  chunk_size: Optional[int] = None) -> List:
+    '''
+    Applies a chunk-level function over a sequence, optionally fanning the chunks out over a pool.
+
+    The function is called with consecutive slices of `items` and must return one result per item.
+    Results are concatenated back in input order. When there are too few items to keep every worker busy,
+    the chunks are spread over fewer workers, and only a batch too small for a second worker runs serially.
+
+    Inputs:
+        - func (callable): A picklable, module-level function mapping a list of items to a list of results.
+        - items (sequence): The items to process.
+        - n_jobs (int, optional): The number of worker processes. Defaults to 1 (serial). `-1` uses every CPU.
+        - executor (Executor, optional): An executor to submit chunks to instead of the shared process pool.
+          Unless it came from `get_process_pool`, chunks are sized for `n_jobs` workers.
+        - chunk_size (int, optional): The number of items per chunk. Defaults to a size that gives each worker several chunks.
+
+    Returns:
+        - results (list): The concatenated results, in the same order as `items`.
+    '''
+    items = list(items)
+    num_workers = _executor_workers(executor, n_jobs)
+
+    # Only spreading the chunks over as many workers as have enough items to be worth shipping
+    num_busy_workers = min(num_workers, max(math.ceil(len(items) / MIN_ITEMS_PER_WORKER), 1))
+
+    # Running serially when there is no pool to use or too little work for more than one worker
+    if executor is None and num_busy_workers == 1:
+        return func(items)
+    if not items:
+        return []
+
+    if chunk_size is None:
+        chunk_size = max(math.ceil(len(items) / (num_busy_workers * CHUNKS_PER_WORKER)), 1)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    if executor is None:
+        executor = get_process_pool(num_workers)
+
+    results = []
+    for chunk_results in executor.map(func, chunks):
+        results.extend(chunk_results)
+    return results
+
+__all__ = ['resolve_n_jobs', 'default_batch_size', 'get_process_pool', 'shutdown_process_pools', 'map_in_chunks']
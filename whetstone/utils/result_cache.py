@@ -0,0 +1,260 @@
+import hashlib
+import json
+import importlib.util
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+
+
+# Modules whose source determines every score; editing any of them changes the default cache version
+VERSIONED_MODULES = (
+    'whetstone.utils.text.text_parsers',
+    'whetstone.utils.text.lexicon',
+    'whetstone.utils.text.syllable_counter',
+    'whetstone.utils.text.text_stats',
+    'whetstone.metrics.text.readability_metrics'
+)
+
+# SQLite allows at most 999 bound parameters per statement on older builds
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB NOT NULL,
+    version TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (key, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_created ON results (created);
+'''
+
+
+
+@lru_cache(maxsize = None)
+def default_cache_version() -> str:
+    '''
+    Derives a cache version tag from the source of the modules that compute the scores.
+
+    Any edit to the tokenizers, the syllable counter and lexicon format, the counting engine, or the formulas
+    produces a new tag, so results cached by an older implementation are never returned.
+
+    Returns:
+        - version (str): A short hexadecimal digest of the versioned module sources.
+    '''
+    digest = hashlib.blake2b(digest_size = 8)
+    for module in VERSIONED_MODULES:
+        spec = importlib.util.find_spec(module)
+        with open(spec.origin, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+
+def text_key(text: str) -> bytes:
+    '''
+    Computes the content address of a text.
+
+    Inputs:
+        - text (str): The text.
+
+    Returns:
+        - key (bytes): A 16-byte BLAKE2b digest of the UTF-8 encoded text.
+    '''
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size = 16).digest()
+
+
+
+def _lexicon_cache_version() -> str:
+    # Extending the default version with the lexicon the default syllable counter currently uses, since its
+    # pronunciations and easy-word lists change the scores without any source change
+    from whetstone.utils.text.syllable_counter import default_syllable_counter
+    lexicon = default_syllable_counter.lexicon
+    return default_cache_version() if lexicon is None else f'{default_cache_version()}-{lexicon.checksum}'
+
+
+
+class ResultCache:
+    '''
+    Persistent content-addressed cache of per-text metric results, backed by SQLite.
+
+    Results are stored one row per (text hash, version) holding a JSON object of metric values. Storing a result for
+    a text that is already cached merges the new metrics into its row, so requests for different subsets of metrics
+    share entries. Lookups and inserts are batched into a handful of statements per call. Entries written under any
+    other version tag are ignored, and purged when the cache is opened, so changing the formulas invalidates the
+    cache automatically. Eviction removes the oldest entries first, by age and/or by total size.
+
+    Inputs:
+        - path (str): The SQLite database file. Defaults to ':memory:' (a cache that lives as long as the object).
+        - version (str, optional): The version tag results are stored under. Defaults to `default_cache_version()`,
+          extended with the checksum of the lexicon attached to the default syllable counter at the time of each call,
+          so attaching a different lexicon never returns results scored with the previous one.
+        - max_entries (int, optional): The maximum number of texts stored under the current version; the oldest are evicted beyond it.
+          Entries kept from other versions with `purge_stale = False` do not count towards it.
+        - max_age_seconds (float, optional): The maximum age of a stored value before it is evicted.
+        - purge_stale (bool): Whether to delete entries from other versions when opening. Defaults to True.
+    '''
+
+    def __init__(self,
+                 path: str = ':memory:',
+                 version: Optional[str] = None,
+                 max_entries: Optional[int] = None,
+                 max_age_seconds: Optional[float] = None,
+                 purge_stale: bool = True):
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError('max_entries must be a positive integer')
+        if max_age_seconds is not None and max_age_seconds <= 0:
+            raise ValueError('max_age_seconds must be positive')
+        self.path = path
+        self._version = version
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread = False, isolation_level = None)
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.executescript(_SCHEMA)
+        if purge_stale:
+            with self._lock:
+                self._connection.execute('DELETE FROM results WHERE version != ?', (self.version,))
+        self.evict()
+
+
+    @property
+    def version(self) -> str:
+        '''
+        The version tag results are currently read and stored under.
+        '''
+        return self._version if self._version is not None else _lexicon_cache_version()
+
+
+    def get_many(self, texts: Sequence[str], metrics: Sequence[str]) -> List[Optional[dict]]:
+        '''
+        Looks up the results for many texts at once.
+
+        Inputs:
+            - texts (sequence[str]): The texts.
+            - metrics (sequence[str]): The metrics every result must contain.
+
+        Returns:
+            - results (list[dict or None]): For each text, a dictionary of the requested metrics in order, or None
+              if any of them is not cached.
+        '''
+        keys = [text_key(text) for text in texts]
+        metrics = list(metrics)
+        version = self.version
+        found: Dict[bytes, dict] = {}
+        cutoff = time.time() - self.max_age_seconds if self.max_age_seconds is not None else None
+
+        with self._lock:
+            unique_keys = list(dict.fromkeys(keys))
+            for start in range(0, len(unique_keys), _LOOKUP_CHUNK):
+                chunk = unique_keys[start:start + _LOOKUP_CHUNK]
+                query = f"SELECT key, metrics, created FROM results WHERE version = ? AND key IN ({','.join('?' * len(chunk))})"
+                for key, values, created in self._connection.execute(query, [version, *chunk]):
+                    if cutoff is None or created > cutoff:
+                        found[key] = json.loads(values)
+
+        results = []
+        for key in keys:
+            values = found.get(key)
+            try:
+                results.append({metric: values[metric] for metric in metrics} if values is not None else None)
+            except KeyError:
+                results.append(None)
+        hits = sum(result is not None for result in results)
+        self.hits += hits
+        self.misses += len(results) - hits
+        return results
+
+
+    def put_many(self, texts: Sequence[str], results: Sequence[dict]) -> None:
+        '''
+        Stores the results for many texts in one transaction, then applies eviction.
+
+        Inputs:
+            - texts (sequence[str]): The texts.
+            - results (sequence[dict]): A dictionary of metric values for each text.
+        '''
+        now = time.time()
+        version = self.version
+        rows = [(text_key(text), version, json.dumps(result), now) for text, result in zip(texts, results)]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                # Dropping expired rows first, so that merging into a row keeps its original age rather than renewing it
+                if self.max_age_seconds is not None:
+                    self._connection.execute('DELETE FROM results WHERE created <= ?', (now - self.max_age_seconds,))
+                self._connection.executemany('INSERT INTO results VALUES (?, ?, ?, ?) ON CONFLICT (key, version) DO UPDATE '
+                                             'SET metrics = json_patch(metrics, excluded.metrics), '
+                                             'created = MIN(created, excluded.created)', rows)
+                self._connection.execute('COMMIT')
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+        if self.max_entries is not None:
+            self.evict()
+
+
+    def evict(self) -> int:
+        '''
+        Deletes entries of any version older than `max_age_seconds`, then the oldest entries of the current version beyond `max_entries`.
+
+        Returns:
+            - removed (int): The number of texts deleted.
+        '''
+        removed = 0
+        with self._lock:
+            if self.max_age_seconds is not None:
+                cursor = self._connection.execute('DELETE FROM results WHERE created <= ?', (time.time() - self.max_age_seconds,))
+                removed += cursor.rowcount
+            if self.max_entries is not None:
+                version = self.version
+                excess = self._connection.execute('SELECT COUNT(*) FROM results WHERE version = ?', (version,)).fetchone()[0] - self.max_entries
+                if excess > 0:
+                    cursor = self._connection.execute(
+                        'DELETE FROM results WHERE version = ? AND key IN (SELECT key FROM results WHERE version = ? ORDER BY created LIMIT ?)',
+                        (version, version, excess))
+                    removed += cursor.rowcount
+        return removed
+
+
+    def clear(self) -> None:
+        '''
+        Deletes every entry and resets the hit and miss counters.
+        '''
+        with self._lock:
+            self._connection.execute('DELETE FROM results')
+        self.hits = 0
+        self.misses = 0
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM results WHERE version = ?', (self.version,)).fetchone()[0]
+
+
+    def close(self) -> None:
+        '''
+        Closes the database connection.
+        '''
+        with self._lock:
+            self._connection.close()
+
+
+    def __enter__(self) -> 'ResultCache':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+__all__ = ['VERSIONED_MODULES', 'ResultCache', 'default_cache_version', 'text_key']
@@ -1 +1,5 @@
-from .text_parsers import *
\ No newline at end of file
+from .text_parsers import *
+from .lexicon import *
+from .syllable_counter import *
+from .text_stats import *
+from .corpus_reader import *
\ No newline at end of file
@@ -0,0 +1,281 @@
+import os
+import json
+import mmap
+import math
+import struct
+from array import array
+from typing import Iterator, List, Optional, Tuple, Union
+
+
+
+# Header written in front of a persisted offset index: magic, file size, file modification time, and the
+# format and blank-line rule the offsets were built with, since the same file indexes differently under each
+_INDEX_MAGIC = b'WSIDX002'
+_INDEX_HEADER = struct.Struct('<8sqq8s?')
+
+CORPUS_FORMATS = ('text', 'jsonl')
+
+_WHITESPACE = frozenset(b' \t\r\n\x0b\x0c')
+
+
+
+class CorpusReader:
+    '''
+    Memory-mapped reader for newline-delimited text and JSONL corpora.
+
+    The file is memory-mapped rather than read into memory, and an index of record start offsets is built
+    with a single scan (or loaded from a persisted `.idx` file when one exists and matches the corpus). Records
+    can then be accessed randomly, iterated from any position to resume an interrupted job, or split into
+    record and byte ranges for parallel workers, each of which can open its own reader over the same file.
+
+    In 'text' format every line is a record, including empty lines. In 'jsonl' format blank lines are skipped
+    and each record is parsed as JSON.
+
+    Inputs:
+        - path (str or PathLike): The path to the corpus file.
+        - format (str, optional): 'text' or 'jsonl'. Defaults to inferring from the file extension ('.jsonl' or '.ndjson' is JSONL).
+        - text_field (str, optional): For JSONL corpora, the field to return from each record. Defaults to returning the parsed dictionary.
+        - index_path (str or PathLike, optional): Where to persist the offset index. Defaults to `path + '.idx'`.
+        - persist_index (bool): Whether to load and save the offset index on disk. Defaults to True.
+        - encoding (str): The text encoding of the corpus. Defaults to 'utf-8'.
+    '''
+
+    def __init__(self,
+                 path: Union[str, os.PathLike],
+                 format: Optional[str] = None,
+                 text_field: Optional[str] = None,
+                 index_path: Optional[Union[str, os.PathLike]] = None,
+                 persist_index: bool = True,
+                 encoding: str = 'utf-8'):
+        path = os.fspath(path)
+        if format is None:
+            format = 'jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'text'
+        if format not in CORPUS_FORMATS:
+            raise ValueError(f"format must be one of {CORPUS_FORMATS}, got {format!r}")
+
+        self.path = path
+        self.format = format
+        self.text_field = text_field
+        self.encoding = encoding
+        self.index_path = os.fspath(index_path) if index_path else path + '.idx'
+        self._skip_blank = format == 'jsonl'
+
+        # Memory-mapping the file, which cannot be done for an empty file
+        self._file = open(path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self._size = stat.st_size
+        self._mtime_ns = stat.st_mtime_ns
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ) if self._size else None
+
+        self._offsets = self._load_index() if persist_index else None
+        if self._offsets is None:
+            self._offsets = self._build_index()
+            if persist_index:
+                self._save_index()
+
+
+    def _build_index(self) -> array:
+        # Scanning the mapped file once for newlines, recording where each record starts
+        offsets = array('q')
+        if self._mmap is None:
+            return offsets
+
+        mm = self._mmap
+        skip_blank = self._skip_blank
+        position = 0
+        while position < self._size:
+            end = mm.find(b'\n', position)
+            if end == -1:
+                end = self._size
+            # Checking the first byte first so that only lines starting with whitespace are copied to test for blanks
+            if not skip_blank or (end > position and mm[position] not in _WHITESPACE) or mm[position:end].strip():
+                offsets.append(position)
+            position = end + 1
+        return offsets
+
+
+    def _load_index(self) -> Optional[array]:
+        # Loading a persisted index only if it was built from this exact version of the file, with the same options
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) != _INDEX_HEADER.size:
+                    return None
+                magic, size, mtime_ns, format, skip_blank = _INDEX_HEADER.unpack(header)
+                if magic != _INDEX_MAGIC or size != self._size or mtime_ns != self._mtime_ns:
+                    return None
+                if format.rstrip(b'\0') != self.format.encode('ascii') or skip_blank != self._skip_blank:
+                    return None
+                offsets = array('q')
+                offsets.frombytes(f.read())
+                return offsets
+        except (OSError, ValueError):
+            return None
+
+
+    def _save_index(self) -> None:
+        # Persisting is best effort, since the corpus may live on a read-only volume
+        try:
+            with open(self.index_path, 'wb') as f:
+                f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, self._size, self._mtime_ns, self.format.encode('ascii'), self._skip_blank))
+                self._offsets.tofile(f)
+        except OSError:
+            pass
+
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += len(self._offsets)
+        if not 0 <= index < len(self._offsets):
+            raise IndexError('record index out of range')
+        return self._parse(self.raw(index))
+
+
+    def __iter__(self) -> Iterator:
+        return self.iter_records()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+    def close(self) -> None:
+        '''
+        Closes the memory map and the underlying file.
+        '''
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+
+    def raw(self, index: int) -> bytes:
+        '''
+        Returns the raw bytes of a record, without the trailing newline.
+
+        Inputs:
+            - index (int): The record index.
+
+        Returns:
+            - record (bytes): The record's bytes.
+        '''
+        start = self._offsets[index]
+        end = self._mmap.find(b'\n', start)
+        if end == -1:
+            end = self._size
+        return self._mmap[start:end]
+
+
+    def _parse(self, raw: bytes):
+        # Decoding a raw record into a string (text) or a parsed JSON value (JSONL)
+        text = raw.decode(self.encoding).rstrip('\r')
+        if self.format == 'text':
+            return text
+        record = json.loads(text)
+        if self.text_field is not None:
+            return record[self.text_field]
+        return record
+
+
+    def iter_records(self, start: int = 0, stop: Optional[int] = None) -> Iterator:
+        '''
+        Iterates over the records in a range, which makes it cheap to resume a job from a checkpoint.
+
+        Inputs:
+            - start (int): The index of the first record. Defaults to 0.
+            - stop (int, optional): The index one past the last record. Defaults to the end of the corpus.
+
+        Returns:
+            - records (iterator): An iterator over the parsed records.
+        '''
+        stop = len(self._offsets) if stop is None else min(stop, len(self._offsets))
+        for index in range(start, stop):
+            yield self._parse(self.raw(index))
+
+
+    def byte_range(self, start: int, stop: int) -> Tuple[int, int]:
+        '''
+        Returns the span of bytes holding a range of records.
+
+        Inputs:
+            - start (int): The index of the first record.
+            - stop (int): The index one past the last record.
+
+        Returns:
+            - byte_range (tuple[int, int]): The start (inclusive) and end (exclusive) byte offsets.
+        '''
+        if start >= stop:
+            offset = self._offsets[start] if start < len(self._offsets) else self._size
+            return offset, offset
+        end = self._offsets[stop] if stop < len(self._offsets) else self._size
+        return self._offsets[start], end
+
+
+    def shards(self, num_shards: int) -> List[Tuple[int, int]]:
+        '''
+        Splits the corpus into contiguous record ranges of near-equal size for parallel workers.
+
+        Inputs:
+            - num_shards (int): The number of shards.
+
+        Returns:
+            - shards (list[tuple[int, int]]): The (start, stop) record range of each non-empty shard.
+        '''
+        if num_shards <= 0:
+            raise ValueError('num_shards must be a positive integer')
+        shard_size = max(math.ceil(len(self._offsets) / num_shards), 1)
+        return [(start, min(start + shard_size, len(self._offsets))) for start in range(0, len(self._offsets), shard_size)]
+
+
+
+def iter_byte_range(path: Union[str, os.PathLike],
+                    start: int,
+                    end: int,
+                    format: Optional[str] = None,
+                    text_field: Optional[str] = None,
+                    encoding: str = 'utf-8') -> Iterator[Union[str, dict]]:
+    '''
+    Iterates over the records in a byte range of a corpus without building an index, for use inside workers.
+
+    The range must begin at a record boundary, as returned by `CorpusReader.byte_range`.
+
+    Inputs:
+        - path (str or PathLike): The path to the corpus file.
+        - start (int): The start byte offset (inclusive).
+        - end (int): The end byte offset (exclusive).
+        - format (str, optional): 'text' or 'jsonl'. Defaults to inferring from the file extension.
+        - text_field (str, optional): For JSONL corpora, the field to return from each record.
+        - encoding (str): The text encoding of the corpus. Defaults to 'utf-8'.
+
+    Returns:
+        - records (iterator): An iterator over the parsed records in the range.
+    '''
+    path = os.fspath(path)
+    if format is None:
+        format = 'jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'text'
+    if start >= end:
+        return
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+        position = start
+        while position < end:
+            line_end = mm.find(b'\n', position, end)
+            if line_end == -1:
+                line_end = end
+            line = mm[position:line_end].decode(encoding).rstrip('\r')
+            position = line_end + 1
+            if format == 'text':
+                yield line
+            elif line.strip():
+                record = json.loads(line)
+                yield record[text_field] if text_field is not None else record
+
+__all__ = ['CORPUS_FORMATS', 'CorpusReader', 'iter_byte_range']
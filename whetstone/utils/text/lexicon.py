@@ -0,0 +1,284 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Iterable, Mapping, Optional
+from whetstone.utils.text.text_parsers import count_syllables
+
+
+
+# File layout, all little-endian:
+#   header: magic, format version, number of words, number of hash slots, size of the string pool, content checksum
+#   offsets: uint32 * (num_words + 1) into the string pool, words sorted by their UTF-8 bytes
+#   syllables: uint8 * num_words (0 when the word has no known pronunciation)
+#   flags: uint8 * num_words, padded to a multiple of 4 bytes
+#   slots: uint32 * num_slots open-addressing hash table of word index + 1 (0 marks an empty slot)
+#   strings: the lowercased UTF-8 words, concatenated
+_LEXICON_MAGIC = b'WSLX'
+_LEXICON_FORMAT_VERSION = 1
+_LEXICON_HEADER = struct.Struct('<4sIIII8s')
+
+DALE_CHALL_EASY = 1
+SPACHE_EASY = 2
+
+
+
+def _pad4(size: int) -> int:
+    return (size + 3) & ~3
+
+
+
+def build_lexicon(path: str,
+                  syllables: Optional[Mapping[str, int]] = None,
+                  dale_chall_words: Iterable[str] = (),
+                  spache_words: Iterable[str] = ()) -> 'Lexicon':
+    '''
+    Writes a compact binary lexicon of syllable counts and easy-word flags, and opens it.
+
+    Inputs:
+        - path (str): The file to write.
+        - syllables (mapping[str, int], optional): The syllable count of each word, for example from `load_cmudict_syllables`.
+        - dale_chall_words (iterable[str]): The Dale-Chall list of familiar words.
+        - spache_words (iterable[str]): The Spache list of familiar words.
+
+    Returns:
+        - lexicon (Lexicon): The memory-mapped lexicon.
+    '''
+    entries: Dict[bytes, list] = {}
+    for word, count in (syllables or {}).items():
+        if not 0 <= count <= 255:
+            raise ValueError(f'Syllable count for {word!r} must be between 0 and 255')
+        entries.setdefault(word.lower().encode('utf-8'), [0, 0])[0] = count
+    for flag, words in ((DALE_CHALL_EASY, dale_chall_words), (SPACHE_EASY, spache_words)):
+        for word in words:
+            word = word.strip()
+            if word:
+                entries.setdefault(word.lower().encode('utf-8'), [0, 0])[1] |= flag
+
+    keys = sorted(entries)
+    num_slots = 1
+    while num_slots < 2 * len(keys):
+        num_slots *= 2
+
+    # Laying out the sorted words and hashing each into the first free slot after its CRC-32
+    offsets = array('I', [0])
+    for key in keys:
+        offsets.append(offsets[-1] + len(key))
+    syllable_counts = bytes(entries[key][0] for key in keys)
+    flags = bytes(entries[key][1] for key in keys)
+    slots = array('I', bytes(4 * num_slots))
+    mask = num_slots - 1
+    for index, key in enumerate(keys):
+        slot = zlib.crc32(key) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+        slots.byteswap()
+
+    strings = b''.join(keys)
+    body = b''.join([offsets.tobytes(), syllable_counts, flags, bytes(_pad4(2 * len(keys)) - 2 * len(keys)), slots.tobytes(), strings])
+    checksum = hashlib.blake2b(body, digest_size = 8).digest()
+    header = _LEXICON_HEADER.pack(_LEXICON_MAGIC, _LEXICON_FORMAT_VERSION, len(keys), num_slots, len(strings), checksum)
+
+    # Writing to a temporary file first so that processes holding the old lexicon open never see a partial file
+    temporary_path = f'{path}.tmp'
+    with open(temporary_path, 'wb') as file:
+        file.write(header)
+        file.write(body)
+    os.replace(temporary_path, path)
+    return Lexicon(path)
+
+
+
+def load_cmudict_syllables(path: str, encoding: str = 'latin-1') -> Dict[str, int]:
+    '''
+    Reads syllable counts from a CMU Pronouncing Dictionary file.
+
+    Each pronunciation's syllables are its stressed phonemes (those ending in a digit). Only the first
+    pronunciation of a word is kept.
+
+    Inputs:
+        - path (str): The cmudict file, with lines such as `HELLO  HH AH0 L OW1`.
+        - encoding (str): The file encoding. Defaults to 'latin-1'.
+
+    Returns:
+        - syllables (dict[str, int]): The lowercased words and their syllable counts.
+    '''
+    syllables = {}
+    with open(path, encoding = encoding) as file:
+        for line in file:
+            if not line.strip() or line.startswith(';;;'):
+                continue
+            word, *phonemes = line.split()
+            word = word.split('(')[0].lower()
+            if word not in syllables:
+                syllables[word] = sum(phoneme[-1].isdigit() for phoneme in phonemes)
+    return syllables
+
+
+
+class Lexicon:
+    '''
+    Read-only, memory-mapped lexicon of syllable counts and Dale-Chall/Spache easy-word flags.
+
+    The file is mapped rather than read, so every process that opens the same lexicon shares one copy of it through
+    the operating system's page cache. Words are found with one CRC-32 hash and, typically, a single probe of the
+    open-addressing table stored in the file. Words missing from the lexicon fall back to the `count_syllables`
+    heuristic. Lexicons are written with `build_lexicon`, and pickle as their path so they can be sent to process
+    pool workers cheaply.
+
+    Inputs:
+        - path (str): The lexicon file.
+    '''
+
+    def __init__(self, path: str):
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        magic, format_version, num_words, num_slots, strings_size, checksum = _LEXICON_HEADER.unpack_from(self._mmap)
+        if magic != _LEXICON_MAGIC:
+            raise ValueError(f'{self.path} is not a whetstone lexicon')
+        if format_version != _LEXICON_FORMAT_VERSION:
+            raise ValueError(f'Unsupported lexicon format version {format_version}')
+        self.num_words = num_words
+        self.checksum = checksum.hex()
+
+        # Viewing each section of the mapping in place, without copying it
+        view = memoryview(self._mmap)
+        position = _LEXICON_HEADER.size
+        self._offsets = view[position:position + 4 * (num_words + 1)].cast('I')
+        position += 4 * (num_words + 1)
+        self._syllables = view[position:position + num_words]
+        self._flags = view[position + num_words:position + 2 * num_words]
+        position += _pad4(2 * num_words)
+        self._slots = view[position:position + 4 * num_slots].cast('I')
+        position += 4 * num_slots
+        self._strings_start = position
+        self._mask = num_slots - 1
+        if sys.byteorder != 'little':
+            self._offsets = array('I', self._offsets.tobytes())
+            self._offsets.byteswap()
+            self._slots = array('I', self._slots.tobytes())
+            self._slots.byteswap()
+
+
+    def _index(self, word: str) -> int:
+        # Probing the hash table from the word's CRC-32 until the word or an empty slot is found
+        key = word.lower().encode('utf-8')
+        slot = zlib.crc32(key) & self._mask
+        while True:
+            entry = self._slots[slot]
+            if not entry:
+                return -1
+            index = entry - 1
+            start = self._strings_start + self._offsets[index]
+            end = self._strings_start + self._offsets[index + 1]
+            if end - start == len(key) and self._mmap[start:end] == key:
+                return index
+            slot = (slot + 1) & self._mask
+
+
+    def __contains__(self, word: str) -> bool:
+        return self._index(word) >= 0
+
+
+    def __len__(self) -> int:
+        return self.num_words
+
+
+    def syllables(self, word: str) -> Optional[int]:
+        '''
+        Looks up the syllable count of a word.
+
+        Inputs:
+            - word (str): The word, in any case.
+
+        Returns:
+            - syllable_count (int or None): The number of syllables, or None if the lexicon has no pronunciation for the word.
+        '''
+        index = self._index(word)
+        if index < 0 or not self._syllables[index]:
+            return None
+        return self._syllables[index]
+
+
+    def count_syllables(self, word: str) -> int:
+        '''
+        Counts the syllables in a word, falling back to the `count_syllables` heuristic for unknown words.
+
+        Inputs:
+            - word (str): The word to count syllables for.
+
+        Returns:
+            - syllable_count (int): The number of syllables in the word.
+        '''
+        syllables = self.syllables(word)
+        return count_syllables(word) if syllables is None else syllables
+
+
+    def _flag(self, word: str, flag: int) -> bool:
+        index = self._index(word)
+        return index >= 0 and bool(self._flags[index] & flag)
+
+
+    def is_dale_chall_easy(self, word: str) -> bool:
+        '''
+        Checks whether a word is on the Dale-Chall list of familiar words.
+
+        Inputs:
+            - word (str): The word, in any case.
+
+        Returns:
+            - is_easy (bool): True if the word is on the list.
+        '''
+        return self._flag(word, DALE_CHALL_EASY)
+
+
+    def is_spache_easy(self, word: str) -> bool:
+        '''
+        Checks whether a word is on the Spache list of familiar words.
+
+        Inputs:
+            - word (str): The word, in any case.
+
+        Returns:
+            - is_easy (bool): True if the word is on the list.
+        '''
+        return self._flag(word, SPACHE_EASY)
+
+
+    @property
+    def has_dale_chall_words(self) -> bool:
+        # Whether any word carries the Dale-Chall flag, i.e. whether the lexicon can replace the 3+ syllable approximation
+        if not hasattr(self, '_has_dale_chall_words'):
+            self._has_dale_chall_words = any(flag & DALE_CHALL_EASY for flag in self._flags)
+        return self._has_dale_chall_words
+
+
+    def close(self) -> None:
+        '''
+        Unmaps the lexicon file.
+        '''
+        self._offsets = self._slots = self._syllables = self._flags = None
+        self._mmap.close()
+
+
+    def __enter__(self) -> 'Lexicon':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def __reduce__(self):
+        # Workers reopen (and so share) the mapping instead of receiving a copy of its contents
+        return (type(self), (self.path,))
+
+__all__ = ['DALE_CHALL_EASY', 'SPACHE_EASY', 'Lexicon', 'build_lexicon', 'load_cmudict_syllables']
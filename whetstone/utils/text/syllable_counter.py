@@ -0,0 +1,154 @@
+import os
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, Optional, Union
+from whetstone.utils.text.text_parsers import count_syllables
+from whetstone.utils.text.lexicon import Lexicon
+
+
+
+class SyllableCounter:
+    '''
+    Memoizing front end for `count_syllables`.
+
+    Words are aggregated into a frequency table so that syllables are computed once per distinct word,
+    and results are kept in a bounded least-recently-used (LRU) memo that persists across batches.
+    When a lexicon is attached, its pronunciations take precedence over the heuristic.
+
+    Inputs:
+        - maxsize (int): The maximum number of distinct words to keep in the memo. Defaults to 100,000.
+        - lexicon (Lexicon or str, optional): A lexicon, or the path of one, to look syllable counts and easy words up in.
+    '''
+
+    def __init__(self, maxsize: int = 100_000, lexicon: Optional[Union[Lexicon, str]] = None):
+        if maxsize <= 0:
+            raise ValueError('maxsize must be a positive integer')
+        self.maxsize = maxsize
+        self.lexicon = Lexicon(lexicon) if isinstance(lexicon, (str, os.PathLike)) else lexicon
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+
+    def _lookup(self, word: str) -> int:
+        # Assumes the caller holds the lock
+        syllables = self._memo.get(word)
+        if syllables is not None:
+            self._memo.move_to_end(word)
+            self._hits += 1
+            return syllables
+
+        syllables = count_syllables(word) if self.lexicon is None else self.lexicon.count_syllables(word)
+        self._misses += 1
+        self._memo[word] = syllables
+        if len(self._memo) > self.maxsize:
+            self._memo.popitem(last = False)
+            self._evictions += 1
+        return syllables
+
+
+    def count(self, word: str) -> int:
+        '''
+        Counts the syllables in a single word, using the memo when possible.
+
+        Inputs:
+            - word (str): The word to count syllables for.
+
+        Returns:
+            - syllable_count (int): The number of syllables in the word.
+        '''
+        with self._lock:
+            return self._lookup(word)
+
+
+    def count_frequencies(self, frequencies: Dict[str, int]) -> Dict[str, int]:
+        '''
+        Counts the syllables for every distinct word in a precomputed word frequency table.
+
+        Inputs:
+            - frequencies (dict[str, int]): A mapping of each distinct word to its number of occurrences.
+
+        Returns:
+            - syllable_counts (dict[str, int]): A mapping of each distinct word to its number of syllables.
+        '''
+        with self._lock:
+            return {word: self._lookup(word) for word in frequencies}
+
+
+    def count_words(self, words: Iterable[str]) -> Dict[str, int]:
+        '''
+        Aggregates a batch of words into a frequency table and counts syllables once per distinct word.
+
+        Inputs:
+            - words (iterable[str]): The words in the batch, including repeats.
+
+        Returns:
+            - syllable_counts (dict[str, int]): A mapping of each distinct word to its number of syllables.
+        '''
+        return self.count_frequencies(Counter(words))
+
+
+    def total_syllables(self, words: Iterable[str]) -> int:
+        '''
+        Counts the total number of syllables across a batch of words.
+
+        Inputs:
+            - words (iterable[str]): The words in the batch, including repeats.
+
+        Returns:
+            - num_syllables (int): The total number of syllables across all words.
+        '''
+        frequencies = Counter(words)
+        syllable_counts = self.count_frequencies(frequencies)
+        return sum(syllable_counts[word] * frequency for word, frequency in frequencies.items())
+
+
+    def set_lexicon(self, lexicon: Optional[Union[Lexicon, str]]) -> None:
+        '''
+        Attaches a different lexicon (or none), emptying the memo of counts made with the previous one.
+
+        Inputs:
+            - lexicon (Lexicon or str, optional): A lexicon, the path of one, or None to use only the heuristic.
+        '''
+        lexicon = Lexicon(lexicon) if isinstance(lexicon, (str, os.PathLike)) else lexicon
+        with self._lock:
+            self.lexicon = lexicon
+        self.cache_clear()
+
+
+    def cache_info(self) -> dict:
+        '''
+        Reports the memo statistics.
+
+        Returns:
+            - info (dict): The number of hits, misses, and evictions along with the current and maximum memo size.
+        '''
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'currsize': len(self._memo),
+                'maxsize': self.maxsize
+            }
+
+
+    def cache_clear(self) -> None:
+        '''
+        Empties the memo and resets its statistics.
+        '''
+        with self._lock:
+            self._memo.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+
+# Shared memo used by the readability metrics unless a caller supplies its own. Setting WHETSTONE_LEXICON to a
+# lexicon file attaches it here, including in process pool workers, which all map the same file.
+default_syllable_counter = SyllableCounter(lexicon = os.environ.get('WHETSTONE_LEXICON') or None)
+
+__all__ = ['SyllableCounter', 'default_syllable_counter']
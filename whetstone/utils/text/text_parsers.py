@@ -1,5 +1,6 @@
 import re
-import regex
+from functools import lru_cache
+from typing import List, NamedTuple
 
 
 def count_syllables(word):
@@ -70,12 +71,95 @@ def count_syllables(word):
 
 
 
-def tokenize_sentence(text):
+# Words are maximal runs of word characters, matching `\b\w+\b`
+WORD_PATTERN = re.compile(r'\w+')
+
+# The characters `regex` treats as `\s` (the Unicode White_Space property), which differ from `re` for \x1c-\x1f
+_WHITESPACE_CHARACTERS = '\t\n\x0b\x0c\r \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+
+# A sentence can only end at whitespace directly after a period or question mark
+_BOUNDARY_CANDIDATE_PATTERN = re.compile(f'[.?][{_WHITESPACE_CHARACTERS}]')
+
+SENTENCE_MODES = ('fused', 'regex')
+WORD_MODES = ('word', 'whitespace', 'lowercase')
+
+
+
+class TextScan(NamedTuple):
+    '''
+    Result of scanning a text with `scan_text`.
+
+    Fields:
+        - sentence_boundaries (list[int]): The offsets, in the stripped text, of the whitespace characters that end each sentence but the last.
+        - words (list[str]): The `\\b\\w+\\b` words of the text, in order.
+        - num_characters (int): The total number of characters across the words.
+    '''
+    sentence_boundaries: List[int]
+    words: List[str]
+    num_characters: int
+
+
+
+@lru_cache(maxsize = None)
+def _sentence_boundary_pattern():
+    # Importing `regex` (needed for the variable-width lookbehinds) and compiling the pattern on first use keeps package import fast
+    import regex
+    return regex.compile(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s')
+
+
+
+@lru_cache(maxsize = 4_096)
+def _is_unicode_word_character(char):
+    # `regex` and `re` disagree on `\w` outside ASCII (combining marks, superscripts, ...), so ask `regex` itself
+    import regex
+    return regex.match(r'\w', char) is not None
+
+
+
+def _is_word_character(char):
+    if char.isascii():
+        return char.isalnum() or char == '_'
+    return _is_unicode_word_character(char)
+
+
+
+def find_sentence_boundaries(text):
+    '''
+    Finds where `tokenize_sentence` splits an already stripped text, without running the lookbehind regex
+
+    Only whitespace directly after `.` or `?` can end a sentence, so those few candidates are found with one
+    linear scan and the two abbreviation lookbehinds (`e.g. ` style and `Mr. ` style) are checked on each in Python.
+
+    Inputs:
+        - text (str): The stripped text to scan
+
+    Returns:
+        - boundaries (list[int]): The offsets of the whitespace characters that end a sentence
+    '''
+    boundaries = []
+    for match in _BOUNDARY_CANDIDATE_PATTERN.finditer(text):
+        i = match.end() - 1
+
+        # Rejecting initialisms such as "e.g. " (`(?<!\w\.\w.)`)
+        if i >= 4 and text[i - 3] == '.' and _is_word_character(text[i - 4]) and _is_word_character(text[i - 2]):
+            continue
+
+        # Rejecting abbreviations such as "Mr. " (`(?<![A-Z][a-z]\.)`)
+        if i >= 3 and text[i - 1] == '.' and 'A' <= text[i - 3] <= 'Z' and 'a' <= text[i - 2] <= 'z':
+            continue
+        boundaries.append(i)
+    return boundaries
+
+
+
+def tokenize_sentence(text, mode = 'fused'):
     '''
     Tokenizes a text into sentences using a simple algorithm
 
     Inputs:
         - text (str): The text to tokenize into sentences
+        - mode (str): 'fused' (default) to split at the boundaries found by `find_sentence_boundaries`, or 'regex' to
+          run the original lookbehind regex split. Both return identical sentences.
 
     Returns:
         - sentences (list[str]): A list of sentences in the text
@@ -85,8 +169,63 @@ def tokenize_sentence(text):
     text = text.strip()
 
     # Splitting the text into sentences
-    sentences = regex.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s', text)
+    if mode == 'regex':
+        return _sentence_boundary_pattern().split(text)
+    if mode != 'fused':
+        raise ValueError(f"Unknown sentence mode {mode!r}. Available modes: {list(SENTENCE_MODES)}")
+
+    sentences = []
+    start = 0
+    for boundary in find_sentence_boundaries(text):
+        sentences.append(text[start:boundary])
+        start = boundary + 1
+    sentences.append(text[start:])
 
     return sentences
 
-__all__ = ['tokenize_sentence', 'count_syllables']
\ No newline at end of file
+
+
+def split_words(text, mode = 'word'):
+    '''
+    Splits a text into words using one of the tokenizations the readability formulas have historically used
+
+    Inputs:
+        - text (str): The text to split
+        - mode (str): 'word' (default) for `\\b\\w+\\b` words, 'whitespace' for whitespace-delimited tokens
+          (Flesch-Kincaid), or 'lowercase' for `\\b\\w+\\b` words of the lowercased text (Gunning Fog)
+
+    Returns:
+        - words (list[str]): The words in the text
+    '''
+    if mode == 'word':
+        return WORD_PATTERN.findall(text)
+    if mode == 'whitespace':
+        return text.split()
+    if mode == 'lowercase':
+        return WORD_PATTERN.findall(text.lower())
+    raise ValueError(f"Unknown word mode {mode!r}. Available modes: {list(WORD_MODES)}")
+
+
+
+def scan_text(text, sentences = True, words = True):
+    '''
+    Scans a text for its sentence boundaries, words, and word characters
+
+    This is two linear passes rather than one: the sentence boundary candidates and the words are each found
+    by a single compiled-regex scan over the text, which is faster than walking the characters in Python.
+    The word characters are then summed over the word list.
+
+    Inputs:
+        - text (str): The text to scan
+        - sentences (bool): Whether to find the sentence boundaries. Defaults to True.
+        - words (bool): Whether to split the words and count their characters. Defaults to True.
+
+    Returns:
+        - scan (TextScan): The sentence boundaries, words, and character count. Skipped parts are left empty.
+    '''
+    boundaries = find_sentence_boundaries(text.strip()) if sentences else []
+    word_list = WORD_PATTERN.findall(text) if words else []
+    return TextScan(boundaries, word_list, sum(map(len, word_list)))
+
+__all__ = ['SENTENCE_MODES', 'WORD_MODES', 'TextScan', 'find_sentence_boundaries', 'tokenize_sentence', 'split_words',
+           'scan_text', 'count_syllables']
\ No newline at end of file
@@ -0,0 +1,213 @@
+import re
+from collections import Counter
+from functools import lru_cache
+from time import perf_counter
+from typing import Iterable, NamedTuple, Optional
+from whetstone.utils import instrumentation
+from whetstone.utils.text.text_parsers import WORD_PATTERN, find_sentence_boundaries
+from whetstone.utils.text.syllable_counter import SyllableCounter, default_syllable_counter
+
+
+
+# Matching each non-blank piece of a split on terminal punctuation (`[.!?]+`), as counted by Gunning Fog
+_PUNCTUATION_SENTENCE_CONTENT_PATTERN = re.compile(r'[^.!?\s][^.!?]*')
+
+
+
+class TextStats(NamedTuple):
+    '''
+    Immutable record of the per-text counts that every readability formula is evaluated from.
+
+    The first six fields are the core counts built on `tokenize_sentence` and the `\\b\\w+\\b` word split.
+    The remaining fields preserve the tokenization that specific formulas have historically used
+    (whitespace words for Flesch-Kincaid, punctuation sentences and lowercased words for Gunning Fog)
+    so that scores computed from the record match the original per-function implementations.
+
+    Fields:
+        - num_sentences (int): Number of sentences returned by `tokenize_sentence`.
+        - num_words (int): Number of `\\b\\w+\\b` words.
+        - num_characters (int): Total number of characters across those words.
+        - num_syllables (int): Total number of syllables across those words.
+        - num_complex_words (int): Number of words with 3 or more syllables.
+        - num_long_words (int): Number of words longer than 6 characters.
+        - num_whitespace_words (int): Number of whitespace-delimited tokens (Flesch-Kincaid).
+        - num_whitespace_syllables (int): Total number of syllables across whitespace-delimited tokens (Flesch-Kincaid).
+        - num_punctuation_sentences (int): Number of non-empty sentences split on `.`, `!` and `?` (Gunning Fog).
+        - num_lowercase_words (int): Number of `\\b\\w+\\b` words in the lowercased text (Gunning Fog).
+        - num_lowercase_complex_words (int): Number of those lowercased words with 3 or more syllables (Gunning Fog).
+        - num_difficult_words (int): Number of words not on the Dale-Chall list of familiar words, when the syllable
+          counter's lexicon provides that list; otherwise `num_complex_words`, the historical approximation (Dale-Chall).
+    '''
+    num_sentences: int
+    num_words: int
+    num_characters: int
+    num_syllables: int
+    num_complex_words: int
+    num_long_words: int
+    num_whitespace_words: int
+    num_whitespace_syllables: int
+    num_punctuation_sentences: int
+    num_lowercase_words: int
+    num_lowercase_complex_words: int
+    num_difficult_words: int
+
+
+
+# Every TextStats field, the default set of fields computed by compute_text_stats
+ALL_TEXT_STATS_FIELDS = frozenset(TextStats._fields)
+
+
+
+class _ExtractionPlan(NamedTuple):
+    # Which extraction passes are needed to produce a set of TextStats fields
+    sentences: bool
+    words: bool
+    syllables: bool
+    whitespace_words: bool
+    whitespace_syllables: bool
+    punctuation_sentences: bool
+    lowercase_words: bool
+    lowercase_complex_words: bool
+
+
+
+@lru_cache(maxsize = None)
+def _extraction_plan(fields: frozenset) -> _ExtractionPlan:
+    unknown = fields - ALL_TEXT_STATS_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown TextStats field(s) {sorted(unknown)}. Available fields: {list(TextStats._fields)}")
+
+    # Lowercased counts reuse the regular word (and syllable) passes for ASCII text
+    lowercase_words = bool(fields & {'num_lowercase_words', 'num_lowercase_complex_words'})
+    lowercase_complex_words = 'num_lowercase_complex_words' in fields
+    return _ExtractionPlan(
+        sentences = 'num_sentences' in fields,
+        words = lowercase_words or bool(fields & {'num_words', 'num_characters', 'num_syllables', 'num_complex_words', 'num_long_words',
+                                                  'num_difficult_words'}),
+        syllables = lowercase_complex_words or bool(fields & {'num_syllables', 'num_complex_words', 'num_difficult_words'}),
+        whitespace_words = bool(fields & {'num_whitespace_words', 'num_whitespace_syllables'}),
+        whitespace_syllables = 'num_whitespace_syllables' in fields,
+        punctuation_sentences = 'num_punctuation_sentences' in fields,
+        lowercase_words = lowercase_words,
+        lowercase_complex_words = lowercase_complex_words
+    )
+
+
+
+def compute_text_stats(text: str,
+                       syllable_counter: Optional[SyllableCounter] = None,
+                       fields: Optional[Iterable[str]] = None) -> TextStats:
+    '''
+    Computes every count needed by the readability formulas for a single text in one pass.
+
+    When `fields` is given, only the extraction passes those fields depend on are run (for example, no syllables
+    are counted unless a syllable-based field is requested). Fields that were not requested are left at 0.
+
+    Inputs:
+        - text (str): The text to analyze.
+        - syllable_counter (SyllableCounter, optional): The syllable memo to use. Defaults to the shared `default_syllable_counter`.
+        - fields (iterable[str], optional): The TextStats fields to compute. Defaults to every field.
+
+    Returns:
+        - stats (TextStats): The immutable record of counts for the text.
+    '''
+    if syllable_counter is None:
+        syllable_counter = default_syllable_counter
+    plan = _extraction_plan(ALL_TEXT_STATS_FIELDS if fields is None else frozenset(fields))
+
+    # Timing each stage only when instrumentation is enabled
+    timed = instrumentation.enabled
+    if timed:
+        start = perf_counter()
+
+    # Finding the sentence boundaries of the stripped text
+    num_sentences = len(find_sentence_boundaries(text.strip())) + 1 if plan.sentences else 0
+    if timed:
+        start = instrumentation.record_stage('tokenize_sentence', start)
+
+    # Splitting the words and whitespace tokens
+    words = WORD_PATTERN.findall(text) if plan.words else []
+    whitespace_words = text.split() if plan.whitespace_words else []
+
+    # Aggregating the words into frequency tables so each distinct word is only measured once
+    word_frequencies = Counter(words)
+    whitespace_frequencies = Counter(whitespace_words) if plan.whitespace_syllables else {}
+    if timed:
+        start = instrumentation.record_stage('word_split', start)
+    syllable_counts = syllable_counter.count_frequencies(word_frequencies) if plan.syllables else None
+    whitespace_syllable_counts = syllable_counter.count_frequencies(whitespace_frequencies) if plan.whitespace_syllables else None
+    if timed:
+        start = instrumentation.record_stage('count_syllables', start)
+
+    # Counting syllables, complex words, and long words in a single walk over the distinct words
+    num_syllables = 0
+    num_complex_words = 0
+    num_long_words = 0
+    if syllable_counts is not None:
+        for word, frequency in word_frequencies.items():
+            syllables = syllable_counts[word]
+            num_syllables += syllables * frequency
+            if syllables >= 3:
+                num_complex_words += frequency
+            if len(word) > 6:
+                num_long_words += frequency
+    else:
+        for word, frequency in word_frequencies.items():
+            if len(word) > 6:
+                num_long_words += frequency
+
+    # Counting the words missing from the Dale-Chall list, or approximating them as complex words without one
+    num_difficult_words = num_complex_words
+    lexicon = syllable_counter.lexicon
+    if syllable_counts is not None and lexicon is not None and lexicon.has_dale_chall_words:
+        num_difficult_words = sum(frequency for word, frequency in word_frequencies.items() if not lexicon.is_dale_chall_easy(word))
+
+    # Counting syllables across the whitespace-delimited tokens
+    num_whitespace_syllables = 0
+    if whitespace_syllable_counts is not None:
+        num_whitespace_syllables = sum(whitespace_syllable_counts[word] * frequency for word, frequency in whitespace_frequencies.items())
+
+    # Counting the non-blank pieces of a split on terminal punctuation, without building the pieces
+    num_punctuation_sentences = 0
+    if plan.punctuation_sentences:
+        num_punctuation_sentences = len(_PUNCTUATION_SENTENCE_CONTENT_PATTERN.findall(text))
+
+    # Lowercasing only changes the word split for non-ASCII text, so the counts are reused otherwise
+    num_lowercase_words = 0
+    num_lowercase_complex_words = 0
+    if plan.lowercase_words:
+        if text.isascii():
+            num_lowercase_words = len(words)
+            num_lowercase_complex_words = num_complex_words
+        else:
+            # No non-word character lowercases to a word character, so rescanning each distinct word is
+            # equivalent to rescanning the lowercased text
+            lowercase_frequencies = Counter()
+            for word, frequency in word_frequencies.items():
+                for lowercase_word in WORD_PATTERN.findall(word.lower()):
+                    lowercase_frequencies[lowercase_word] += frequency
+            num_lowercase_words = sum(lowercase_frequencies.values())
+            if plan.lowercase_complex_words:
+                lowercase_syllable_counts = syllable_counter.count_frequencies(lowercase_frequencies)
+                num_lowercase_complex_words = sum(frequency for word, frequency in lowercase_frequencies.items() if lowercase_syllable_counts[word] >= 3)
+
+    if timed:
+        instrumentation.record_stage('aggregate_counts', start)
+        instrumentation.record_counts(1, len(words))
+
+    return TextStats(
+        num_sentences = num_sentences,
+        num_words = len(words),
+        num_characters = sum(map(len, words)),
+        num_syllables = num_syllables,
+        num_complex_words = num_complex_words,
+        num_long_words = num_long_words,
+        num_whitespace_words = len(whitespace_words),
+        num_whitespace_syllables = num_whitespace_syllables,
+        num_punctuation_sentences = num_punctuation_sentences,
+        num_lowercase_words = num_lowercase_words,
+        num_lowercase_complex_words = num_lowercase_complex_words,
+        num_difficult_words = num_difficult_words
+    )
+
+__all__ = ['TextStats', 'ALL_TEXT_STATS_FIELDS', 'compute_text_stats']
\ No newline at end of file